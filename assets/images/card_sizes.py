@@ -0,0 +1,136 @@
+"""
+Builds display-sized copies of the card scans in cards_wikipedia/.
+
+The scans are 1144x1919 JPEGs (about 850 KB each), but the player never
+shows a card wider than 280 CSS px: 144 px in spreads, 100-180 px in
+readings, 280 px in the card drawer. This writes each card at the widths
+in WIDTHS, as AVIF, WebP and JPEG, to cards_wikipedia/sized/:
+
+    cards_wikipedia/sized/c01-240.avif
+
+The player finds them through its asset manifest at startup and gives
+the browser a srcset of every size and format, so it downloads the
+smallest one that covers the slot at the screen's pixel density. Cards
+without sized copies keep using the scan.
+
+Files newer than their scan are kept, so re-running only converts what
+changed. Prints what every card and every UI slot saves:
+
+    python assets/images/card_sizes.py
+"""
+
+import os
+import sys
+from pathlib import Path
+
+from PIL import Image
+
+from pixelate import to_rgb
+
+# ========================= CONFIGURATION =========================
+INPUT_FOLDER = Path(__file__).resolve().parent / "cards_wikipedia"
+OUTPUT_FOLDER = INPUT_FOLDER / "sized"
+
+# Covers every slot at 1x and 2x: 100-180 px readings and the 144 px spread
+# fit 160/240 at 1x and 240/360 at 2x, the 280 px drawer 360 and 560
+WIDTHS = (160, 240, 360, 560)
+
+# Extension -> Pillow save options. Qualities are matched by eye on the
+# busiest cards (the court cards' fabric patterns)
+FORMATS = {
+    "avif": {"quality": 55},
+    "webp": {"quality": 80, "method": 6},
+    "jpg": {"quality": 82, "optimize": True, "progressive": True},
+}
+
+# Width each UI slot is drawn at, in CSS px, for the report
+SLOTS = {
+    "reading, small card": 100,
+    "reading, medium card": 140,
+    "spread card": 144,
+    "reading, large card": 180,
+    "card drawer": 280,
+}
+# =================================================================
+
+
+def sized_path(scan: Path, width: int, extension: str) -> Path:
+    """Where the copy of a scan at one width and format goes."""
+    return OUTPUT_FOLDER / f"{scan.stem}-{width}.{extension}"
+
+
+def build_card(scan: Path) -> dict[tuple[int, str], int]:
+    """Write a scan's missing or stale sized copies; return (width, format) -> bytes."""
+    scan_mtime = scan.stat().st_mtime_ns
+    sizes: dict[tuple[int, str], int] = {}
+    with Image.open(scan) as img:
+        rgb = None
+        for width in WIDTHS:
+            if width >= img.width:
+                continue  # Never upscale; the scan itself is the largest size
+            for extension, options in FORMATS.items():
+                output_path = sized_path(scan, width, extension)
+                if not output_path.exists() or output_path.stat().st_mtime_ns < scan_mtime:
+                    if rgb is None:
+                        rgb = to_rgb(img)
+                    height = round(img.height * width / img.width)
+                    resized = rgb.resize((width, height), resample=Image.LANCZOS)
+                    resized.save(output_path, **options)
+                sizes[width, extension] = output_path.stat().st_size
+    return sizes
+
+
+def pick(sizes: dict[tuple[int, str], int], css_width: int, density: int, extension: str) -> int:
+    """Bytes of the copy a browser takes from the srcset for a slot (the scan's if none fits)."""
+    for width in WIDTHS:
+        if width >= css_width * density and (width, extension) in sizes:
+            return sizes[width, extension]
+    return 0
+
+
+def report(cards: dict[str, tuple[int, dict[tuple[int, str], int]]]) -> None:
+    """Print per-card and per-slot savings."""
+    print(f"\n{'card':<6} {'scan':>8}   " + "  ".join(f"{w:>4}px avif/webp/jpg" for w in WIDTHS))
+    for name, (scan_size, sizes) in cards.items():
+        columns = [
+            "/".join(f"{sizes.get((w, ext), 0) // 1024:>3}" for ext in FORMATS).rjust(19)
+            for w in WIDTHS
+        ]
+        print(f"{name:<6} {scan_size // 1024:>5} KB   " + "  ".join(columns) + "  (KB)")
+
+    count = max(len(cards), 1)
+    scans = sum(scan_size for scan_size, _ in cards.values())
+    print(f"\nAverage scan: {scans / count / 1024:.0f} KB. Average bytes per card shown:")
+    for slot, css_width in SLOTS.items():
+        cells = []
+        for density in (1, 2):
+            for extension in ("avif", "jpg"):
+                chosen = sum(
+                    pick(sizes, css_width, density, extension) or scan_size
+                    for scan_size, sizes in cards.values()
+                )
+                cells.append(f"{density}x {extension} {chosen / count / 1024:5.1f} KB ({scans / chosen:4.0f}x)")
+        print(f"  {slot + f' ({css_width} px):':<32} " + "   ".join(cells))
+
+    built = sum(sum(sizes.values()) for _, sizes in cards.values())
+    print(f"\nScans: {scans / 1024 / 1024:.1f} MB; all sized copies: {built / 1024 / 1024:.1f} MB")
+
+
+def main():
+    if not INPUT_FOLDER.is_dir():
+        print(f"{INPUT_FOLDER} not found")
+        sys.exit(1)
+    os.makedirs(OUTPUT_FOLDER, exist_ok=True)
+
+    cards = {}
+    for scan in sorted(INPUT_FOLDER.glob("*.jpg")):
+        try:
+            cards[scan.stem] = (scan.stat().st_size, build_card(scan))
+        except Exception as e:
+            print(f"✗ Error with {scan.name}: {e}")
+    print(f"Sized {len(cards)} cards into {OUTPUT_FOLDER}")
+    report(cards)
+
+
+if __name__ == "__main__":
+    main()
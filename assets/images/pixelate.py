@@ -35,6 +35,18 @@ def pixel_artify(
     return pixelated
 
 
+def to_rgb(img: Image.Image) -> Image.Image:
+    """Convert a card scan to RGB (handles RGBA cards safely)."""
+    if img.mode in ("RGBA", "LA", "P"):
+        # Preserve any transparency as white background (most tarot scans don't need it)
+        background = Image.new("RGB", img.size, (255, 255, 255))
+        if img.mode == "P":
+            img = img.convert("RGBA")
+        background.paste(img, mask=img.split()[-1] if img.mode == "RGBA" else None)
+        return background
+    return img.convert("RGB")
+
+
 # ========================= CONFIGURATION =========================
 INPUT_FOLDER = "cards"  # ← put your 78 original images here
 OUTPUT_FOLDER = "pixel_cards"  # ← results will go here
@@ -43,39 +55,32 @@ PIXEL_SIZE = 4  # Lower = finer pixel art, higher = chunkier (try 3–8)
 NUM_COLORS = 28  # More colors = richer detail on Rider-Waite cards (16–32)
 # =================================================================
 
-os.makedirs(OUTPUT_FOLDER, exist_ok=True)
-
-print("Starting pixel-art conversion of 78 Rider-Waite cards...\n")
-
-for filename in os.listdir(INPUT_FOLDER):
-    if filename.lower().endswith((".png", ".jpg", ".jpeg", ".webp")):
-        input_path = os.path.join(INPUT_FOLDER, filename)
-        base_name = os.path.splitext(filename)[0]
-        output_path = os.path.join(OUTPUT_FOLDER, f"{base_name}.png")
-
-        try:
-            with Image.open(input_path) as img:
-                # Convert to RGB (handles RGBA cards safely)
-                if img.mode in ("RGBA", "LA", "P"):
-                    # Preserve any transparency as white background (most tarot scans don't need it)
-                    background = Image.new("RGB", img.size, (255, 255, 255))
-                    if img.mode == "P":
-                        img = img.convert("RGBA")
-                    background.paste(
-                        img, mask=img.split()[-1] if img.mode == "RGBA" else None
+
+def main():
+    os.makedirs(OUTPUT_FOLDER, exist_ok=True)
+
+    print("Starting pixel-art conversion of 78 Rider-Waite cards...\n")
+
+    for filename in os.listdir(INPUT_FOLDER):
+        if filename.lower().endswith((".png", ".jpg", ".jpeg", ".webp")):
+            input_path = os.path.join(INPUT_FOLDER, filename)
+            base_name = os.path.splitext(filename)[0]
+            output_path = os.path.join(OUTPUT_FOLDER, f"{base_name}.png")
+
+            try:
+                with Image.open(input_path) as img:
+                    pixel_card = pixel_artify(
+                        to_rgb(img), pixel_size=PIXEL_SIZE, num_colors=NUM_COLORS
                     )
-                    img = background
-                else:
-                    img = img.convert("RGB")
+                    pixel_card.save(output_path, optimize=True)
+
+                print(f"✓ {filename}")
 
-                pixel_card = pixel_artify(
-                    img, pixel_size=PIXEL_SIZE, num_colors=NUM_COLORS
-                )
-                pixel_card.save(output_path, optimize=True)
+            except Exception as e:
+                print(f"✗ Error with {filename}: {e}")
 
-            print(f"✓ {filename}")
+    print("\nAll done! Check the 'pixel_cards' folder.")
 
-        except Exception as e:
-            print(f"✗ Error with {filename}: {e}")
 
-print("\nAll done! Check the 'pixel_cards' folder.")
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Benchmark: reading card faces, fragment cache vs building them per render.
+
+_render_single_card used to build every card face (SVG frame and
+illustration, or the image markup, plus the reversal style) each time a
+reading was shown. CARD_FRAGMENTS now returns them from a process-wide
+LRU keyed by card, orientation, width, card style and SVG instance.
+
+Draws seeded readings and shows each one the way a session does: once
+when drawn, again on the next choice, then through a card style toggle
+to classic and back. Reports the time per card face with and without the
+cache, and the cache's hit rate, for each showing.
+
+Run from the repo root:
+    python benchmarks/bench_card_fragments.py
+"""
+
+import contextlib
+import io
+import random
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(PROJECT_ROOT / "player"))
+
+with contextlib.redirect_stdout(io.StringIO()):
+    from card_fragments import CARD_FRAGMENTS, _build_fragment  # noqa: E402
+    from game_logic.tarot import Reading  # noqa: E402
+
+SPREADS = ("past-present-future", "celtic-cross")
+READINGS = 200
+# Card style on each showing of a reading
+SHOWINGS = ("arcanum", "arcanum", "classic", "arcanum")
+CARD_WIDTHS = {"large": 180, "medium": 140, "small": 100}  # As _render_reading
+
+
+def _faces(readings: list[Reading], style: str) -> list[tuple]:
+    """Every (card, width, style, instance) one showing of the readings renders."""
+    faces = []
+    for reading in readings:
+        width = CARD_WIDTHS.get(reading.spread.card_size, 140)
+        for index, card_data in enumerate(reading.get_positioned_cards()):
+            faces.append((card_data["card"], width, style, f"p{index}"))
+    return faces
+
+
+def _time(render, faces: list[tuple]) -> float:
+    start = time.perf_counter()
+    for face in faces:
+        render(*face)
+    return time.perf_counter() - start
+
+
+def _build(card, width: int, style: str, instance: str):
+    return _build_fragment(card, card.reversed, width, style, instance)
+
+
+def main():
+    rng = random.Random(0)
+    readings = []
+    for i in range(READINGS):
+        reading = Reading(SPREADS[i % len(SPREADS)])
+        reading.draw_cards(rng=rng)
+        readings.append(reading)
+
+    CARD_FRAGMENTS.clear()
+    print(f"{READINGS} readings ({', '.join(SPREADS)}), each shown as: {' -> '.join(SHOWINGS)}")
+    for showing, style in enumerate(SHOWINGS, 1):
+        faces = _faces(readings, style)
+        uncached = _time(_build, faces)
+        before = CARD_FRAGMENTS.stats()
+        cached = _time(CARD_FRAGMENTS.render, faces)
+        hits = CARD_FRAGMENTS.hits - before["hits"]
+        print(
+            f"  showing {showing} ({style + '):':<8} built {uncached / len(faces) * 1e6:5.2f} us/card, "
+            f"cache {cached / len(faces) * 1e6:5.2f} us/card, {hits / len(faces):6.1%} hits"
+        )
+
+    stats = CARD_FRAGMENTS.stats()
+    print(
+        f"  overall: {stats['hits']:,} hits / {stats['misses']:,} misses ({stats['hit_rate']:.1%} hits), "
+        f"{stats['entries']:,} entries, {stats['evictions']:,} evictions"
+    )
+
+
+if __name__ == "__main__":
+    main()
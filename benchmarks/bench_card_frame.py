@@ -0,0 +1,106 @@
+"""Benchmark: card frame bytes, shared corner symbol vs inline corners.
+
+render_svg_card_html used to wrap every illustration in a frame that
+spelled out the four corner ornaments as separate <svg>s with the same
+paths, indented as in the standalone card files. The frame now <use>s one
+<symbol> that inject_card_symbols() adds to every page once.
+
+Renders every card that has an SVG through the old frame and the new one
+and reports the HTML per card, and as sent over the websocket (the
+string JSON-encoded inside the ui.html element update), for a 10-card
+spread (a Celtic Cross) and the deck gallery on the debug page (the
+cards with SVGs; the rest are images either way).
+
+Run from the repo root:
+    python benchmarks/bench_card_frame.py
+"""
+
+import json
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(PROJECT_ROOT / "player"))
+
+from card_renderer import (  # noqa: E402
+    CARD_FRAME_BOTTOM,
+    CARD_SYMBOLS,
+    SVG_CARDS,
+    render_svg_card_html,
+)
+from game_logic.tarot import CARD_SPECS  # noqa: E402
+
+SPREAD_SIZE = 10
+
+# The old frame, verbatim
+_LEGACY_CORNER = """\
+    <path d="M0 40 L0 12 Q0 0 12 0 L40 0" stroke="var(--card-border)" stroke-width="1" fill="none" opacity="0.5"/>
+    <circle cx="10" cy="10" r="2.5" stroke="var(--card-border)" stroke-width="0.5" fill="none" opacity="0.4"/>
+    <circle cx="10" cy="10" r="1" fill="var(--card-border)" opacity="0.3"/>
+  </svg>
+"""
+_LEGACY_FRAME_TOP = (
+    """\
+<div class="card-frame size-game" style="width:100%; height:100%;">
+  <div class="border-outer"></div>
+  <div class="border-inner"></div>
+"""
+    + "".join(
+        f'  <svg class="corner corner-{corner}" viewBox="0 0 40 40" fill="none">\n' + _LEGACY_CORNER
+        for corner in ("tl", "tr", "bl", "br")
+    )
+    + """\
+  <div class="card-number">{number}</div>
+  <div class="card-name">{name}</div>
+  <div class="illustration">
+"""
+)
+_LEGACY_FRAME_BOTTOM = """\
+  </div>
+</div>
+"""
+
+
+def _legacy_html(card) -> str:
+    """The old render_svg_card_html output for a card."""
+    html = render_svg_card_html(card, card.code)
+    number, name = html.split('<div class="card-number">', 1)[1].split("</div>", 2)[:2]
+    name = name.split('<div class="card-name">', 1)[1]
+    illustration = html.split('<div class="illustration">', 1)[1][: -len(CARD_FRAME_BOTTOM)]
+    return _LEGACY_FRAME_TOP.format(number=number, name=name) + illustration + _LEGACY_FRAME_BOTTOM
+
+
+def _sizes(htmls: list[str]) -> tuple[int, int]:
+    """Total HTML bytes, and bytes as JSON strings in an element update."""
+    return (
+        sum(len(html.encode("utf-8")) for html in htmls),
+        sum(len(json.dumps(html).encode("utf-8")) for html in htmls),
+    )
+
+
+def main():
+    cards = [spec for spec in CARD_SPECS if spec.code in SVG_CARDS]
+    layouts = {
+        f"{SPREAD_SIZE}-card spread": cards[:SPREAD_SIZE],
+        f"deck gallery ({len(cards)} SVG cards)": cards,
+    }
+    print(f"{len(cards)} cards with SVGs; shared symbols: {len(CARD_SYMBOLS)} bytes once per page")
+    for label, layout in layouts.items():
+        old_html, old_wire = _sizes([_legacy_html(card) for card in layout])
+        new_html, new_wire = _sizes([render_svg_card_html(card, card.code) for card in layout])
+        n = len(layout)
+        print(f"  {label}:")
+        print(
+            f"    inline corners: {old_html / n:7.0f} B/card HTML, {old_wire / n:7.0f} B/card sent, "
+            f"{old_wire / 1024:6.1f} KiB total"
+        )
+        print(
+            f"    shared symbol:  {new_html / n:7.0f} B/card HTML, {new_wire / n:7.0f} B/card sent, "
+            f"{new_wire / 1024:6.1f} KiB total"
+        )
+        print(f"    frame saves {(old_wire - new_wire) / n:.0f} B/card ({1 - new_wire / old_wire:.0%})")
+
+
+if __name__ == "__main__":
+    main()
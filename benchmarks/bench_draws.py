@@ -0,0 +1,60 @@
+"""Benchmark: Reading.draw_cards exclusion, bitmask vs the old list filtering.
+
+The old draw_cards rebuilt every position's deck as
+[c for c in deck.cards if c not in drawn], a list scan per card per
+position that also shrank the caller's Deck objects. Draws now skip
+already-drawn cards through a bitmask of spec indexes.
+
+Run from the repo root:
+    python benchmarks/bench_draws.py
+"""
+
+import random
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from game_logic.tarot import Deck, Reading  # noqa: E402
+
+
+def _legacy_draw(reading: Reading) -> list:
+    """The old Reading.draw_cards body."""
+    for p in range(len(reading.spread.positions)):
+        if not reading.allow_repeats:
+            drawn_specs = [c.spec for c in reading.drawn_cards]
+            reading.decks[p].cards = [
+                c for c in reading.decks[p].cards if c not in drawn_specs
+            ]
+            if not reading.decks[p].cards:
+                raise Exception(f"No cards available for position {p}")
+        card = reading.decks[p].draw_card()
+        card.in_position(reading.spread.positions[p].get("name"))
+        reading.drawn_cards.append(card)
+    return reading.drawn_cards
+
+
+def main():
+    random.seed(0)
+    n = 2000
+    for spread_id in ("past-present-future", "celtic-cross"):
+        positions = len(Reading(spread_id).spread.positions)
+
+        # Decks are built outside the timed draw; only drawing is compared
+        legacy = [Reading(spread_id) for _ in range(n)]
+        current = [Reading(spread_id) for _ in range(n)]
+        legacy_us = timeit.timeit(lambda: _legacy_draw(legacy.pop()), number=n) / n * 1e6
+        current_us = timeit.timeit(lambda: current.pop().draw_cards(), number=n) / n * 1e6
+
+        print(f"{spread_id} ({positions} positions, full decks)")
+        print(f"  list filtering: {legacy_us:8.1f} us/reading")
+        print(f"  bitmask:        {current_us:8.1f} us/reading ({legacy_us / current_us:.1f}x)")
+
+    deck = Deck()
+    Reading("celtic-cross", decks=[deck] * 10).draw_cards()
+    print(f"Shared deck after a Celtic Cross draw: {len(deck.cards)} cards (untouched)")
+
+
+if __name__ == "__main__":
+    main()
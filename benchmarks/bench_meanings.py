@@ -0,0 +1,135 @@
+"""Benchmark: meaning pack and MeaningStore vs the old per-file lookups.
+
+The old path opened assets/text/card_meanings/<code>.json the first time
+each Card asked for its meaning, then walked the dotted rag_mapping through
+the nested dict on every call. Restored cards (Card.from_save_dict) started
+with an empty cache and read the file again.
+
+MeaningStore parses all_cards.json into per-process dicts; MeaningPack
+memory-maps meanings.pack and decodes only the fields a lookup returns,
+reading a reading's fields at fixed offsets.
+
+Run from the repo root:
+    python benchmarks/bench_meanings.py
+"""
+
+import json
+import sys
+import timeit
+import tracemalloc
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from game_logic.meanings import PACK_PATH, MeaningPack, MeaningStore, build_meaning_pack  # noqa: E402
+from game_logic.tarot import ALL_CARDS, SPREAD_DEFS, Reading  # noqa: E402
+
+
+def _legacy_position_meaning(code: str, rag_mapping: str, reversed: bool) -> str:
+    """The old Card.get_meaning_data + get_position_meaning, uncached."""
+    with open(PROJECT_ROOT / "assets" / "text" / "card_meanings" / f"{code}.json") as f:
+        data = json.load(f)
+
+    meaning = data["position_interpretations"]
+    for part in rag_mapping.split("."):
+        if not isinstance(meaning, dict):
+            return ""
+        meaning = meaning.get(part, {})
+    if not isinstance(meaning, dict):
+        return ""
+    return meaning.get("reversed" if reversed else "upright", "")
+
+
+def _load(factory):
+    """Time a store load and measure the Python heap it leaves behind."""
+    tracemalloc.start()
+    start = timeit.default_timer()
+    store = factory()
+    elapsed_ms = (timeit.default_timer() - start) * 1000
+    heap_kb = tracemalloc.get_traced_memory()[0] / 1024
+    tracemalloc.stop()
+    return store, elapsed_ms, heap_kb
+
+
+def _check_equivalence(store) -> int:
+    """Every card x spread position x orientation must match the old path."""
+    mappings = {
+        pos["rag_mapping"]
+        for spread in SPREAD_DEFS.values()
+        for pos in spread.positions
+        if pos.get("rag_mapping")
+    }
+    checked = 0
+    for spec in ALL_CARDS:
+        for rag_mapping in mappings:
+            for reversed in (False, True):
+                old = _legacy_position_meaning(spec.code, rag_mapping, reversed)
+                new = store.position_meaning(spec.code, rag_mapping, reversed)
+                assert old == new, (spec.code, rag_mapping, reversed)
+                checked += 1
+    return checked
+
+
+def _check_pack_matches_store(pack, store) -> int:
+    """The pack's other per-card lookups must return what the store does."""
+    contexts = {
+        context for code in store.codes() for context in store.card_data(code).get("question_contexts", {})
+    }
+    checked = 0
+    for code in store.codes():
+        assert pack.card_relationships(code) == store.card_relationships(code), code
+        for reversed in (False, True):
+            assert pack.core_meaning(code, reversed) == store.core_meaning(code, reversed), code
+            for context in contexts:
+                assert pack.question_context(code, context, reversed) == store.question_context(
+                    code, context, reversed
+                ), (code, context, reversed)
+                checked += 1
+    return checked
+
+
+def main():
+    if not PACK_PATH.exists():
+        build_meaning_pack()
+
+    store, load_ms, heap_kb = _load(MeaningStore.from_file)
+    print(f"MeaningStore load (all_cards.json): {load_ms:7.1f} ms, {heap_kb:8.0f} KiB heap per process")
+    pack, load_ms, heap_kb = _load(MeaningPack)
+    print(f"MeaningPack load (meanings.pack):   {load_ms:7.1f} ms, {heap_kb:8.0f} KiB heap per process")
+    print(f"  ({PACK_PATH.stat().st_size / 1024:.0f} KiB pack mapped read-only, shared via the page cache)")
+
+    for name, s in (("MeaningStore", store), ("MeaningPack", pack)):
+        checked = _check_equivalence(s)
+        print(f"{name} equivalent to per-file lookups for {checked} card/position/orientation combos")
+    checked = _check_pack_matches_store(pack, store)
+    print(f"MeaningPack core meanings, relationships and {checked} question contexts match MeaningStore")
+
+    reading = Reading("celtic-cross")
+    reading.draw_cards()
+    cards = reading.drawn_cards
+    positions = reading.spread.positions
+
+    def legacy_reading():
+        # A restored reading: every card reads its own file again
+        for card, pos in zip(cards, positions):
+            _legacy_position_meaning(card.code, pos["rag_mapping"], card.reversed)
+
+    def store_reading(s):
+        for card, pos in zip(cards, positions):
+            s.position_meaning(card.code, pos["rag_mapping"], card.reversed)
+            s.core_meaning(card.code, card.reversed)
+
+    n = 200
+    legacy_us = timeit.timeit(legacy_reading, number=n) / n * 1e6
+    print(f"Celtic Cross meanings, per-file path: {legacy_us:10.1f} us/reading")
+    for name, s in (("MeaningStore", store), ("MeaningPack", pack)):
+        us = timeit.timeit(lambda: store_reading(s), number=n * 20) / (n * 20) * 1e6
+        print(f"Celtic Cross meanings, {name + ':':13} {us:10.1f} us/reading ({legacy_us / us:.0f}x)")
+
+    full_us = timeit.timeit(reading.get_positioned_cards, number=n * 10) / (n * 10) * 1e6
+    print(f"Reading.get_positioned_cards (Celtic Cross): {full_us:.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""Benchmark: swapping the passage content vs rebuilding the player screen.
+
+Every choice used to clear the whole player screen and rebuild it:
+sidebar motif SVG, navigation, stats, both toggles and the bottom
+actions, before the passage itself. show_player now keeps the layout
+mounted and replaces only the content region.
+
+Walks the same seeded paths through the story in a NiceGUI client with no
+browser attached, once forcing the old full rebuild on every choice and
+once with the content swap. After each choice the client's pending
+element updates and messages are encoded the way its outbox sends them,
+and the benchmark reports per choice: websocket messages and bytes (the
+JSON payloads, before socket.io framing), server time (the choice
+handler building elements, plus encoding) and how many NiceGUI elements
+the client holds afterwards.
+
+Compile the story first (see README), then run from the repo root:
+    python benchmarks/bench_player_ui.py [compiled_stories/arcanum.json]
+"""
+
+import asyncio
+import contextlib
+import io
+import random
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(PROJECT_ROOT / "player"))
+
+from nicegui import Client, core  # noqa: E402
+from nicegui import json as nicegui_json  # noqa: E402
+from nicegui.outbox import Deleted  # noqa: E402
+from nicegui.page import page  # noqa: E402
+
+with contextlib.redirect_stdout(io.StringIO()):
+    from nicegui_player import GameSession  # noqa: E402
+
+SEEDS = range(8)
+STEPS = 60
+
+
+def _flush(client: Client) -> tuple[int, int, float]:
+    """Encode and drop the client's pending output; return messages, bytes, seconds."""
+    outbox = client.outbox
+    start = time.perf_counter()
+    # As Outbox.loop builds the "update" message, then the queued ones
+    payloads = [
+        {
+            element_id: None if isinstance(element, Deleted) else element._to_dict()
+            for element_id, element in outbox.updates.items()
+        }
+    ] if outbox.updates else []
+    payloads += [data for _, _, data in outbox.messages]
+    size = sum(len(nicegui_json.dumps(data).encode("utf-8")) for data in payloads)
+    elapsed = time.perf_counter() - start
+    outbox.updates.clear()
+    outbox.messages.clear()
+    return len(payloads), size, elapsed
+
+
+async def _settle() -> None:
+    # ui.run_javascript enqueues its message from a background task
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+
+async def _walk(story_path: Path, seed: int, full_rebuild: bool) -> dict:
+    client = Client(page("/"))
+    with client:
+        session = GameSession()
+        session.build()
+        session.load_story(story_path, seed=seed)
+        session.navigate_to("player")
+    await _settle()
+    _flush(client)
+
+    rng = random.Random(seed)
+    walk = {
+        "choices": 0, "messages": 0, "bytes": 0, "build_s": 0.0, "encode_s": 0.0,
+        "elements": 0, "trace": [],
+    }
+    for _ in range(STEPS):
+        output = session.engine.current()
+        walk["trace"].append(session.engine.current_passage_id)
+        if not output.choices:
+            break
+        if full_rebuild:
+            session.player_layout = None  # What every choice used to do
+        start = time.perf_counter()
+        try:
+            with client:
+                session.make_choice(rng.randrange(len(output.choices)))
+        except RuntimeError:
+            break  # Story bug on this path; the trace records where
+        walk["build_s"] += time.perf_counter() - start
+        await _settle()
+        messages, size, encode_s = _flush(client)
+        walk["messages"] += messages
+        walk["bytes"] += size
+        walk["encode_s"] += encode_s
+        walk["elements"] += len(client.elements)
+        walk["choices"] += 1
+
+    client.delete()
+    return walk
+
+
+async def _run(story_path: Path, full_rebuild: bool) -> tuple[dict, list]:
+    core.loop = asyncio.get_running_loop()  # As the server sets it on startup
+    totals = {"choices": 0, "messages": 0, "bytes": 0, "build_s": 0.0, "encode_s": 0.0, "elements": 0}
+    traces = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for seed in SEEDS:
+            walk = await _walk(story_path, seed, full_rebuild)
+            traces.append(walk.pop("trace"))
+            for key in totals:
+                totals[key] += walk[key]
+    return totals, traces
+
+
+def _per_choice(totals: dict) -> tuple[float, float, float, float, float]:
+    n = max(totals["choices"], 1)
+    return (
+        totals["elements"] / n,
+        totals["messages"] / n,
+        totals["bytes"] / n,
+        totals["build_s"] / n * 1000,
+        totals["encode_s"] / n * 1000,
+    )
+
+
+def main():
+    story_path = Path(
+        sys.argv[1] if len(sys.argv) > 1 else PROJECT_ROOT / "compiled_stories" / "arcanum.json"
+    )
+    if not story_path.exists():
+        print(f"{story_path} not found; compile the story first (see README)")
+        sys.exit(1)
+
+    asyncio.run(_run(story_path, full_rebuild=False))  # Warm story, code and Markdown caches
+    before, before_traces = asyncio.run(_run(story_path, full_rebuild=True))
+    after, after_traces = asyncio.run(_run(story_path, full_rebuild=False))
+
+    print(f"{len(SEEDS)} seeded walks, up to {STEPS} choices each ({after['choices']} choices)")
+    results = {}
+    for label, totals in (("full rebuild", before), ("content swap", after)):
+        elements, messages, size, build_ms, encode_ms = results[label] = _per_choice(totals)
+        print(
+            f"  {label + ':':<14} {messages:4.2f} msgs, {size / 1024:6.1f} KiB/choice, "
+            f"{build_ms:5.2f} ms build + {encode_ms:5.2f} ms encode, {elements:5.1f} elements"
+        )
+    (*_, old_size, old_build, old_encode), (*_, new_size, new_build, new_encode) = results.values()
+    print(
+        f"  {old_size / new_size:.1f}x fewer bytes, "
+        f"{(old_build + old_encode) / (new_build + new_encode):.1f}x less server time"
+    )
+    print(f"  same passages visited: {before_traces == after_traces}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Benchmark: NumPy reading simulator vs looping over Reading objects.
+
+Each scenario draws the same spread and decks both ways. It checks that
+the two agree on per-position card frequencies, and times them per
+reading.
+
+Run from the repo root:
+    python benchmarks/bench_simulator.py
+"""
+
+import random
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from game_logic.simulator import simulate_readings  # noqa: E402
+from game_logic.tarot import Deck, Reading  # noqa: E402
+
+LOOP_READINGS = 20_000
+SIM_READINGS = 1_000_000
+
+SCENARIOS = {
+    # Sasha session 1: a separate two-card pool per position
+    "curated, disjoint pools": (
+        "sasha-the-truth-about-this",
+        lambda: [
+            Deck(cards=["Two of Cups", "Three of Cups"], reversals=[0.3, 0.3]),
+            Deck(cards=["Eight of Swords", "Five of Cups"], reversals=[0.3, 0.3]),
+            Deck(cards=["The Devil", "Seven of Swords"], reversals=[0.3, 0.3]),
+        ],
+    ),
+    # Overlapping pools, so no-repeat exclusion changes the odds
+    "curated, overlapping pools": (
+        "past-present-future",
+        lambda: [
+            Deck(cards=["The Devil", "Ten of Wands", "The Moon"], reversals=[0.25, 0.25, 0.25]),
+            Deck(cards=["The Devil", "The Moon"]),
+            Deck(cards=["The Devil", "Ten of Wands", "The Moon", "The Sun"]),
+        ],
+    ),
+    "full decks": ("celtic-cross", lambda: None),
+}
+
+
+def _loop_frequencies(spread_id: str, make_decks, n: int) -> list[dict[str, float]]:
+    counts: list[dict[str, int]] = []
+    for _ in range(n):
+        cards = Reading(spread_id, decks=make_decks()).draw_cards()
+        if not counts:
+            counts = [{} for _ in cards]
+        for p, card in enumerate(cards):
+            counts[p][card.name] = counts[p].get(card.name, 0) + 1
+    return [{name: c / n for name, c in position.items()} for position in counts]
+
+
+def main():
+    random.seed(0)
+    for label, (spread_id, make_decks) in SCENARIOS.items():
+        start = timeit.default_timer()
+        loop = _loop_frequencies(spread_id, make_decks, LOOP_READINGS)
+        loop_us = (timeit.default_timer() - start) / LOOP_READINGS * 1e6
+
+        start = timeit.default_timer()
+        result = simulate_readings(spread_id, make_decks(), n=SIM_READINGS, seed=0)
+        sim_us = (timeit.default_timer() - start) / SIM_READINGS * 1e6
+
+        worst = max(
+            abs(share - result.card_frequencies(p).get(name, 0.0))
+            for p, position in enumerate(loop)
+            for name, share in position.items()
+        )
+        print(f"{label} ({spread_id}, {len(loop)} positions)")
+        print(f"  Reading loop: {loop_us:8.2f} us/reading ({LOOP_READINGS:,} readings)")
+        print(f"  simulator:    {sim_us:8.3f} us/reading ({SIM_READINGS:,} readings)")
+        print(f"  speedup {loop_us / sim_us:.0f}x, largest frequency gap {worst:.4f}")
+
+
+if __name__ == "__main__":
+    main()
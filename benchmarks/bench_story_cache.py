@@ -0,0 +1,111 @@
+"""Benchmark: shared StoryCache vs parsing the compiled story per session.
+
+GameSession.load_story used to json.load the whole compiled story for
+every new game and every save load, so each player kept their own copy
+of every passage. StoryCache parses each file once per process and
+shares it between engines.
+
+Measures, per session: start latency (story load + BardEngine, which
+runs the first passage) and Python heap kept alive by the session. Then
+the cold start of a fresh process, as GameSession.load_story does it
+(story, presentation metadata, Markdown prerender): parsing the JSON vs
+mapping a story pack (story_pack.py), which decodes passages only as they
+are visited.
+
+Compile the story first (see README), then run from the repo root:
+    python benchmarks/bench_story_cache.py [compiled_stories/arcanum.json]
+"""
+
+import contextlib
+import io
+import json
+import sys
+import tempfile
+import timeit
+import tracemalloc
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(PROJECT_ROOT / "player"))
+
+from bardic.runtime.engine import BardEngine  # noqa: E402
+from markdown_cache import MarkdownCache  # noqa: E402
+from story_cache import StoryCache  # noqa: E402
+from story_pack import build_story_pack  # noqa: E402
+
+SESSIONS = 8
+
+
+def _legacy_load(story_path: Path) -> dict:
+    with open(story_path) as f:
+        return json.load(f)
+
+
+def _start_sessions(load) -> tuple[float, float, list]:
+    """Start SESSIONS engines; return ms per session, KiB kept per session."""
+    engines = []
+    tracemalloc.start()
+    start = timeit.default_timer()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(SESSIONS):
+            engines.append(BardEngine(load(), context={}))
+    elapsed_ms = (timeit.default_timer() - start) * 1000 / SESSIONS
+    heap_kib = tracemalloc.get_traced_memory()[0] / 1024 / SESSIONS
+    tracemalloc.stop()
+    return elapsed_ms, heap_kib, engines
+
+
+def main():
+    story_path = Path(
+        sys.argv[1] if len(sys.argv) > 1 else PROJECT_ROOT / "compiled_stories" / "arcanum.json"
+    )
+    if not story_path.exists():
+        print(f"{story_path} not found; compile the story first (see README)")
+        sys.exit(1)
+    print(f"{story_path.name}: {story_path.stat().st_size / 1024:,.0f} KiB, {SESSIONS} sessions")
+
+    # Warm imports (game_logic modules, meaning store) outside the timings
+    with contextlib.redirect_stdout(io.StringIO()):
+        BardEngine(_legacy_load(story_path), context={})
+
+    legacy_ms, legacy_kib, _ = _start_sessions(lambda: _legacy_load(story_path))
+    print(f"  json.load per session: {legacy_ms:7.1f} ms/session, {legacy_kib:9,.0f} KiB/session")
+
+    cache = StoryCache()
+    cold_start = timeit.default_timer()
+    cache.get(story_path)
+    cold_ms = (timeit.default_timer() - cold_start) * 1000
+    cached_ms, cached_kib, engines = _start_sessions(lambda: cache.get(story_path))
+    print(f"  StoryCache:            {cached_ms:7.1f} ms/session, {cached_kib:9,.0f} KiB/session")
+    print(f"  (first parse {cold_ms:.1f} ms, once per process; "
+          f"{cache.hits} hits, {cache.misses} miss)")
+
+    shared = all(engine.passages is engines[0].passages for engine in engines)
+    print(f"  Engines share one passages dict: {shared}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pack_path = build_story_pack(story_path, Path(tmp) / f"{story_path.stem}.story")
+        print(f"Cold start ({pack_path.stat().st_size / 1024:,.0f} KiB story pack)")
+        for label, path in (("JSON", story_path), ("story pack", pack_path)):
+            cache = StoryCache()
+            start = timeit.default_timer()
+            # Everything GameSession.load_story does before the engine
+            story = cache.get(path)
+            cache.meta(path)
+            MarkdownCache().prerender_story(story)
+            load_ms = (timeit.default_timer() - start) * 1000
+            start = timeit.default_timer()
+            ids = cache.passage_ids(path)
+            ids_ms = (timeit.default_timer() - start) * 1000
+            with contextlib.redirect_stdout(io.StringIO()):
+                BardEngine(story, context={})
+            decoded = getattr(story["passages"], "decoded_count", len(story["passages"]))
+            print(
+                f"  {label + ':':<12} load {load_ms:6.1f} ms, list {len(ids)} ids {ids_ms:5.1f} ms, "
+                f"{decoded} passages decoded after the first page"
+            )
+
+
+if __name__ == "__main__":
+    main()
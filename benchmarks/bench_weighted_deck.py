@@ -0,0 +1,147 @@
+"""Benchmark and statistical check: weighted decks and exact reversals.
+
+Draws used to reverse a card when randint(0, 1) <= its reversal chance,
+so 0.25 or 0.3 came out as a coin flip and 0 was reversed half the time.
+Reversals are now a single rng.random() < chance, and decks with draw
+weights sample through a precomputed alias table (AliasTable).
+
+The checks draw a large sample with a fixed seed and fail (exit 1) if any
+observed frequency is more than TOLERANCE standard errors from the
+configured probability.
+
+Run from the repo root:
+    python benchmarks/bench_weighted_deck.py
+"""
+
+import math
+import sys
+import timeit
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from game_logic.rng import SessionRNG  # noqa: E402
+from game_logic.tarot import CARD_REGISTRY, AliasTable, Deck  # noqa: E402
+
+SAMPLES = 200_000
+TOLERANCE = 5.0  # standard errors
+
+CARDS = ["The Devil", "Ten of Wands", "The Moon", "The Sun", "Death"]
+WEIGHTS = [5, 1, 2.5, 0.5, 1]
+REVERSALS = [0, 0.25, 0.3, 1, 0.5]
+
+
+def _check(label: str, counts: Counter, expected: dict, n: int) -> bool:
+    """Compare observed counts against expected probabilities."""
+    ok = True
+    for key, p in expected.items():
+        observed = counts.get(key, 0) / n
+        if p in (0.0, 1.0):
+            bad = observed != p
+            z = 0.0
+        else:
+            z = (observed - p) / math.sqrt(p * (1 - p) / n)
+            bad = abs(z) > TOLERANCE
+        if bad:
+            print(f"  FAIL {label}: {key} expected {p:.4f}, got {observed:.4f} (z={z:+.1f})")
+            ok = False
+    print(f"  {'ok  ' if ok else 'FAIL'} {label}")
+    return ok
+
+
+def check_alias_table() -> bool:
+    """The table's implied probabilities equal the weights, to rounding."""
+    table = AliasTable.build(CARDS, WEIGHTS)
+    n = len(table.prob)
+    implied = [0.0] * n
+    for slot in range(n):
+        implied[slot] += table.prob[slot] / n
+        implied[table.alias[slot]] += (1 - table.prob[slot]) / n
+    total = sum(WEIGHTS)
+    worst = max(abs(implied[i] - WEIGHTS[i] / total) for i in range(n))
+    ok = worst < 1e-12
+    print(f"  {'ok  ' if ok else 'FAIL'} alias table probabilities (max error {worst:.1e})")
+    return ok
+
+
+def check_draws() -> bool:
+    rng = SessionRNG(2024)
+    deck = Deck(cards=CARDS, reversals=REVERSALS, weights=WEIGHTS)
+    total = sum(WEIGHTS)
+    ok = check_alias_table()
+
+    draws = [deck.draw_card(rng=rng) for _ in range(SAMPLES)]
+    names = Counter(card.name for card in draws)
+    ok &= _check("weighted draw frequencies", names, {
+        name: weight / total for name, weight in zip(CARDS, WEIGHTS)
+    }, SAMPLES)
+    for name, chance in zip(CARDS, REVERSALS):
+        flips = Counter(card.reversed for card in draws if card.name == name)
+        ok &= _check(f"reversal rate {chance} ({name})", flips, {True: chance}, names[name])
+
+    # Excluding a card renormalizes the rest
+    exclude = 1 << CARD_REGISTRY.get("The Devil").index
+    rest = total - WEIGHTS[0]
+    names = Counter(deck.draw_card(exclude=exclude, rng=rng).name for _ in range(SAMPLES))
+    ok &= _check("weighted draw with exclusion", names, {
+        name: weight / rest for name, weight in zip(CARDS[1:], WEIGHTS[1:])
+    }, SAMPLES)
+
+    # Mostly excluded, so draws reach the weighted fallback
+    exclude = sum(1 << CARD_REGISTRY.get(name).index for name in ("The Devil", "The Moon", "Death"))
+    names = Counter(deck.draw_card(exclude=exclude, rng=rng).name for _ in range(SAMPLES))
+    ok &= _check("weighted fallback", names, {"Ten of Wands": 1 / 1.5, "The Sun": 0.5 / 1.5}, SAMPLES)
+
+    # Multi-card draws never repeat a card
+    hands = [deck.draw_cards(3, rng=rng) for _ in range(SAMPLES // 10)]
+    repeats = sum(len({card.name for card in hand}) != 3 for hand in hands)
+    print(f"  {'ok  ' if not repeats else 'FAIL'} draw_cards(3) without repeats")
+    ok &= not repeats
+
+    # Unweighted decks stay uniform
+    uniform = Deck(cards=CARDS)
+    names = Counter(uniform.draw_card(rng=rng).name for _ in range(SAMPLES))
+    ok &= _check("uniform draw frequencies", names, {name: 1 / len(CARDS) for name in CARDS}, SAMPLES)
+    return ok
+
+
+def _legacy_weighted_draw(deck: Deck, rng):
+    """Weighted choice without a precomputed table, plus the old reversal rule."""
+    spec = rng.choices(deck.cards, deck.draw_weights)[0]
+    return spec, rng.randint(0, 1) <= deck.reversal_map[spec]
+
+
+def _alias_draw(deck: Deck, rng):
+    spec = deck._alias.sample(rng)
+    return spec, rng.random() < deck.reversal_probability(spec)
+
+
+def bench() -> None:
+    n = 200_000
+    rng = SessionRNG(1)
+    full_weights = [1 + (i % 7) for i in range(78)]
+    for label, deck in (
+        ("5-card weighted deck", Deck(cards=CARDS, reversals=REVERSALS, weights=WEIGHTS)),
+        ("78-card weighted deck", Deck(reversals=[0.3] * 78, weights=full_weights)),
+    ):
+        legacy_us = timeit.timeit(lambda: _legacy_weighted_draw(deck, rng), number=n) / n * 1e6
+        alias_us = timeit.timeit(lambda: _alias_draw(deck, rng), number=n) / n * 1e6
+        draw_us = timeit.timeit(lambda: deck.draw_card(rng=rng), number=n) / n * 1e6
+        print(label)
+        print(f"  random.choices + randint: {legacy_us:6.2f} us/draw")
+        print(f"  alias table + random():   {alias_us:6.2f} us/draw ({legacy_us / alias_us:.1f}x)")
+        print(f"  Deck.draw_card:           {draw_us:6.2f} us/draw (includes DrawnCard)")
+
+
+def main():
+    print("Statistical checks")
+    ok = check_draws()
+    print()
+    bench()
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
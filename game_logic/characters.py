@@ -1,10 +1,10 @@
 """Classes for characters and player."""
 
-import random
 from dataclasses import dataclass, field
 from typing import List, Literal, Set
 
-from game_logic.tarot import Card
+from game_logic.rng import get_rng
+from game_logic.tarot import DrawnCard
 
 ReadingStyle = Literal["intuitive", "analytical", "storyteller", "practical"]
 Background = Literal["inheritance", "self_taught", "unexpected_gift", "career_change"]
@@ -623,11 +623,11 @@ class Chen(Client):
 
     # === SESSION TRACKING ===
     session_one_quality: str = ""
-    session_one_cards: list[Card] = field(default_factory=list)
+    session_one_cards: list[DrawnCard] = field(default_factory=list)
     session_two_quality: str = ""
-    session_two_cards: list[Card] = field(default_factory=list)
+    session_two_cards: list[DrawnCard] = field(default_factory=list)
     session_three_quality: str = ""
-    session_three_cards: list[Card] = field(default_factory=list)
+    session_three_cards: list[DrawnCard] = field(default_factory=list)
 
     @property
     def clarity(self) -> int:
@@ -672,7 +672,7 @@ class Chen(Client):
 
         # Roll
         total_weight = crisis_weight + acceptance_weight
-        roll = random.randint(1, total_weight)
+        roll = get_rng().randint(1, total_weight)
 
         if roll <= crisis_weight:
             self.session_three_path = "final_push"
@@ -1208,7 +1208,7 @@ class Sasha(Client):
 
         # Roll
         total_weight = transformation_weight + pattern_weight
-        roll = random.randint(1, total_weight)
+        roll = get_rng().randint(1, total_weight)
 
         if roll <= transformation_weight:
             self.session_three_path = "transformation"
@@ -0,0 +1,458 @@
+"""Card meaning store, loaded once from the consolidated all_cards.json.
+
+At runtime the meanings are read from meanings.pack, a binary pack built
+from all_cards.json (see build_meaning_pack). The pack is memory-mapped,
+so worker processes share its pages through the OS page cache, and each
+field is only decoded when it is asked for. Without an up-to-date pack
+the store parses all_cards.json instead.
+
+Build the pack (again after editing all_cards.json) with:
+    python -m game_logic.meanings
+"""
+
+import bisect
+import json
+import mmap
+import os
+import struct
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+MEANINGS_DIR = Path(__file__).parent.parent / "assets" / "text" / "card_meanings"
+MEANINGS_PATH = MEANINGS_DIR / "all_cards.json"
+PACK_PATH = MEANINGS_DIR / "meanings.pack"
+
+ORIENTATIONS = ("upright", "reversed")
+
+# Pack layout (little-endian):
+#   header   magic, version, card count, entry count,
+#            rag_mapping count, question context count
+#   slots    the rag_mappings, then the question contexts: (offset, length)
+#   cards    one record per card, sorted by code:
+#            code (offset, length), first entry, entry count,
+#            core meaning upright, core meaning reversed and
+#            card relationships, each (offset, length) of a JSON blob
+#   table    per card, per slot, upright then reversed: (offset, length)
+#            of the text, length 0 where the card has none
+#   entries  one record per leaf, grouped by card and sorted by path:
+#            path (offset, length), value (offset, length), value kind
+#   strings  deduplicated UTF-8 strings; offsets are relative to its start
+#
+# The table and the JSON blobs cover what a reading asks for, so those
+# lookups are a fixed-offset read and one decode. Everything else goes
+# through the entries. Their paths are "/"-joined keys into a card's
+# JSON, e.g.
+#   core_meanings/upright/essence
+#   position_interpretations/temporal_positions/past/reversed
+# They repeat across all 78 cards, so each is stored once. String leaves
+# are stored as raw UTF-8; everything else (keyword lists, numbers, empty
+# dicts) as JSON.
+PACK_MAGIC = b"ARCMPACK"
+PACK_VERSION = 2
+PACK_HEADER = struct.Struct("<8sIIIII")
+PACK_REF = struct.Struct("<II")
+PACK_CARD = struct.Struct("<IIII" + "II" * 3)
+PACK_ENTRY = struct.Struct("<IIIIB")
+KIND_STR = 0
+KIND_JSON = 1
+
+
+class MeaningStore:
+    """All 78 card meanings, keyed by card code (e.g. 'm00', 'c05').
+
+    Position interpretations are flattened at load time into a
+    (card_code, rag_mapping, orientation) -> text table, so a reading never
+    opens a file or walks the nested JSON.
+    """
+
+    def __init__(self, cards: dict[str, dict]) -> None:
+        """Build the lookup tables.
+
+        Args:
+            cards: Full meaning dicts keyed by card code
+        """
+        self._cards = cards
+        self._core: dict[tuple[str, str], dict] = {}
+        self._positions: dict[tuple[str, str, str], str] = {}
+
+        for code, data in cards.items():
+            core = data.get("core_meanings", {})
+            for orientation in ORIENTATIONS:
+                self._core[(code, orientation)] = core.get(orientation, {})
+
+            self._flatten_positions(code, data.get("position_interpretations", {}), "")
+
+    def _flatten_positions(self, code: str, node: dict, prefix: str) -> None:
+        """Record every upright/reversed text under its dotted rag_mapping."""
+        for key, value in node.items():
+            if not isinstance(value, dict):
+                continue
+            path = f"{prefix}.{key}" if prefix else key
+            for orientation in ORIENTATIONS:
+                if orientation in value:
+                    self._positions[(code, path, orientation)] = value[orientation]
+            self._flatten_positions(code, value, path)
+
+    @classmethod
+    def from_file(cls, path: str | Path = MEANINGS_PATH) -> "MeaningStore":
+        """Load the store from all_cards.json (empty store if unreadable)."""
+        try:
+            with open(path, "r") as f:
+                raw = json.load(f)
+        except FileNotFoundError:
+            print(f"Warning: Meaning file not found: {path}")
+            return cls({})
+        except json.JSONDecodeError:
+            print(f"Warning: Invalid JSON in meaning file: {path}")
+            return cls({})
+
+        # all_cards.json is keyed by card_id ("ace_of_cups"); the per-card
+        # filename in _metadata gives the code the rest of the game uses
+        cards = {}
+        for data in raw.values():
+            filename = data.get("_metadata", {}).get("filename", "")
+            if filename:
+                cards[Path(filename).stem] = data
+        return cls(cards)
+
+    def card_data(self, code: str) -> dict:
+        """Full meaning dict for a card (core_meanings, position_interpretations, ...)."""
+        return self._cards.get(code, {})
+
+    def codes(self) -> list[str]:
+        """Card codes in the store."""
+        return sorted(self._cards)
+
+    def core_meaning(self, code: str, reversed: bool) -> dict:
+        """Core meaning (essence, keywords, ...) for a card orientation."""
+        return self._core.get((code, "reversed" if reversed else "upright"), {})
+
+    def position_meaning(self, code: str, rag_mapping: str, reversed: bool) -> str:
+        """Position interpretation for a card, e.g. rag_mapping 'temporal_positions.past'."""
+        orientation = "reversed" if reversed else "upright"
+        return self._positions.get((code, rag_mapping, orientation), "")
+
+    def question_context(self, code: str, context: str, reversed: bool) -> str:
+        """Reading for a question context such as 'love' or 'career'."""
+        contexts = self._cards.get(code, {}).get("question_contexts", {})
+        orientation = "reversed" if reversed else "upright"
+        return contexts.get(context, {}).get(orientation, "")
+
+    def card_relationships(self, code: str) -> dict:
+        """How this card combines with others ('amplifies', ...)."""
+        return self._cards.get(code, {}).get("card_relationships", {})
+
+
+def _flatten_leaves(node: Any, path: str, out: list[tuple[str, Any]]) -> None:
+    """Collect (path, value) for every leaf under node."""
+    if isinstance(node, dict) and node:
+        for key, value in node.items():
+            _flatten_leaves(value, f"{path}/{key}", out)
+    else:
+        out.append((path, node))
+
+
+def build_meaning_pack(
+    source: str | Path = MEANINGS_PATH, dest: str | Path = PACK_PATH
+) -> int:
+    """Compile all_cards.json into a binary meaning pack.
+
+    Args:
+        source: Consolidated meaning JSON (all_cards.json)
+        dest: Where to write the pack
+
+    Returns:
+        Number of entries written
+    """
+    store = MeaningStore.from_file(source)
+
+    strings = bytearray()
+    offsets: dict[bytes, int] = {}
+
+    def intern(data: bytes) -> tuple[int, int]:
+        if data not in offsets:
+            offsets[data] = len(strings)
+            strings.extend(data)
+        return offsets[data], len(data)
+
+    def intern_json(value: Any) -> tuple[int, int]:
+        return intern(json.dumps(value, ensure_ascii=False).encode("utf-8"))
+
+    def intern_text(value: Any) -> tuple[int, int]:
+        return intern(value.encode("utf-8") if isinstance(value, str) else b"")
+
+    codes = store.codes()
+    mappings = sorted({rag_mapping for _, rag_mapping, _ in store._positions})
+    contexts = sorted(
+        {context for code in codes for context in store.card_data(code).get("question_contexts", {})}
+    )
+
+    slot_names = [intern(name.encode("utf-8")) for name in (*mappings, *contexts)]
+    cards = []
+    table = []
+    entries = []
+    for code in codes:
+        leaves: list[tuple[str, Any]] = []
+        for key, value in store.card_data(code).items():
+            _flatten_leaves(value, key, leaves)
+        leaves.sort(key=lambda leaf: leaf[0].encode("utf-8"))
+
+        cards.append(
+            (
+                *intern(code.encode("utf-8")),
+                len(entries),
+                len(leaves),
+                *intern_json(store.core_meaning(code, False)),
+                *intern_json(store.core_meaning(code, True)),
+                *intern_json(store.card_relationships(code)),
+            )
+        )
+        for rag_mapping in mappings:
+            for reversed in (False, True):
+                table.append(intern_text(store.position_meaning(code, rag_mapping, reversed)))
+        for context in contexts:
+            for reversed in (False, True):
+                table.append(intern_text(store.question_context(code, context, reversed)))
+
+        for path, value in leaves:
+            if isinstance(value, str):
+                kind, data = KIND_STR, value.encode("utf-8")
+            else:
+                kind, data = KIND_JSON, json.dumps(value, ensure_ascii=False).encode("utf-8")
+            entries.append((*intern(path.encode("utf-8")), *intern(data), kind))
+
+    # Write next to the destination and swap in, so a running process that
+    # has the old pack mapped never sees a half-written file
+    dest = Path(dest)
+    tmp = dest.with_name(f"{dest.name}.{os.getpid()}.tmp")
+    with open(tmp, "wb") as f:
+        f.write(
+            PACK_HEADER.pack(
+                PACK_MAGIC, PACK_VERSION, len(cards), len(entries), len(mappings), len(contexts)
+            )
+        )
+        for name in slot_names:
+            f.write(PACK_REF.pack(*name))
+        for card in cards:
+            f.write(PACK_CARD.pack(*card))
+        for ref in table:
+            f.write(PACK_REF.pack(*ref))
+        for entry in entries:
+            f.write(PACK_ENTRY.pack(*entry))
+        f.write(strings)
+    os.replace(tmp, dest)
+    return len(entries)
+
+
+@dataclass(frozen=True, slots=True)
+class PackCard:
+    """One card's record in a meaning pack (string refs are (offset, length))."""
+
+    row: int  # Row in the slot table
+    first: int  # First entry
+    count: int  # Entry count
+    core: tuple[tuple[int, int], tuple[int, int]]  # Upright, reversed JSON
+    relationships: tuple[int, int]  # JSON
+
+
+class MeaningPack:
+    """Read-only view of a memory-mapped meaning pack.
+
+    Same lookups as MeaningStore, but nothing is decoded until asked for:
+    only the card records and slot names are read up front. Position
+    meanings, question contexts, core meanings and relationships are one
+    read at a fixed offset (core meanings are then kept decoded, as every
+    showing of a reading asks for them); other paths binary-search the
+    card's entries. Each lookup decodes just the fields it returns.
+    """
+
+    def __init__(self, path: str | Path = PACK_PATH) -> None:
+        """Map the pack file.
+
+        Args:
+            path: Pack built by build_meaning_pack
+
+        Raises:
+            ValueError: If the file is not a meaning pack of this version
+        """
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, card_count, entry_count, mapping_count, context_count = (
+            PACK_HEADER.unpack_from(self._mm, 0)
+        )
+        if magic != PACK_MAGIC or version != PACK_VERSION:
+            self._mm.close()
+            raise ValueError(f"Not a version {PACK_VERSION} meaning pack: {self.path}")
+
+        self._count = entry_count
+        self._slot_count = mapping_count + context_count
+        cards_start = PACK_HEADER.size + self._slot_count * PACK_REF.size
+        self._table_start = cards_start + card_count * PACK_CARD.size
+        self._entries_start = self._table_start + card_count * self._slot_count * 2 * PACK_REF.size
+        self._strings_start = self._entries_start + entry_count * PACK_ENTRY.size
+
+        # rag_mapping / question context -> slot
+        names = [
+            self._string(*PACK_REF.unpack_from(self._mm, PACK_HEADER.size + i * PACK_REF.size))
+            .decode("utf-8")
+            for i in range(self._slot_count)
+        ]
+        self._mapping_slots = {name: i for i, name in enumerate(names[:mapping_count])}
+        self._context_slots = {
+            name: mapping_count + i for i, name in enumerate(names[mapping_count:])
+        }
+
+        # Decoded core meanings, shared like MeaningStore's (filled on first use)
+        self._core: dict[tuple[str, bool], dict] = {}
+
+        self._cards: dict[str, PackCard] = {}
+        for i in range(card_count):
+            code_offset, code_len, first, count, *refs = PACK_CARD.unpack_from(
+                self._mm, cards_start + i * PACK_CARD.size
+            )
+            code = self._string(code_offset, code_len).decode("utf-8")
+            self._cards[code] = PackCard(
+                i, first, count, ((refs[0], refs[1]), (refs[2], refs[3])), (refs[4], refs[5])
+            )
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _string(self, offset: int, length: int) -> bytes:
+        start = self._strings_start + offset
+        return self._mm[start : start + length]
+
+    def _entry(self, i: int) -> tuple[int, int, int, int, int]:
+        return PACK_ENTRY.unpack_from(self._mm, self._entries_start + i * PACK_ENTRY.size)
+
+    def _path(self, i: int) -> bytes:
+        # Called for every bisect step, so this skips the _entry/_string helpers
+        path_offset, path_len, _, _, _ = PACK_ENTRY.unpack_from(
+            self._mm, self._entries_start + i * PACK_ENTRY.size
+        )
+        start = self._strings_start + path_offset
+        return self._mm[start : start + path_len]
+
+    def _value(self, i: int) -> Any:
+        _, _, value_offset, value_len, kind = self._entry(i)
+        data = self._string(value_offset, value_len)
+        if kind == KIND_STR:
+            return data.decode("utf-8")
+        return json.loads(data)
+
+    def _lower_bound(self, code: str, path: bytes) -> tuple[int, int]:
+        """First entry of the card whose path is >= path, and the card's end."""
+        card = self._cards.get(code)
+        if card is None:
+            return 0, 0
+        end = card.first + card.count
+        return bisect.bisect_left(range(end), path, lo=card.first, key=self._path), end
+
+    def _slot_text(self, code: str, slot: int | None, reversed: bool) -> str:
+        """A card's text in the slot table ('' if the card or slot is unknown)."""
+        card = self._cards.get(code)
+        if card is None or slot is None:
+            return ""
+        offset, length = PACK_REF.unpack_from(
+            self._mm,
+            self._table_start + ((card.row * self._slot_count + slot) * 2 + reversed) * PACK_REF.size,
+        )
+        return self._string(offset, length).decode("utf-8")
+
+    def _blob(self, ref: tuple[int, int]) -> Any:
+        return json.loads(self._string(*ref))
+
+    def get(self, code: str, path: str, default: Any = None) -> Any:
+        """Decode a single leaf, e.g. get('c01', 'core_meanings/upright/essence')."""
+        key = path.encode("utf-8")
+        i, end = self._lower_bound(code, key)
+        if i < end and self._path(i) == key:
+            return self._value(i)
+        return default
+
+    def subtree(self, code: str, path: str = "") -> dict:
+        """Rebuild the nested dict under path for a card (empty if there is none)."""
+        prefix = path.encode("utf-8") + b"/" if path else b""
+        result: dict = {}
+        i, end = self._lower_bound(code, prefix)
+        while i < end:
+            key = self._path(i)
+            if not key.startswith(prefix):
+                break
+            parts = key[len(prefix) :].decode("utf-8").split("/")
+            node = result
+            for part in parts[:-1]:
+                node = node.setdefault(part, {})
+            node[parts[-1]] = self._value(i)
+            i += 1
+        return result
+
+    def codes(self) -> list[str]:
+        """Card codes in the pack."""
+        return sorted(self._cards)
+
+    def card_data(self, code: str) -> dict:
+        """Full meaning dict for a card (core_meanings, position_interpretations, ...)."""
+        return self.subtree(code)
+
+    def core_meaning(self, code: str, reversed: bool) -> dict:
+        """Core meaning (essence, keywords, ...) for a card orientation."""
+        core = self._core.get((code, reversed))
+        if core is None:
+            card = self._cards.get(code)
+            if card is None:
+                return {}
+            core = self._core[(code, reversed)] = self._blob(card.core[reversed])
+        return core
+
+    def position_meaning(self, code: str, rag_mapping: str, reversed: bool) -> str:
+        """Position interpretation for a card, e.g. rag_mapping 'temporal_positions.past'."""
+        return self._slot_text(code, self._mapping_slots.get(rag_mapping), reversed)
+
+    def question_context(self, code: str, context: str, reversed: bool) -> str:
+        """Reading for a question context such as 'love' or 'career'."""
+        return self._slot_text(code, self._context_slots.get(context), reversed)
+
+    def card_relationships(self, code: str) -> dict:
+        """How this card combines with others ('amplifies', ...)."""
+        card = self._cards.get(code)
+        return self._blob(card.relationships) if card else {}
+
+
+def load_meaning_store() -> MeaningPack | MeaningStore:
+    """Open the meaning pack, or parse all_cards.json if it isn't usable.
+
+    Never builds the pack (that is python -m game_logic.meanings). A
+    missing, out-of-date (older than all_cards.json) or unreadable pack
+    falls back to MeaningStore with a warning.
+    """
+    build_hint = "build it with: python -m game_logic.meanings"
+    try:
+        if not PACK_PATH.exists():
+            print(f"Warning: No meaning pack at {PACK_PATH}, loading {MEANINGS_PATH} ({build_hint})")
+            return MeaningStore.from_file()
+        if PACK_PATH.stat().st_mtime < MEANINGS_PATH.stat().st_mtime:
+            print(
+                f"Warning: Meaning pack is older than {MEANINGS_PATH.name}, loading "
+                f"{MEANINGS_PATH} ({build_hint})"
+            )
+            return MeaningStore.from_file()
+        return MeaningPack()
+    except (OSError, ValueError, struct.error) as e:
+        print(f"Warning: Meaning pack unavailable ({e}), loading {MEANINGS_PATH} ({build_hint})")
+        return MeaningStore.from_file()
+
+
+# Initialize the shared meaning store (memory-mapped pack when available)
+MEANING_STORE = load_meaning_store()
+
+
+if __name__ == "__main__":
+    source = Path(sys.argv[1]) if len(sys.argv) > 1 else MEANINGS_PATH
+    dest = Path(sys.argv[2]) if len(sys.argv) > 2 else PACK_PATH
+    count = build_meaning_pack(source, dest)
+    print(f"Wrote {count} entries to {dest} ({dest.stat().st_size:,} bytes)")
@@ -1,8 +1,8 @@
 from dataclasses import dataclass, field
-from random import randint
 from typing import List, Optional
 
 from game_logic.characters import BlackthornManor, Client, Nyx, TheKind
+from game_logic.rng import get_rng
 
 
 @dataclass
@@ -30,7 +30,7 @@ class Session:
     dismissive_focus: int = 0
 
     # === ENVIRONMENTAL FACTORS ===
-    weather_intensity: int = field(default_factory=lambda: randint(0, 3))
+    weather_intensity: int = field(default_factory=lambda: get_rng().randint(0, 3))
     _room_energy: int = 0  # -2 to +5: Drained to charged
     _tech_interference: int = 0  # 0 to 5: Electronic glitches
 
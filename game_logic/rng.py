@@ -0,0 +1,145 @@
+"""Per-session random number streams for draws, rolls and replays.
+
+Every game session keeps its own SessionRNG in Bardic state (under
+STATE_KEY), so it is saved with the game, rolled back by undo, and
+restored on load. Game code never holds a reference to it: Deck,
+Reading, Session and the client path rolls call get_rng(), which returns
+the generator of whichever session is currently running a passage (see
+use_session_rng). Outside any session (tools, scripts) get_rng() falls
+back to the global random module.
+
+To reproduce or simulate a run, seed it:
+    with use_rng(SessionRNG(1234)):
+        Reading("celtic-cross").draw_cards()
+"""
+
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Iterator, Optional
+
+# Bardic state key; the leading underscore matches the engine's own
+# bookkeeping keys (_visits, _turns) so stories don't collide with it
+STATE_KEY = "_rng"
+
+
+class SessionRNG(random.Random):
+    """A random.Random that round-trips through Bardic saves."""
+
+    def __init__(self, seed: Optional[int] = None) -> None:
+        """Create a generator.
+
+        Args:
+            seed: Integer seed; a fresh one is picked when omitted. Kept as
+                initial_seed so a bug report can quote it.
+        """
+        if seed is None:
+            seed = random.SystemRandom().randrange(2**63)
+        self.initial_seed = seed
+        super().__init__(seed)
+        self.passage_start = None
+
+    def __repr__(self) -> str:
+        return f"SessionRNG(seed={self.initial_seed})"
+
+    # random.Random pickles (and so deepcopies, e.g. for undo snapshots)
+    # by calling the class with no arguments; pass the seed back through
+    def __reduce__(self):
+        return (self.__class__, (self.initial_seed,), (self.getstate(), self.passage_start))
+
+    def __setstate__(self, state) -> None:
+        generator_state, self.passage_start = state
+        self.setstate(generator_state)
+
+    def mark_passage_start(self) -> None:
+        """Remember the generator position before the engine runs a passage.
+
+        Bardic re-runs the current passage when a save is loaded, so saves
+        store this position instead of the current one: the re-run then
+        redraws exactly the cards the player saw, and the stream carries on
+        as if the game had never been saved.
+        """
+        self.passage_start = self.getstate()
+
+    def to_save_dict(self) -> dict:
+        """Serialize the seed and the generator position at passage start."""
+        version, internal_state, gauss_next = self.passage_start or self.getstate()
+        return {
+            "seed": self.initial_seed,
+            "state": [version, list(internal_state), gauss_next],
+        }
+
+    @classmethod
+    def from_save_dict(cls, data: dict) -> "SessionRNG":
+        """Restore a generator at the position it was saved at."""
+        rng = cls(data["seed"])
+        if data.get("state"):
+            version, internal_state, gauss_next = data["state"]
+            rng.setstate((version, tuple(internal_state), gauss_next))
+        rng.mark_passage_start()
+        return rng
+
+
+def session_rng(state: dict) -> SessionRNG:
+    """Return the generator stored in a Bardic state dict, adding one if missing.
+
+    Saves from before SessionRNG existed have no generator, so they get a
+    freshly seeded one on first use.
+    """
+    rng = state.get(STATE_KEY)
+    if not isinstance(rng, random.Random):
+        rng = state[STATE_KEY] = SessionRNG()
+    return rng
+
+
+# Zero-argument callable returning the active generator (None = global random)
+_active_rng: ContextVar[Optional[Callable[[], random.Random]]] = ContextVar(
+    "arcanum_active_rng", default=None
+)
+
+
+def get_rng():
+    """The active session's generator, or the global random module."""
+    provider = _active_rng.get()
+    if provider is None:
+        return random
+    return provider()
+
+
+@contextmanager
+def use_rng(rng: random.Random) -> Iterator[random.Random]:
+    """Route get_rng() to a specific generator inside the block."""
+    token = _active_rng.set(lambda: rng)
+    try:
+        yield rng
+    finally:
+        _active_rng.reset(token)
+
+
+@contextmanager
+def use_session_rng(state: dict) -> Iterator[None]:
+    """Route get_rng() to the generator in a Bardic state dict inside the block.
+
+    The generator is looked up on every call rather than captured, because
+    load_state, undo and redo swap the state's contents mid-call.
+    """
+    session_rng(state).mark_passage_start()
+    token = _active_rng.set(lambda: session_rng(state))
+    try:
+        yield
+    finally:
+        _active_rng.reset(token)
+
+
+class RandomProxy:
+    """Stand-in for the `random` module inside story code.
+
+    Stories `import random` for weather and other flavour rolls; with this
+    in the engine context those calls draw from the session's generator too.
+    """
+
+    def __getattr__(self, name: str):
+        return getattr(get_rng(), name)
+
+    def __repr__(self) -> str:
+        return f"RandomProxy({get_rng()!r})"
@@ -0,0 +1,356 @@
+"""Batch Monte Carlo simulator for tuning spreads and curated decks.
+
+Draws large numbers of readings at once as NumPy index arrays, following
+Reading.draw_cards: each position draws from its own Deck (by its draw weights;
+duplicates in deck.cards add up), cards already in the reading are excluded
+unless allow_repeats is set, and a reading whose deck runs out is counted
+as exhausted (where Reading would raise "No cards available").
+
+Requires NumPy (tooling only; the game itself doesn't import this module).
+
+Example:
+    from game_logic.simulator import simulate_readings
+    from game_logic.tarot import Deck
+
+    result = simulate_readings(
+        "sasha-the-truth-about-this",
+        decks=[
+            Deck(cards=["The Devil", "Ten of Wands"], reversals=[0.25, 0.25]),
+            Deck(cards=["The Moon", "Seven of Swords"]),
+            Deck(cards=["The Tower", "Three of Swords"]),
+        ],
+        n=1_000_000,
+        seed=1,
+    )
+    print(result.summary())
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+import numpy as np
+
+from game_logic.tarot import CARD_SPECS, AliasTable, Deck, get_spread_def
+
+N_CARDS = len(CARD_SPECS)
+
+# Vectorized rejection rounds before falling back to exact per-row masking
+_REJECTION_ROUNDS = 4
+
+
+@dataclass
+class SimulationResult:
+    """Drawn cards for a batch of simulated readings.
+
+    cards holds spec indexes (CardSpec.index) with one row per reading and
+    one column per spread position; exhausted readings are all -1.
+    """
+
+    spread_id: str
+    position_names: list[str]
+    cards: np.ndarray  # (n, positions) int16
+    reversed: np.ndarray  # (n, positions) bool
+
+    @property
+    def n_readings(self) -> int:
+        return len(self.cards)
+
+    @property
+    def completed(self) -> np.ndarray:
+        """Boolean mask of readings that drew every position."""
+        return self.cards[:, 0] >= 0
+
+    @property
+    def exhausted(self) -> int:
+        """Readings where some position's deck ran out of undrawn cards."""
+        return int(self.n_readings - self.completed.sum())
+
+    def card_frequencies(self, position: int) -> dict[str, float]:
+        """Share of completed readings showing each card at a position."""
+        cards = self.cards[self.completed, position]
+        counts = np.bincount(cards, minlength=N_CARDS)
+        total = max(len(cards), 1)
+        return {
+            CARD_SPECS[i].name: float(counts[i] / total)
+            for i in np.argsort(-counts, kind="stable")
+            if counts[i]
+        }
+
+    def reversal_rates(self, position: int) -> dict[str, float]:
+        """Per-card share of draws at a position that came up reversed."""
+        completed = self.completed
+        cards = self.cards[completed, position]
+        drawn = np.bincount(cards, minlength=N_CARDS)
+        flipped = np.bincount(
+            cards, weights=self.reversed[completed, position], minlength=N_CARDS
+        )
+        return {
+            CARD_SPECS[i].name: float(flipped[i] / drawn[i])
+            for i in np.flatnonzero(drawn)
+        }
+
+    def co_occurrence(self) -> np.ndarray:
+        """(78, 78) counts of completed readings containing both cards.
+
+        Symmetric; the diagonal counts readings where a card appears in
+        two positions (only possible with allow_repeats).
+        """
+        cards = self.cards[self.completed].astype(np.int64)
+        counts = np.zeros(N_CARDS * N_CARDS, dtype=np.int64)
+        positions = cards.shape[1]
+        for i in range(positions):
+            for j in range(i + 1, positions):
+                pair = cards[:, i] * N_CARDS + cards[:, j]
+                counts += np.bincount(pair, minlength=N_CARDS * N_CARDS)
+        matrix = counts.reshape(N_CARDS, N_CARDS)
+        return matrix + matrix.T - np.diag(np.diag(matrix))
+
+    def top_pairs(self, k: int = 10) -> list[tuple[str, str, float]]:
+        """The k most frequent card pairs, as (name, name, share of readings)."""
+        matrix = np.triu(self.co_occurrence())
+        flat = np.argsort(-matrix, axis=None, kind="stable")[:k]
+        total = max(int(self.completed.sum()), 1)
+        pairs = []
+        for index in flat:
+            a, b = divmod(int(index), N_CARDS)
+            if matrix[a, b]:
+                pairs.append((CARD_SPECS[a].name, CARD_SPECS[b].name, float(matrix[a, b] / total)))
+        return pairs
+
+    def summary(self, top: int = 5) -> str:
+        """Plain-text report of frequencies, reversal rates and common pairs."""
+        lines = [
+            f"{self.spread_id}: {self.n_readings:,} readings, "
+            f"{self.exhausted:,} exhausted ({self.exhausted / max(self.n_readings, 1):.2%})"
+        ]
+        for p, name in enumerate(self.position_names):
+            lines.append(f"  {p + 1}. {name}")
+            rates = self.reversal_rates(p)
+            for card, share in list(self.card_frequencies(p).items())[:top]:
+                lines.append(f"       {card:<24} {share:7.2%}  reversed {rates[card]:6.2%}")
+        lines.append("  Most common pairs:")
+        for a, b, share in self.top_pairs(top):
+            lines.append(f"       {a} + {b}: {share:.2%}")
+        return "\n".join(lines)
+
+
+def _deck_tables(
+    deck: Deck, columns: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Draw weights and reversal probabilities of a deck.
+
+    Both are indexed by column: position in `columns`, the sorted spec
+    indexes of every card any deck in the simulation can draw. Duplicate
+    cards add up their weights.
+    """
+    draw_weights = getattr(deck, "draw_weights", None) or [1.0] * len(deck.cards)
+    weights = np.zeros(len(columns), dtype=np.float64)
+    reversal = np.zeros(len(columns), dtype=np.float32)
+    for spec, weight in zip(deck.cards, draw_weights):
+        column = np.searchsorted(columns, spec.index)
+        weights[column] += weight
+        reversal[column] = deck.reversal_probability(spec)
+    return weights, reversal
+
+
+def _column_sampler(weights: np.ndarray) -> Optional[Callable[..., np.ndarray]]:
+    """Return sample(rng, size), drawing columns in proportion to weights.
+
+    Integer weights (plain and duplicated cards) use a slot table,
+    np.repeat(columns, weights), so a uniform slot index is an exact
+    weighted draw. Fractional weights use the same alias table as Deck.
+    Returns None for an empty deck.
+    """
+    if not weights.any():
+        return None
+
+    if np.all(weights == np.round(weights)) and weights.sum() < 2**15:
+        table = np.repeat(np.arange(len(weights), dtype=np.int16), weights.astype(np.int64))
+
+        def sample(rng: np.random.Generator, size: int) -> np.ndarray:
+            return table[rng.integers(0, len(table), size, dtype=np.int16)]
+
+        return sample
+
+    alias_table = AliasTable.build(range(len(weights)), weights)
+    prob = np.array(alias_table.prob)
+    alias = np.array(alias_table.alias, dtype=np.int16)
+
+    def sample(rng: np.random.Generator, size: int) -> np.ndarray:
+        slot = rng.integers(0, len(prob), size, dtype=np.int16)
+        return np.where(rng.random(size) < prob[slot], slot, alias[slot])
+
+    return sample
+
+
+def _draw_position(
+    rng: np.random.Generator,
+    sample: Callable[..., np.ndarray],
+    weights: np.ndarray,
+    taken: np.ndarray,
+    alive: np.ndarray,
+) -> np.ndarray:
+    """Draw one position for every live reading, skipping cards already taken.
+
+    Args:
+        sample: The deck's column sampler (see _column_sampler)
+        weights: Deck weights per column
+        taken: (readings, columns) bool, cards already in each reading
+        alive: Readings that haven't run out of cards yet
+
+    Returns:
+        Column per reading, -1 where every card in the deck is already taken
+    """
+    out = np.full(len(taken), -1, dtype=np.int16)
+
+    # Vectorized rejection rounds: a weighted draw from the deck is kept
+    # unless the card is already in that reading
+    # Flat view of taken: row r, column c lives at r * width + c
+    width = taken.shape[1]
+    taken_flat = taken.reshape(-1)
+    pending = np.flatnonzero(alive)
+    for _ in range(_REJECTION_ROUNDS):
+        if not len(pending):
+            return out
+        candidates = sample(rng, len(pending))
+        # Write every candidate; rows that clashed are overwritten next round
+        out[pending] = candidates
+        pending = pending[taken_flat[pending * width + candidates]]
+
+    out[pending] = -1
+    if len(pending):
+        # Rows that keep clashing: draw exactly from their remaining cards
+        masked = np.where(taken[pending], 0.0, weights)
+        row_cumulative = np.cumsum(masked, axis=1)
+        totals = row_cumulative[:, -1]
+        ok = totals > 0
+        u = rng.random(len(pending)) * totals
+        chosen = (row_cumulative <= u[:, None]).sum(axis=1)
+        out[pending[ok]] = chosen[ok]
+
+    return out
+
+
+def simulate_readings(
+    spread_id: str,
+    decks: Optional[list[Deck]] = None,
+    n: int = 100_000,
+    allow_repeats: bool = False,
+    seed: Optional[int] = None,
+    chunk_size: int = 65_536,
+) -> SimulationResult:
+    """Simulate n readings of a spread, as Reading(spread_id, decks).draw_cards() would.
+
+    Args:
+        spread_id: ID of spread from spreads-config.json
+        decks: One Deck per position (default: a full deck for each)
+        n: Number of readings to draw
+        allow_repeats: Whether same card can appear in multiple positions
+        seed: Seed for numpy.random.default_rng, for reproducible batches
+        chunk_size: Readings drawn per vectorized batch (bounds memory)
+
+    Returns:
+        SimulationResult with the drawn spec indexes and reversal flags
+
+    Raises:
+        ValueError: If the spread is unknown or decks doesn't match its positions
+    """
+    spread_def = get_spread_def(spread_id)
+    position_count = len(spread_def.positions)
+    if decks is None:
+        decks = [Deck() for _ in range(position_count)]
+    if len(decks) < position_count:
+        raise ValueError(
+            f"Spread '{spread_id}' has {position_count} positions but only {len(decks)} decks"
+        )
+
+    decks = decks[:position_count]
+    columns = np.array(
+        sorted({spec.index for deck in decks for spec in deck.cards}), dtype=np.int16
+    )
+    tables = [_deck_tables(deck, columns) for deck in decks]
+    rng = np.random.default_rng(seed)
+
+    cards = np.full((n, position_count), -1, dtype=np.int16)
+    flipped = np.zeros((n, position_count), dtype=bool)
+    if not len(columns):
+        # Every deck is empty, so every reading fails at its first position
+        return SimulationResult(
+            spread_id=spread_id,
+            position_names=[pos.get("name", "") for pos in spread_def.positions],
+            cards=cards,
+            reversed=flipped,
+        )
+
+    # Exclusion only matters where a deck shares cards with an earlier one
+    # (and only needs tracking for cards a later deck could draw)
+    support = np.array([weights > 0 for weights, _ in tables])
+    seen_before = np.cumsum(support, axis=0) - support
+    shares_earlier = (support & (seen_before > 0)).any(axis=1)
+    shares_later = [
+        bool((support[p] & support[p + 1 :].any(axis=0)).any())
+        for p in range(position_count)
+    ]
+
+    # Per position: column sampler, and the deck's reversal chance
+    # when every card in it shares one (skips a per-row lookup)
+    samplers = [_column_sampler(weights) for weights, _ in tables]
+    shared_reversal = [
+        float(reversal[weights > 0][0])
+        if weights.any() and np.all(reversal[weights > 0] == reversal[weights > 0][0])
+        else None
+        for weights, reversal in tables
+    ]
+    width = len(columns)
+
+    for start in range(0, n, chunk_size):
+        size = min(chunk_size, n - start)
+        chunk = np.full((size, position_count), -1, dtype=np.int16)
+        reversed_chunk = np.zeros((size, position_count), dtype=bool)
+        taken = np.zeros((size, width), dtype=bool)
+        taken_flat = taken.reshape(-1)
+        row_offsets = np.arange(size, dtype=np.int64) * width
+        alive = np.ones(size, dtype=bool)
+
+        for p, (weights, reversal) in enumerate(tables):
+            if allow_repeats or not shares_earlier[p]:
+                if samplers[p] is not None:
+                    drawn = samplers[p](rng, size)
+                else:
+                    drawn = np.full(size, -1, dtype=np.int16)
+            elif samplers[p] is not None:
+                drawn = _draw_position(rng, samplers[p], weights, taken, alive)
+            else:
+                drawn = np.full(size, -1, dtype=np.int16)
+            drew = drawn >= 0
+
+            if not allow_repeats and shares_later[p]:
+                if drew.all():
+                    taken_flat[row_offsets + drawn] = True
+                else:
+                    taken_flat[row_offsets[drew] + drawn[drew]] = True
+
+            chunk[:, p] = drawn
+            if shared_reversal[p] is not None:
+                reversed_chunk[:, p] = rng.random(size, dtype=np.float32) < shared_reversal[p]
+            else:
+                reversed_chunk[:, p] = (
+                    rng.random(size, dtype=np.float32) < reversal[np.maximum(drawn, 0)]
+                )
+            alive &= drew
+
+        done = slice(start, start + size)
+        if alive.all():
+            cards[done] = columns[chunk]
+            flipped[done] = reversed_chunk
+        else:
+            cards[done][alive] = columns[chunk[alive]]
+            flipped[done][alive] = reversed_chunk[alive]
+
+    return SimulationResult(
+        spread_id=spread_id,
+        position_names=[pos.get("name", "") for pos in spread_def.positions],
+        cards=cards,
+        reversed=flipped,
+    )
+
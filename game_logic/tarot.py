@@ -1,9 +1,14 @@
 """Tarot game classes."""
 
-import random
+import bisect
 import json
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
+
+from game_logic.meanings import MEANING_STORE
+from game_logic.rng import get_rng
 
 
 # Helper function to normalize suit names
@@ -19,8 +24,8 @@ def normalize_suit(suit: str) -> str:
     return mapping.get(suit, suit.lower())
 
 
-def _load_all_cards() -> list["Card"]:
-    """Load all 78 tarot cards from tarot-images.json."""
+def _load_card_specs() -> tuple["CardSpec", ...]:
+    """Load all 78 tarot card specs from tarot-images.json."""
     # Get the path to tarot-images.json relative to this file
     assets_path = (
         Path(__file__).parent.parent / "assets" / "images" / "tarot-images.json"
@@ -29,19 +34,33 @@ def _load_all_cards() -> list["Card"]:
     with open(assets_path, "r") as f:
         data = json.load(f)
 
-    cards = []
-    for card_data in data["cards"]:
+    specs = []
+    for index, card_data in enumerate(data["cards"]):
         # Parse number (it's a string in JSON)
         number = int(card_data["number"])
 
         # Normalize suit name
         suit = normalize_suit(card_data["suit"])
 
-        # Create card
-        card = Card(name=card_data["name"], suit=suit, number=number)
-        cards.append(card)
+        specs.append(
+            CardSpec(index=index, name=card_data["name"], suit=suit, number=number)
+        )
+
+    return tuple(specs)
+
 
-    return cards
+def _find_spec(name: str, suit: Optional[str] = None, number: Optional[int] = None) -> "CardSpec":
+    """Find the shared CardSpec for a card name (or suit + number).
+
+    Raises:
+        ValueError: If no card matches
+    """
+    spec = CARD_REGISTRY.by_name.get(name)
+    if spec is None and suit is not None and number is not None:
+        spec = CARD_REGISTRY.by_suit_number.get((suit, number))
+    if spec is None:
+        raise ValueError(f"Card '{name}' not found in tarot-images.json")
+    return spec
 
 
 def _load_spreads_config() -> dict:
@@ -63,28 +82,245 @@ def find_spread_by_id(spread_id: str) -> dict:
     Raises:
         ValueError: If spread_id not found
     """
-    for spread in SPREADS_CONFIG["spreads"]:
-        if spread["id"] == spread_id:
-            return spread
-    raise ValueError(f"Spread '{spread_id}' not found in spreads-config.json")
+    spread = _SPREAD_DATA_BY_ID.get(spread_id)
+    if spread is None:
+        raise ValueError(f"Spread '{spread_id}' not found in spreads-config.json")
+    return spread
 
 
-class Card:
-    def __init__(self, name, suit, number) -> None:
-        self.name = name
-        self.suit = suit
-        self.number = number
-        self.reversed = False
-        self.position = None
-        self._meaning_data = None  # Lazy load meaning JSON
+def _freeze(value):
+    """Recursively convert config dicts/lists to read-only mappings/tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _compile_spreads(config: dict) -> tuple[dict[str, "SpreadDef"], dict[str, str]]:
+    """Validate every spread and merge its layout coordinates, once.
+
+    Returns:
+        (spread defs keyed by id, error messages keyed by id for spreads
+        that failed validation or are repeated)
+
+    The first spread with a given id is the one used, as in
+    find_spread_by_id; later ones are only reported.
+    """
+    layouts = config["layouts"]
+    defs: dict[str, SpreadDef] = {}
+    errors: dict[str, str] = {}
+    seen: set[str] = set()
+
+    for spread_data in config["spreads"]:
+        spread_id = spread_data["id"]
+        if spread_id in seen:
+            # Keeps the first entry's own error if it failed validation
+            errors.setdefault(
+                spread_id,
+                f"Duplicate spread id '{spread_id}' in spreads-config.json (first one used)",
+            )
+            continue
+        seen.add(spread_id)
+
+        layout_name = spread_data["layout"]
+        if layout_name not in layouts:
+            errors[spread_id] = (
+                f"Layout '{layout_name}' not found in spreads-config.json"
+            )
+            continue
+
+        layout_positions = layouts[layout_name]["positions"]
+        if len(layout_positions) != len(spread_data["positions"]):
+            errors[spread_id] = (
+                f"Spread '{spread_id}' has {len(spread_data['positions'])} positions "
+                f"but layout '{layout_name}' has {len(layout_positions)}"
+            )
+            continue
+
+        # Merge position meaning + layout coords
+        positions = tuple(
+            _freeze(
+                {
+                    **pos_data,  # name, descriptions, keywords, rag_mapping, etc.
+                    **layout_pos,  # x, y, rotation (optional), zIndex (optional)
+                }
+            )
+            for pos_data, layout_pos in zip(spread_data["positions"], layout_positions)
+        )
+
+        defs[spread_id] = SpreadDef(
+            id=spread_id,
+            name=spread_data["name"],
+            description=spread_data["description"],
+            layout_name=layout_name,
+            card_size=spread_data["cardSize"],  # "large", "medium", "small"
+            aspect_ratio=spread_data["aspectRatio"],
+            category=spread_data["category"],
+            difficulty=spread_data["difficulty"],
+            positions=positions,
+        )
+
+    for spread_id, message in errors.items():
+        if spread_id in defs:
+            print(f"Warning: {message}")
+        else:
+            print(f"Warning: Spread '{spread_id}' is unusable: {message}")
+
+    return defs, errors
+
+
+def get_spread_def(spread_id: str) -> "SpreadDef":
+    """Return the precompiled definition for a spread.
+
+    Raises:
+        ValueError: If spread_id is unknown or failed validation at load time
+    """
+    spread_def = SPREAD_DEFS.get(spread_id)
+    if spread_def is None:
+        if spread_id in SPREAD_ERRORS:
+            raise ValueError(SPREAD_ERRORS[spread_id])
+        raise ValueError(f"Spread '{spread_id}' not found in spreads-config.json")
+    return spread_def
+
+
+class CardSpec:
+    """Immutable description of one of the 78 tarot cards.
+
+    Specs are loaded once into CARD_SPECS and shared by every deck, reading
+    and game session in the process. Anything that changes per draw
+    (orientation, position) lives on DrawnCard instead, so a spec is never
+    mutated and never needs copying.
+    """
+
+    __slots__ = ("index", "name", "suit", "number", "code")
+
+    def __init__(self, index: int, name: str, suit: str, number: int) -> None:
+        object.__setattr__(self, "index", index)
+        object.__setattr__(self, "name", name)
+        object.__setattr__(self, "suit", suit)
+        object.__setattr__(self, "number", number)
+        object.__setattr__(self, "code", _card_code(suit, number))
+
+    def __setattr__(self, key, value) -> None:
+        raise AttributeError("CardSpec is immutable")
+
+    def __delattr__(self, key) -> None:
+        raise AttributeError("CardSpec is immutable")
 
     def __repr__(self) -> str:
-        return f"Card({self.name}, {self.suit})"
+        return f"CardSpec({self.name}, {self.suit})"
+
+    # Specs are shared flyweights: copies (including the engine's undo
+    # snapshots) and pickles resolve back to the canonical instance.
+    def __copy__(self) -> "CardSpec":
+        return self
+
+    def __deepcopy__(self, memo) -> "CardSpec":
+        return self
+
+    def __reduce__(self):
+        return (_spec_at, (self.index,))
+
+    def is_major(self) -> bool:
+        return self.suit == "major"
+
+    def is_minor(self) -> bool:
+        return self.suit != "major" and self.number <= 10
+
+    def is_court(self) -> bool:
+        return self.suit != "major" and self.number > 10
+
+    def _get_code(self) -> str:
+        """Return the filename code (e.g., 'm00', 'c05', 'w12')."""
+        return self.code
+
+    def get_image_filename(self) -> str:
+        """Return the full path to the card's image file."""
+        # Return path relative to game root
+        return f"assets/images/cards_wikipedia/{self.code}.jpg"
+
+    def get_meaning_filename(self) -> str:
+        """Return the full path to the card's meaning JSON file."""
+        # Return path relative to game root
+        return f"assets/text/card_meanings/{self.code}.json"
+
+    def to_save_dict(self) -> dict:
+        """Serialize a card spec by identity (it is restored from CARD_SPECS)."""
+        return {"name": self.name, "suit": self.suit, "number": self.number}
+
+    @classmethod
+    def from_save_dict(cls, data: dict) -> "CardSpec":
+        """Restore the shared spec for a saved card."""
+        return _find_spec(data["name"], data.get("suit"), data.get("number"))
+
+
+def _card_code(suit: str, number: int) -> str:
+    """Generate the filename code (e.g., 'm00', 'c05', 'w12')."""
+    if suit == "major":
+        return f"m{number:02d}"
+    elif suit == "cups":
+        return f"c{number:02d}"
+    elif suit == "swords":
+        return f"s{number:02d}"
+    elif suit == "wands":
+        return f"w{number:02d}"
+    elif suit == "pentacles":
+        return f"p{number:02d}"
+    else:
+        raise ValueError(f"Unknown suit: {suit}")
+
+
+def _spec_at(index: int) -> CardSpec:
+    """Return the shared spec at an index (used when unpickling)."""
+    return CARD_SPECS[index]
+
+
+class DrawnCard:
+    """A single card as drawn into a reading.
+
+    Holds only the index of its shared CardSpec plus the per-draw state
+    (orientation and position), so every draw is a few bytes and no two
+    sessions ever share a mutable card. Exposes the same attributes and
+    methods story code used on the old mutable Card.
+    """
+
+    __slots__ = ("spec_index", "reversed", "position")
+
+    def __init__(
+        self, spec_index: int, reversed: bool = False, position: Optional[str] = None
+    ) -> None:
+        self.spec_index = spec_index
+        self.reversed = reversed
+        self.position = position
+
+    @property
+    def spec(self) -> CardSpec:
+        return CARD_SPECS[self.spec_index]
+
+    @property
+    def name(self) -> str:
+        return CARD_SPECS[self.spec_index].name
+
+    @property
+    def suit(self) -> str:
+        return CARD_SPECS[self.spec_index].suit
+
+    @property
+    def number(self) -> int:
+        return CARD_SPECS[self.spec_index].number
+
+    @property
+    def code(self) -> str:
+        return CARD_SPECS[self.spec_index].code
+
+    def __repr__(self) -> str:
+        return f"DrawnCard({self.name}, {self.suit})"
 
     def set_reversed(self, is_reversed) -> None:
         self.reversed = is_reversed
 
-    def in_position(self, position) -> "Card":
+    def in_position(self, position) -> "DrawnCard":
         self.position = position
         return self  # Allow chaining
 
@@ -93,62 +329,33 @@ class Card:
         return f"{prefix}{self.name}"
 
     def is_major(self) -> bool:
-        return self.suit == "major"
+        return self.spec.is_major()
 
     def is_minor(self) -> bool:
-        return self.suit != "major" and self.number <= 10
+        return self.spec.is_minor()
 
     def is_court(self) -> bool:
-        return self.suit != "major" and self.number > 10
+        return self.spec.is_court()
 
     def _get_code(self) -> str:
-        """Generate the filename code (e.g., 'm00', 'c05', 'w12')."""
-        if self.suit == "major":
-            return f"m{self.number:02d}"
-        elif self.suit == "cups":
-            return f"c{self.number:02d}"
-        elif self.suit == "swords":
-            return f"s{self.number:02d}"
-        elif self.suit == "wands":
-            return f"w{self.number:02d}"
-        elif self.suit == "pentacles":
-            return f"p{self.number:02d}"
-        else:
-            raise ValueError(f"Unknown suit: {self.suit}")
+        """Return the filename code (e.g., 'm00', 'c05', 'w12')."""
+        return self.code
 
     def get_image_filename(self) -> str:
         """Return the full path to the card's image file."""
-        code = self._get_code()
-        # Return path relative to game root
-        return f"assets/images/cards_wikipedia/{code}.jpg"
+        return self.spec.get_image_filename()
 
     def get_meaning_filename(self) -> str:
         """Return the full path to the card's meaning JSON file."""
-        code = self._get_code()
-        # Return path relative to game root
-        return f"assets/text/card_meanings/{code}.json"
+        return self.spec.get_meaning_filename()
 
     def get_meaning_data(self) -> dict:
-        """Load and cache card meaning JSON.
+        """Return the card's full meaning data from the shared meaning store.
 
         Returns:
             Dict with core_meanings, position_interpretations, etc.
         """
-        if self._meaning_data is None:
-            meaning_file = self.get_meaning_filename()
-            meaning_path = Path(__file__).parent.parent / meaning_file
-
-            try:
-                with open(meaning_path, "r") as f:
-                    self._meaning_data = json.load(f)
-            except FileNotFoundError:
-                print(f"Warning: Meaning file not found: {meaning_path}")
-                self._meaning_data = {}
-            except json.JSONDecodeError:
-                print(f"Warning: Invalid JSON in meaning file: {meaning_path}")
-                self._meaning_data = {}
-
-        return self._meaning_data
+        return MEANING_STORE.card_data(self.code)
 
     def get_core_meaning(self) -> dict:
         """Get core meaning based on reversed state.
@@ -156,12 +363,7 @@ class Card:
         Returns:
             Dict with essence, keywords, psychological, spiritual, practical, shadow
         """
-        data = self.get_meaning_data()
-        if not data or "core_meanings" not in data:
-            return {}
-
-        orientation = "reversed" if self.reversed else "upright"
-        return data["core_meanings"].get(orientation, {})
+        return MEANING_STORE.core_meaning(self.code, self.reversed)
 
     def get_position_meaning(self, rag_mapping: str) -> str:
         """Get position-specific meaning based on RAG mapping.
@@ -172,24 +374,26 @@ class Card:
         Returns:
             Position-specific interpretation string (or empty if not found)
         """
-        data = self.get_meaning_data()
-        if not data or "position_interpretations" not in data:
-            return ""
+        return MEANING_STORE.position_meaning(self.code, rag_mapping, self.reversed)
+
+    def get_question_context(self, context: str) -> str:
+        """Get the reading for a question context based on reversed state.
 
-        # Navigate nested dict: temporal_positions.past
-        parts = rag_mapping.split(".")
-        meaning = data["position_interpretations"]
+        Args:
+            context: Question context like "love" or "career"
 
-        for part in parts:
-            if not isinstance(meaning, dict):
-                return ""
-            meaning = meaning.get(part, {})
+        Returns:
+            Context-specific interpretation string (or empty if not found)
+        """
+        return MEANING_STORE.question_context(self.code, context, self.reversed)
 
-        if not isinstance(meaning, dict):
-            return ""
+    def get_card_relationships(self) -> dict:
+        """Get how this card combines with other cards.
 
-        orientation = "reversed" if self.reversed else "upright"
-        return meaning.get(orientation, "")
+        Returns:
+            Dict keyed by relationship type ("amplifies", ...) then card_id
+        """
+        return MEANING_STORE.card_relationships(self.code)
 
     def to_save_dict(self) -> dict:
         """
@@ -203,31 +407,136 @@ class Card:
             "number": self.number,
             "reversed": self.reversed,
             "suit": self.suit,
+            "position": self.position,
         }
 
     @classmethod
-    def from_save_dict(cls, data: dict) -> "Card":
+    def from_save_dict(cls, data: dict) -> "DrawnCard":
         """
         Restore a card from saved data.
 
         This method is called automatically by the engine when loading.
-        It goes through __init__, so validation runs!
+        Accepts saves from both DrawnCard and the older Card format, and
+        always returns a DrawnCard pointing at the shared spec.
         """
-        card = cls(
-            name=data["name"],
-            suit=data["suit"],
-            number=data["number"],
+        spec = _find_spec(data["name"], data.get("suit"), data.get("number"))
+        return DrawnCard(
+            spec.index,
+            reversed=data.get("reversed", False),
+            position=data.get("position"),
         )
-        card.set_reversed(data.get("reversed", False))
 
-        return card
+
+class Card(DrawnCard):
+    """Backwards-compatible constructor: Card(name, suit, number).
+
+    Builds a DrawnCard for the named card. Kept so story code and saves
+    that refer to Card keep working.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, name, suit, number) -> None:
+        super().__init__(_find_spec(name, suit, number).index)
+
+
+class CardRegistry:
+    """Hash indexes over the shared card spec table, built once at import.
+
+    Lookups by name, file code, suit or number are dictionary hits, and
+    suit/number-range queries slice precomputed per-suit tuples instead of
+    filtering the whole deck.
+    """
+
+    def __init__(self, specs: tuple[CardSpec, ...]) -> None:
+        self.specs = specs
+        self.by_name: dict[str, CardSpec] = {s.name: s for s in specs}
+        self.by_code: dict[str, CardSpec] = {s.code: s for s in specs}
+        self.by_suit_number: dict[tuple[str, int], CardSpec] = {
+            (s.suit, s.number): s for s in specs
+        }
+
+        by_suit: dict[str, list[CardSpec]] = {}
+        by_number: dict[int, list[CardSpec]] = {}
+        for spec in specs:
+            by_suit.setdefault(spec.suit, []).append(spec)
+            by_number.setdefault(spec.number, []).append(spec)
+
+        # Suits keep file order; each suit's cards are sorted by number so
+        # number ranges are a bisect + slice
+        self.by_suit: dict[str, tuple[CardSpec, ...]] = {
+            suit: tuple(sorted(cards, key=lambda s: s.number))
+            for suit, cards in by_suit.items()
+        }
+        self.by_number: dict[int, tuple[CardSpec, ...]] = {
+            number: tuple(cards) for number, cards in by_number.items()
+        }
+        self._suit_numbers: dict[str, list[int]] = {
+            suit: [s.number for s in cards] for suit, cards in self.by_suit.items()
+        }
+
+    def get(self, name: str) -> Optional[CardSpec]:
+        """Return the spec for a card name, or None."""
+        return self.by_name.get(name)
+
+    def suit(self, suit_name: str) -> tuple[CardSpec, ...]:
+        """Return every card in a suit (accepts 'Cups' or 'cups')."""
+        return self.by_suit.get(normalize_suit(suit_name), ())
+
+    def number_range(
+        self, min_num: int, max_num: int, suit_filter: Optional[str] = None
+    ) -> list[CardSpec]:
+        """Return cards numbered min_num..max_num (inclusive), optionally in one suit."""
+        if suit_filter:
+            suits = [normalize_suit(suit_filter)]
+        else:
+            suits = list(self.by_suit)
+
+        result = []
+        for suit in suits:
+            numbers = self._suit_numbers.get(suit)
+            if numbers is None:
+                continue
+            lo = bisect.bisect_left(numbers, min_num)
+            hi = bisect.bisect_right(numbers, max_num)
+            result.extend(self.by_suit[suit][lo:hi])
+        return result
+
+
+@dataclass(frozen=True, slots=True)
+class SpreadDef:
+    """A validated spread with layout coordinates merged into each position.
+
+    Built once per spread at import and shared by every Spread view.
+    Positions are read-only mappings.
+    """
+
+    id: str
+    name: str
+    description: str
+    layout_name: str
+    card_size: str
+    aspect_ratio: float
+    category: str
+    difficulty: str
+    positions: tuple[Mapping[str, Any], ...]
+
+    # Shared and immutable: copies resolve back to the same definition
+    def __copy__(self) -> "SpreadDef":
+        return self
+
+    def __deepcopy__(self, memo) -> "SpreadDef":
+        return self
+
+    def __reduce__(self):
+        return (get_spread_def, (self.id,))
 
 
 class Spread:
     """A tarot spread loaded from spreads-config.json.
 
-    Combines layout coordinates with position meanings to create
-    a complete spread definition.
+    A lightweight view over a shared SpreadDef, which already combines
+    layout coordinates with position meanings.
     """
 
     def __init__(self, spread_id: str):
@@ -236,61 +545,143 @@ class Spread:
         Args:
             spread_id: The spread ID (e.g., "past-present-future")
         """
-        # Load spread data
-        spread_data = find_spread_by_id(spread_id)
+        self._def = get_spread_def(spread_id)
 
-        # Load referenced layout
-        layout_name = spread_data["layout"]
-        if layout_name not in SPREADS_CONFIG["layouts"]:
-            raise ValueError(f"Layout '{layout_name}' not found in spreads-config.json")
-        layout_data = SPREADS_CONFIG["layouts"][layout_name]
-
-        # Store metadata
-        self.id = spread_id
-        self.name = spread_data["name"]
-        self.description = spread_data["description"]
-        self.layout_name = layout_name
-        self.card_size = spread_data["cardSize"]  # "large", "medium", "small"
-        self.aspect_ratio = spread_data["aspectRatio"]
-        self.category = spread_data["category"]
-        self.difficulty = spread_data["difficulty"]
-
-        # Merge layout coordinates into position data
-        self.positions = []
-        for i, pos_data in enumerate(spread_data["positions"]):
-            layout_pos = layout_data["positions"][i]
-
-            # Merge position meaning + layout coords
-            merged = {
-                **pos_data,  # name, descriptions, keywords, rag_mapping, etc.
-                **layout_pos,  # x, y, rotation (optional), zIndex (optional)
-            }
-            self.positions.append(merged)
+    @property
+    def id(self) -> str:
+        return self._def.id
+
+    @property
+    def name(self) -> str:
+        return self._def.name
+
+    @property
+    def description(self) -> str:
+        return self._def.description
+
+    @property
+    def layout_name(self) -> str:
+        return self._def.layout_name
 
-    def get_positioned_cards(self, cards: list["Card"]) -> list[dict]:
+    @property
+    def card_size(self) -> str:
+        return self._def.card_size
+
+    @property
+    def aspect_ratio(self) -> float:
+        return self._def.aspect_ratio
+
+    @property
+    def category(self) -> str:
+        return self._def.category
+
+    @property
+    def difficulty(self) -> str:
+        return self._def.difficulty
+
+    @property
+    def positions(self) -> tuple[Mapping[str, Any], ...]:
+        return self._def.positions
+
+    def get_positioned_cards(self, cards: list["DrawnCard"]) -> list[dict]:
         """Combine drawn cards with their position data.
 
         Args:
-            cards: List of drawn Card objects
+            cards: List of DrawnCard objects
 
         Returns:
             List of dicts with 'card' plus all position data (x, y, name, etc.)
         """
-        positioned = []
-        for i, card in enumerate(cards):
-            if i < len(self.positions):
-                positioned.append(
-                    {
-                        "card": card,
-                        **self.positions[i],  # x, y, name, descriptions, keywords, etc.
-                    }
-                )
-        return positioned
+        positions = self._def.positions
+        return [
+            {
+                "card": card,
+                **positions[i],  # x, y, name, descriptions, keywords, etc.
+            }
+            for i, card in enumerate(cards[: len(positions)])
+        ]
+
+    # The view holds nothing mutable, so copies can share it
+    def __copy__(self) -> "Spread":
+        return self
+
+    def __deepcopy__(self, memo) -> "Spread":
+        return self
+
+    def to_save_dict(self) -> dict:
+        """Serialize a spread by id (it is rebuilt from the registry)."""
+        return {"id": self.id}
+
+    @classmethod
+    def from_save_dict(cls, data: dict) -> "Spread":
+        """Restore a spread view from its saved id."""
+        return cls(data["id"])
 
     def __repr__(self) -> str:
         return f"Spread({self.id}, {len(self.positions)} positions)"
 
 
+@dataclass(frozen=True, slots=True)
+class AliasTable:
+    """Walker/Vose alias table for O(1) weighted choice.
+
+    Built once per weighted deck. A draw picks a slot uniformly, then keeps
+    the slot's own item with probability prob[slot] or takes its alias, so
+    each item comes up with exactly weight / total weight.
+    """
+
+    items: tuple
+    weights: tuple[float, ...]
+    prob: tuple[float, ...]
+    alias: tuple[int, ...]
+
+    @classmethod
+    def build(cls, items, weights) -> "AliasTable":
+        """Build a table over items (duplicates allowed) with matching weights.
+
+        Raises:
+            ValueError: If a weight is negative or they don't sum to more than 0
+        """
+        weights = tuple(float(w) for w in weights)
+        if len(weights) != len(items):
+            raise ValueError(f"Got {len(weights)} weights for {len(items)} items")
+        if any(w < 0 for w in weights):
+            raise ValueError("Draw weights cannot be negative")
+        total = sum(weights)
+        if total <= 0:
+            raise ValueError("Draw weights must add up to more than 0")
+
+        n = len(weights)
+        scaled = [w * n / total for w in weights]
+        prob = [1.0] * n
+        alias = list(range(n))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            prob[less] = scaled[less]
+            alias[less] = more
+            scaled[more] += scaled[less] - 1.0
+            (small if scaled[more] < 1.0 else large).append(more)
+        # Whatever is left is 1 up to rounding error, so it keeps its own slot
+
+        return cls(tuple(items), weights, tuple(prob), tuple(alias))
+
+    # Immutable, so undo snapshots can share one table
+    def __copy__(self) -> "AliasTable":
+        return self
+
+    def __deepcopy__(self, memo) -> "AliasTable":
+        return self
+
+    def sample(self, rng):
+        """Draw one item."""
+        slot = int(rng.random() * len(self.prob))
+        if rng.random() < self.prob[slot]:
+            return self.items[slot]
+        return self.items[self.alias[slot]]
+
+
 class Deck:
     """Construct a Deck of Cards, either full or partial."""
 
@@ -298,6 +689,7 @@ class Deck:
         self,
         cards: Optional[list[str]] = None,
         reversals: Optional[list[float | int]] = None,
+        weights: Optional[list[float | int]] = None,
     ) -> None:
         """Create a deck (full or constrained) of tarot cards for drawing.
 
@@ -308,59 +700,156 @@ class Deck:
         reversals (optional): List of reversal chance (int or float) for each card in either
             cards or the full 78-card deck. Must be the same length as either cards or len==78.
             0 -> only upright, 1 -> only reversed, between 0 and 1 is chance for reversal.
+        weights (optional): List of relative draw weights, same length rules as reversals.
+            Without weights every card is equally likely.
+
+        Raises:
+            ValueError: If weights are negative or all 0
         """
         self.cards_raw = cards
-        self.cards = []
         self.reversals = reversals
-        self._construct_deck()
-
-        if reversals and len(reversals) == len(self.cards):
-            self.reversal_map = dict(zip(self.cards, reversals))
+        self.weights = weights
+        self._set_cards(self._construct_deck())
+
+    def _construct_deck(self) -> list[CardSpec]:
+        if not self.cards_raw:
+            # The specs are immutable, so the deck only needs its own list
+            return list(ALL_CARDS)
+
+        specs = []
+        for card_name in self.cards_raw:
+            spec = CARD_REGISTRY.get(card_name)
+            if spec is None:
+                print(f"Warning: Card '{card_name}' not found in ALL_CARDS")
+                continue
+            specs.append(spec)
+        return specs
+
+    def _set_cards(self, specs) -> None:
+        self.cards = list(specs)
+
+        if self.reversals and len(self.reversals) == len(self.cards):
+            self.reversal_map = dict(zip(self.cards, self.reversals))
         else:
             self.reversal_map = None
 
-    def _construct_deck(self):
-        if self.cards_raw:
-            for card_name in self.cards_raw:
-                matching_cards = [c for c in ALL_CARDS if c.name == card_name]
-                if not matching_cards:
-                    print(f"Warning: Card '{card_name}' not found in ALL_CARDS")
-                self.cards.extend(matching_cards)
-        else:
-            # Make a copy of ALL_CARDS to avoid modifying the original
-            self.cards = ALL_CARDS.copy()
+        self.draw_weights = None
+        self._alias = None
+        if self.weights:
+            if len(self.weights) == len(self.cards):
+                self.draw_weights = [float(w) for w in self.weights]
+                self._alias = AliasTable.build(self.cards, self.draw_weights)
+            else:
+                print(
+                    f"Warning: Got {len(self.weights)} draw weights for "
+                    f"{len(self.cards)} cards, drawing uniformly"
+                )
+
+    def _alias_table(self) -> Optional[AliasTable]:
+        """The deck's alias table, or None for a uniform deck.
+
+        Saves only keep public attributes, so a loaded deck rebuilds it here.
+        """
+        table = getattr(self, "_alias", None)
+        if table is None and getattr(self, "draw_weights", None):
+            table = self._alias = AliasTable.build(self.cards, self.draw_weights)
+        return table
+
+    def reversal_probability(self, spec: CardSpec) -> float:
+        """Probability that a draw of this card comes up reversed."""
+        chance = self.reversal_map[spec] if self.reversal_map else 0.5
+        return min(max(float(chance), 0.0), 1.0)
+
+    def _is_reversed(self, spec: CardSpec, rng) -> bool:
+        return rng.random() < self.reversal_probability(spec)
 
-    def draw_card(self) -> Card:
-        """Draw a card from the deck"""
+    def _choose_spec(self, rng, exclude: int = 0) -> Optional[CardSpec]:
+        """Pick a card by draw weight, skipping specs in the exclude mask.
+
+        Returns None if the deck is empty or every card in it is excluded.
+        """
         if not self.cards:
-            raise ValueError("Cannot draw from an empty deck")
-        card = random.choice(self.cards)
+            return None
+        table = self._alias_table()
+        if not exclude:
+            return table.sample(rng) if table else rng.choice(self.cards)
+
+        # Rejection sampling: a few retries almost always land on a free card
+        # in a real spread, without building a filtered copy of the deck
+        for _ in range(8):
+            spec = table.sample(rng) if table else rng.choice(self.cards)
+            if not exclude >> spec.index & 1:
+                return spec
+
+        # Mostly-excluded (or exhausted) deck, so choose from what is left
+        if table is None:
+            remaining = [spec for spec in self.cards if not exclude >> spec.index & 1]
+            return rng.choice(remaining) if remaining else None
+        remaining, weights = [], []
+        for spec, weight in zip(table.items, table.weights):
+            if weight > 0 and not exclude >> spec.index & 1:
+                remaining.append(spec)
+                weights.append(weight)
+        return rng.choices(remaining, weights)[0] if remaining else None
 
-        if self.reversal_map:
-            card_reversal_chance = self.reversal_map[card]
-        else:
-            card_reversal_chance = 0.5
+    @classmethod
+    def _from_specs(cls, specs) -> "Deck":
+        """Build a deck straight from registry specs, skipping name lookup."""
+        deck = cls.__new__(cls)
+        deck.cards_raw = None
+        deck.reversals = None
+        deck.weights = None
+        deck._set_cards(specs)
+        return deck
 
-        if random.randint(0, 1) <= card_reversal_chance:
-            card.set_reversed(True)
+    def draw_card(self, exclude: int = 0, rng=None) -> DrawnCard:
+        """Draw a card from the deck.
+
+        Args:
+            exclude: Bitmask of spec indexes that must not be drawn (bit n
+                for CardSpec.index n). The deck itself is left untouched.
+            rng: random.Random to draw with (default: the session's, see get_rng)
+        """
+        if rng is None:
+            rng = get_rng()
+        spec = self._choose_spec(rng, exclude)
+        if spec is None:
+            if not self.cards:
+                raise ValueError("Cannot draw from an empty deck")
+            raise ValueError("Every card in the deck has already been drawn")
 
-        return card
+        return DrawnCard(spec.index, reversed=self._is_reversed(spec, rng))
 
-    def draw_cards(self, count=1) -> list[Card]:
-        """Draw multiple cards from the deck."""
+    def draw_cards(self, count=1, rng=None) -> list[DrawnCard]:
+        """Draw multiple cards from the deck.
+
+        Args:
+            count: Number of distinct cards to draw
+            rng: random.Random to draw with (default: the session's, see get_rng)
+        """
+        if rng is None:
+            rng = get_rng()
         if count > len(self.cards):
             raise ValueError(
                 f"Cannot draw {count} cards from deck with only {len(self.cards)} cards"
             )
 
-        cards_drawn = random.sample(self.cards, count)
-
-        for card in cards_drawn:
-            card_reversal_chance = self.reversal_map[card] if self.reversal_map else 0.5
-            if random.randint(0, 1) <= card_reversal_chance:
-                card.set_reversed(True)
-
-        return cards_drawn
+        if self._alias_table() is None:
+            specs = rng.sample(self.cards, count)
+        else:
+            # Weighted draws without replacement, one card at a time
+            specs = []
+            drawn_mask = 0
+            for _ in range(count):
+                spec = self._choose_spec(rng, drawn_mask)
+                if spec is None:
+                    raise ValueError(
+                        f"Cannot draw {count} cards, deck only has {len(specs)} drawable cards"
+                    )
+                specs.append(spec)
+                drawn_mask |= 1 << spec.index
+
+        return [DrawnCard(spec.index, reversed=self._is_reversed(spec, rng)) for spec in specs]
 
     @classmethod
     def from_names(cls, card_names: list[str]) -> "Deck":
@@ -370,17 +859,12 @@ class Deck:
     @classmethod
     def major_only(cls) -> "Deck":
         """Create a deck containing only major arcana cards."""
-        deck = cls()
-        deck.cards = [c for c in ALL_CARDS if c.is_major()]
-        return deck
+        return cls._from_specs(CARD_REGISTRY.suit("major"))
 
     @classmethod
     def suit(cls, suit_name: str) -> "Deck":
         """Create a deck containing only cards from a specific suit."""
-        deck = cls()
-        normalized_suit = normalize_suit(suit_name)
-        deck.cards = [c for c in ALL_CARDS if c.suit == normalized_suit]
-        return deck
+        return cls._from_specs(CARD_REGISTRY.suit(suit_name))
 
     @classmethod
     def numbers(
@@ -393,15 +877,9 @@ class Deck:
             max_num: Maximum card number (inclusive)
             suit_filter: Optional suit to filter by (e.g., 'cups', 'major')
         """
-        deck = cls()
-        filtered = [c for c in ALL_CARDS if min_num <= c.number <= max_num]
-
-        if suit_filter:
-            normalized_suit = normalize_suit(suit_filter)
-            filtered = [c for c in filtered if c.suit == normalized_suit]
-
-        deck.cards = filtered
-        return deck
+        return cls._from_specs(
+            CARD_REGISTRY.number_range(min_num, max_num, suit_filter)
+        )
 
 
 class Reading:
@@ -430,42 +908,64 @@ class Reading:
         else:
             self.decks = decks
 
-    def draw_cards(self) -> list["Card"]:
+    def draw_cards(self, rng=None) -> list["DrawnCard"]:
         """Draw cards for each position in the spread.
 
+        Args:
+            rng: random.Random to draw with (default: the session's, see get_rng)
+
         Returns:
             The list of drawn cards
         """
+        if rng is None:
+            rng = get_rng()
+
+        # Cards already in the reading, as a bitmask of spec indexes. Decks
+        # are never filtered, so the same Deck can be reused elsewhere.
+        drawn_mask = 0
+        for c in self.drawn_cards:
+            drawn_mask |= 1 << c.spec_index
+
         for p in range(len(self.spread.positions)):
             if not self.allow_repeats:
-                self.decks[p].cards = [
-                    c for c in self.decks[p].cards if c not in self.drawn_cards
-                ]
-
-                if not self.decks[p].cards:
+                try:
+                    card = self.decks[p].draw_card(exclude=drawn_mask, rng=rng)
+                except ValueError:
                     raise Exception(f"No cards available for position {p}")
             else:  # Repeats allowed
-                pass
+                card = self.decks[p].draw_card(rng=rng)
 
-            self.drawn_cards.append(self.decks[p].draw_card())
+            card.in_position(self.spread.positions[p].get("name"))
+            self.drawn_cards.append(card)
+            drawn_mask |= 1 << card.spec_index
 
+        self._positioned = None
         return self.drawn_cards
 
-    def get_positioned_cards(self) -> list[dict]:
+    def get_positioned_cards(self) -> tuple[Mapping[str, Any], ...]:
         """Get drawn cards merged with their position data AND meanings.
 
+        Built once per draw and cached, so rendering the same reading again
+        (or opening a card's details) doesn't re-resolve meanings. Entries
+        are read-only mappings shared by every caller.
+
         Returns:
-            List of dicts with 'card', position data (x, y, name, descriptions),
-            and meaning data (core_meaning, position_meaning)
+            One mapping per card with 'card', position data (x, y, name,
+            descriptions), and meaning data (core_meaning, position_meaning)
         """
-        positioned = self.spread.get_positioned_cards(self.drawn_cards)
+        key = tuple((card.spec_index, card.reversed) for card in self.drawn_cards)
+        cached = getattr(self, "_positioned", None)
+        if cached is None or cached[0] != key:
+            cached = self._positioned = (key, self._build_positioned_cards())
+        return cached[1]
 
-        # Enhance with meaning data
-        for card_data in positioned:
+    def _build_positioned_cards(self) -> tuple[Mapping[str, Any], ...]:
+        positioned = []
+        for card_data in self.spread.get_positioned_cards(self.drawn_cards):
             card = card_data["card"]
 
             # Get core meaning (upright/reversed)
-            card_data["core_meaning"] = card.get_core_meaning()
+            card_data["core_meaning"] = _freeze(card.get_core_meaning())
 
             # Get position-specific meaning using RAG mapping
             rag_mapping = card_data.get("rag_mapping", "")
@@ -474,14 +974,22 @@ class Reading:
             else:
                 card_data["position_meaning"] = ""
 
-        return positioned
+            positioned.append(MappingProxyType(card_data))
+        return tuple(positioned)
+
+    # The positioned-card cache holds read-only mappings, which can't be
+    # copied; undo snapshots and pickles drop it and rebuild on demand
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state.pop("_positioned", None)
+        return state
 
     def __repr__(self) -> str:
         return f"Reading({self.spread.id}, {len(self.drawn_cards)} cards drawn)"
 
 
 # Service function for drawing cards
-def draw_cards(count=3):
+def draw_cards(count=3, rng=None):
     """Draw random cards from the full deck.
 
     This is a convenience function that creates a full deck and draws from it.
@@ -489,23 +997,41 @@ def draw_cards(count=3):
 
     Args:
         count: Number of cards to draw (default 3)
+        rng: random.Random to draw with (default: the session's, see get_rng)
 
     Returns:
-        List of drawn Card objects, with random reversals applied
+        List of DrawnCard objects, with random reversals applied
     """
+    if rng is None:
+        rng = get_rng()
+
     deck = Deck()  # Full 78-card deck
-    drawn = deck.draw_cards(count)
+    drawn = deck.draw_cards(count, rng=rng)
 
     # Random reversals (30% chance per card)
     for card in drawn:
-        if random.random() < 0.3:
+        if rng.random() < 0.3:
             card.set_reversed(True)
 
     return drawn
 
 
-# Initialize ALL_CARDS by loading from tarot-images.json
-ALL_CARDS = _load_all_cards()
+# Initialize the shared card spec table by loading from tarot-images.json
+CARD_SPECS = _load_card_specs()
+
+# Older name for the spec table, still used by Deck and story code
+ALL_CARDS = CARD_SPECS
+
+# Name/code/suit/number indexes over the spec table
+CARD_REGISTRY = CardRegistry(CARD_SPECS)
 
 # Initialize SPREADS_CONFIG by loading from spreads-config.json
 SPREADS_CONFIG = _load_spreads_config()
+# First spread wins on a repeated id, as the linear search this replaced did
+_SPREAD_DATA_BY_ID: dict[str, dict] = {}
+for _spread in SPREADS_CONFIG["spreads"]:
+    _SPREAD_DATA_BY_ID.setdefault(_spread["id"], _spread)
+del _spread
+
+# Validated, merged spread definitions keyed by id (plus load-time errors)
+SPREAD_DEFS, SPREAD_ERRORS = _compile_spreads(SPREADS_CONFIG)
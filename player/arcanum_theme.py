@@ -16,7 +16,10 @@ Usage:
 
 import markdown as _md
 
-from nicegui import ui
+from nicegui import app, ui
+
+from asset_manifest import THEME_MANIFEST
+from story_meta import StoryMeta, choice_meta
 
 
 # ============================================================================
@@ -24,9 +27,14 @@ from nicegui import ui
 # ============================================================================
 
 
-def categorize_choices(choices: list) -> dict[str, list[tuple[int, dict]]]:
+def categorize_choices(
+    choices: list, story_meta: StoryMeta | None = None
+) -> dict[str, list[tuple[int, dict]]]:
     """Sort a list of passage choices into buckets by their tags.
 
+    With the story's StoryMeta, each choice's bucket is a table lookup;
+    without it, the tags are classified on the spot.
+
     Returns a dict with keys: 'client', 'special', 'meta', 'regular'.
     Each value is a list of (original_index, choice_dict) tuples.
     """
@@ -38,19 +46,11 @@ def categorize_choices(choices: list) -> dict[str, list[tuple[int, dict]]]:
     }
 
     for i, choice in enumerate(choices):
-        tags = choice.get("tags", [])
-        has_client = any(tag.startswith("CLIENT") for tag in tags)
-        is_special = any("SPECIAL" in tag for tag in tags)
-        is_meta = any(tag.startswith("META") for tag in tags)
-
-        if has_client and is_special:
-            buckets["special"].append((i, choice))
-        elif has_client:
-            buckets["client"].append((i, choice))
-        elif is_meta:
-            buckets["meta"].append((i, choice))
+        if story_meta is not None:
+            category = story_meta.choice(choice).category
         else:
-            buckets["regular"].append((i, choice))
+            category = choice_meta(choice.get("tags", [])).category
+        buckets[category].append((i, choice))
 
     return buckets
 
@@ -212,32 +212,19 @@ def inject_theme():
     """Inject fonts, CSS, and animations into the page head.
     Call this ONCE at the top of your NiceGUI app, before building any UI.
 
-    Expects arcanum_styles.css to be served as a static file.
-    Set up with:
-        app.add_static_files("/theme", str(Path(__file__).parent))
+    Serves the stylesheets from /theme (see THEME_MANIFEST) and links them
+    by content hash, so browsers cache them until they change.
     """
-    from pathlib import Path
-
-    # Serve this directory as static files (if not already done)
-    try:
-        from nicegui import app
-
-        theme_dir = str(Path(__file__).parent)
-        app.add_static_files("/theme", theme_dir)
-    except Exception:
-        pass  # May already be registered
+    THEME_MANIFEST.serve(app)
 
     # Load the external stylesheets (shared=True so it works with @ui.page)
-    import time
-    _css_v = int(time.time())
-    ui.add_head_html(
-        f'<link rel="stylesheet" href="/theme/arcanum_styles.css?v={_css_v}">', shared=True
-    )
-    # Card CSS for SVG tarot cards (theme-reactive via --card-* variables)
-    ui.add_head_html(
-        '<link rel="stylesheet" href="/theme/cards/arcanum_cards_base.css">',
-        shared=True,
-    )
+    for stylesheet in (
+        "arcanum_styles.css",
+        # Card CSS for SVG tarot cards (theme-reactive via --card-* variables)
+        "cards/arcanum_cards_base.css",
+    ):
+        href = THEME_MANIFEST.url(stylesheet) or f"/theme/{stylesheet}"
+        ui.add_head_html(f'<link rel="stylesheet" href="{href}">', shared=True)
 
 
 # ============================================================================
@@ -579,11 +566,14 @@ def client_info_strip(
             )
 
 
-def stat_row(label: str, value: str):
-    """Render a sidebar stat row (e.g., Reputation: Newcomer)."""
+def stat_row(label: str, value: str) -> ui.label:
+    """Render a sidebar stat row (e.g., Reputation: Newcomer).
+
+    Returns the value label, so the row can be updated in place.
+    """
     with ui.element("div").classes("arc-stat-row"):
         ui.label(label).classes("arc-stat-label")
-        ui.label(value).classes("arc-stat-value")
+        return ui.label(value).classes("arc-stat-value")
 
 
 def card_detail_panel(
@@ -611,6 +601,8 @@ def card_detail_panel(
 def inject_stagger_script():
     """Inject the JS that powers staggered paragraph reveals.
     Call once after inject_theme().
+
+    Also defines arcApply(), which applies a ClientCommands batch.
     """
     ui.add_head_html(
         """
@@ -625,6 +617,24 @@ def inject_stagger_script():
             }, (i + 1) * (delayMs || 180));
         });
     }
+
+    // Run fn once the element exists: the update that creates it may
+    // still be rendering when a command batch arrives
+    function whenMounted(id, fn, frames = 60) {
+        if (document.getElementById(id)) fn();
+        else if (frames > 0) requestAnimationFrame(() => whenMounted(id, fn, frames - 1));
+    }
+
+    function arcApply(batch) {
+        const root = document.documentElement;
+        for (const [name, value] of Object.entries(batch.attrs)) {
+            if (value === null) root.removeAttribute(name);
+            else root.setAttribute(name, value);
+        }
+        for (const [id, delayMs] of batch.reveal) {
+            whenMounted(id, () => revealStaggered(id, delayMs));
+        }
+    }
     </script>
     """,
         shared=True,
@@ -936,6 +946,7 @@ def show_readers_desk(
     make_choice_fn,
     show_save_fn,
     navigate_fn,
+    story_meta: StoryMeta | None = None,
 ):
     """Build the complete Reader's Desk hub screen.
 
@@ -950,6 +961,8 @@ def show_readers_desk(
         make_choice_fn: Callable(int) to make a choice
         show_save_fn: Callable to show save dialog
         navigate_fn: Callable(str) to navigate to a screen
+        story_meta: The story's StoryMeta, for choice categories and client
+            var: bindings (classified from tags if None)
     """
     # ---- State: track active tab and selected artifact ----
     # Using a mutable dict so closures can update it
@@ -1009,23 +1022,23 @@ def show_readers_desk(
             pass
 
     # Categorize choices, then enrich client entries with flavor/trust data
-    buckets = categorize_choices(output.choices if output else [])
+    buckets = categorize_choices(output.choices if output else [], story_meta)
 
     def _enrich(idx, choice):
         """Extract client metadata from engine state via var: tags."""
-        tags = choice.get("tags", [])
+        if story_meta is not None:
+            var_name = story_meta.choice(choice).client_var
+        else:
+            var_name = choice_meta(choice.get("tags", [])).client_var
         flavor, trust, session_text = "", 0, ""
-        for tag in tags:
-            if tag.startswith("var:"):
-                var_name = tag.split(":", 1)[1]
-                client_obj = state.get(var_name)
-                if client_obj:
-                    flavor = getattr(client_obj, "flavor_text", "")
-                    trust = getattr(client_obj, "trust", 0)
-                    completed = getattr(client_obj, "sessions_completed", 0)
-                    total = getattr(client_obj, "total_sessions", 3)
-                    session_text = f"Session {completed + 1} of {total}"
-                break
+        if var_name:
+            client_obj = state.get(var_name)
+            if client_obj:
+                flavor = getattr(client_obj, "flavor_text", "")
+                trust = getattr(client_obj, "trust", 0)
+                completed = getattr(client_obj, "sessions_completed", 0)
+                total = getattr(client_obj, "total_sessions", 3)
+                session_text = f"Session {completed + 1} of {total}"
         return {
             "index": idx,
             "name": choice["text"],
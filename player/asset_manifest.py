@@ -0,0 +1,398 @@
+"""
+AssetManifest - Content-hashed URLs for files under assets/ and the theme.
+
+Card renders used to pass filesystem paths to ui.image(), which makes
+NiceGUI register a separate route for every image it is given, and they
+stat()ed each image on every render to check it exists. The manifest
+walks assets/ once at startup and records each file's content hash, so
+render code can:
+
+    url = card_image_url(card)   # "/assets/images/...jpg?v=<hash>" or None
+
+with no filesystem access, and the browser loads every image from the one
+/assets route.
+
+serve() registers that route. A request carrying the file's current
+hash is served as immutable for a year; anything else keeps NiceGUI's
+one-hour max-age. ETags are the content hash, so revalidation survives a
+redeploy that only touches mtimes. A file changed after startup no
+longer matches its entry and falls back to Starlette's ETag and the
+short max-age until the server restarts.
+
+Card scans are far larger than any slot they are shown in, so
+assets/images/card_sizes.py writes smaller AVIF/WebP/JPEG copies next to
+them (in a sized/ folder). The manifest indexes those copies, and
+card_image_html() renders a <picture> whose srcsets list every copy, so
+the browser fetches the smallest one that covers the slot:
+
+    ui.html(card_image_html(card, "144px", style))
+
+THEME_MANIFEST does the same for the stylesheets and card files in
+player/, served at /theme: inject_theme() links the CSS by its hash
+instead of a per-restart timestamp, so browsers keep one copy until it
+actually changes. Only the listed static file types are served from
+there, never the player's Python source.
+
+Text assets (stylesheets, card HTML, JSON) can be compressed ahead of
+time:
+
+    python player/asset_manifest.py
+
+writes a .gz sibling (and .br, if the brotli package is installed) next
+to each one. The manifest notes which siblings are current at startup,
+and the route serves the best one the browser accepts with its
+Content-Encoding set, so nothing is compressed per request.
+"""
+
+import gzip
+import hashlib
+import html
+import mimetypes
+import os
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+from urllib.parse import parse_qs
+
+from fastapi import HTTPException, Request
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Scope
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+PLAYER_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = PLAYER_DIR.parent
+
+# Digest characters kept in URLs and ETags
+HASH_LENGTH = 16
+SHORT_CACHE = "public, max-age=3600"  # NiceGUI's add_static_files default
+IMMUTABLE_CACHE = "public, max-age=31536000, immutable"
+
+# Copies written by assets/images/card_sizes.py: <dir>/sized/<stem>-<width>.<ext>,
+# listed in <source> order (the browser takes the first type it supports)
+SIZED_PATTERN = re.compile(r"^(?P<dir>.+)/sized/(?P<stem>[^/]+)-(?P<width>\d+)\.(?P<ext>avif|webp|jpg)$")
+SIZED_TYPES = {"avif": "image/avif", "webp": "image/webp", "jpg": "image/jpeg"}
+
+# Text assets worth precompressing, and the Content-Encoding -> sibling
+# suffix of each precompressed copy, in order of preference
+COMPRESSIBLE = frozenset({".css", ".html", ".js", ".json", ".svg", ".txt"})
+PRECOMPRESSED = {"br": ".br", "gzip": ".gz"}
+
+
+@dataclass(frozen=True, slots=True)
+class AssetEntry:
+    """One file's content hash and the stat it was hashed at."""
+
+    digest: str
+    size: int
+    mtime_ns: int
+    encodings: tuple[str, ...] = ()  # Current precompressed siblings, best first
+
+    def matches(self, stat_result: os.stat_result) -> bool:
+        """Whether the file on disk is still the one that was hashed."""
+        return (self.size, self.mtime_ns) == (stat_result.st_size, stat_result.st_mtime_ns)
+
+
+class AssetManifest:
+    """Relative path -> content hash for every file under an asset directory."""
+
+    def __init__(
+        self,
+        root: str | Path,
+        url_prefix: str = "/assets",
+        suffixes: Optional[tuple[str, ...]] = None,
+    ):
+        """Hash every file under root.
+
+        Args:
+            root: Directory served at url_prefix
+            url_prefix: URL path the directory is served at
+            suffixes: If given, only files with these suffixes are hashed and served
+        """
+        self.root = Path(root).resolve()
+        self.url_prefix = url_prefix.rstrip("/")
+        self.suffixes = suffixes
+        self.entries: dict[str, AssetEntry] = {}
+        if self.root.is_dir():
+            for path in sorted(self.root.rglob("*")):
+                if path.is_file() and self.serves(path) and path.suffix not in PRECOMPRESSED.values():
+                    stat = path.stat()
+                    with open(path, "rb") as f:
+                        digest = hashlib.file_digest(f, "sha256").hexdigest()[:HASH_LENGTH]
+                    relative = path.relative_to(self.root).as_posix()
+                    self.entries[relative] = AssetEntry(
+                        digest, stat.st_size, stat.st_mtime_ns, _current_encodings(path, stat)
+                    )
+        else:
+            print(f"Warning: Asset directory not found: {self.root}")
+
+        # "<dir>/<stem>" -> extension -> [(width, relative path)], narrowest first
+        self.sized: dict[str, dict[str, list[tuple[int, str]]]] = {}
+        for relative in self.entries:
+            match = SIZED_PATTERN.match(relative)
+            if match:
+                formats = self.sized.setdefault(f"{match['dir']}/{match['stem']}", {})
+                formats.setdefault(match["ext"], []).append((int(match["width"]), relative))
+        for formats in self.sized.values():
+            for copies in formats.values():
+                copies.sort()
+
+    def serves(self, path: str | Path) -> bool:
+        """Whether a file type is served from this directory."""
+        return self.suffixes is None or Path(path).suffix.lower() in self.suffixes
+
+    def _relative(self, path: str | Path) -> str:
+        # Accept paths relative to the project root, like get_image_filename()
+        # ("assets/images/..."), or to the asset root ("images/...")
+        path = Path(path)
+        if not path.is_absolute():
+            from_project = PROJECT_ROOT / path
+            path = from_project if from_project.is_relative_to(self.root) else self.root / path
+        if not path.is_relative_to(self.root):
+            return ""
+        return path.relative_to(self.root).as_posix()
+
+    def url(self, path: str | Path) -> Optional[str]:
+        """Versioned URL of an asset, or None if it isn't in the manifest."""
+        relative = self._relative(path)
+        entry = self.entries.get(relative)
+        if entry is None:
+            return None
+        return f"{self.url_prefix}/{relative}?v={entry.digest}"
+
+    def srcsets(self, path: str | Path) -> dict[str, str]:
+        """srcset of an asset's sized copies per extension, in SIZED_TYPES order.
+
+        Empty if card_sizes.py hasn't been run for it.
+        """
+        stem = self._relative(path).rsplit(".", 1)[0]
+        formats = self.sized.get(stem, {})
+        return {
+            extension: ", ".join(
+                f"{self.url_prefix}/{relative}?v={self.entries[relative].digest} {width}w"
+                for width, relative in formats[extension]
+            )
+            for extension in SIZED_TYPES
+            if extension in formats
+        }
+
+    def serve(self, app: Any) -> None:
+        """Register the asset route on a NiceGUI/FastAPI app."""
+        handler = AssetFiles(self)
+
+        # HEAD as well as GET, as the StaticFiles mount this replaces answered both
+        @app.api_route(self.url_prefix + "/{path:path}", methods=["GET", "HEAD"])
+        async def asset_file(request: Request, path: str = "") -> Response:
+            if not self.serves(path):
+                raise HTTPException(status_code=404)
+            return await handler.get_response(path, request.scope)
+
+
+class AssetFiles(StaticFiles):
+    """StaticFiles with content-hash ETags and immutable versioned URLs."""
+
+    def __init__(self, manifest: AssetManifest):
+        self.manifest = manifest
+        super().__init__(directory=manifest.root)
+
+    def file_response(
+        self,
+        full_path: str | os.PathLike,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        relative = Path(full_path).relative_to(self.manifest.root).as_posix()
+        entry = self.manifest.entries.get(relative)
+        current = entry is not None and entry.matches(stat_result)
+        request_headers = Headers(scope=scope)
+
+        precompressed = None
+        if current and entry.encodings:
+            precompressed = _precompressed(full_path, entry, request_headers.get("accept-encoding", ""))
+        if precompressed is not None:
+            encoding, path, sibling_stat = precompressed
+            response = FileResponse(
+                path,
+                status_code=status_code,
+                media_type=mimetypes.guess_type(full_path)[0] or "application/octet-stream",
+                stat_result=sibling_stat,
+            )
+            response.headers["content-encoding"] = encoding
+        else:
+            response = FileResponse(full_path, status_code=status_code, stat_result=stat_result)
+
+        cache_control = SHORT_CACHE
+        if current:
+            # Each encoding is a different body, so it gets its own ETag
+            suffix = f"-{precompressed[0]}" if precompressed else ""
+            response.headers["etag"] = f'"{entry.digest}{suffix}"'
+            if entry.encodings:
+                response.headers["vary"] = "Accept-Encoding"
+            requested = parse_qs(scope.get("query_string", b"").decode("latin-1")).get("v")
+            if requested and requested[0] == entry.digest:
+                cache_control = IMMUTABLE_CACHE
+        response.headers["cache-control"] = cache_control
+
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
+
+
+def _current_encodings(path: Path, stat: os.stat_result) -> tuple[str, ...]:
+    """Encodings with a precompressed sibling at least as new as the file."""
+    if path.suffix.lower() not in COMPRESSIBLE:
+        return ()
+    encodings = []
+    for encoding, suffix in PRECOMPRESSED.items():
+        try:
+            if os.stat(f"{path}{suffix}").st_mtime_ns >= stat.st_mtime_ns:
+                encodings.append(encoding)
+        except OSError:
+            pass
+    return tuple(encodings)
+
+
+def _precompressed(
+    full_path: str | os.PathLike, entry: AssetEntry, accept_encoding: str
+) -> Optional[tuple[str, str, os.stat_result]]:
+    """The best precompressed sibling the client accepts: (encoding, path, stat)."""
+    accepted = set()
+    for part in accept_encoding.lower().split(","):
+        name, _, params = part.partition(";")
+        q = params.strip().removeprefix("q=")
+        try:
+            if params and float(q) <= 0:
+                continue
+        except ValueError:
+            continue
+        accepted.add(name.strip())
+    for encoding in entry.encodings:
+        if encoding in accepted:
+            path = f"{full_path}{PRECOMPRESSED[encoding]}"
+            try:
+                return encoding, path, os.stat(path)
+            except OSError:
+                pass  # Removed since startup; serve the file itself
+    return None
+
+
+# Built once at startup, shared by every client
+ASSET_MANIFEST = AssetManifest(PROJECT_ROOT / "assets")
+THEME_MANIFEST = AssetManifest(
+    PLAYER_DIR, "/theme", suffixes=(".css", ".html", ".png", ".svg")
+)
+_card_urls: dict[str, Optional[str]] = {}
+
+
+def card_image_url(card: Any) -> Optional[str]:
+    """Versioned /assets URL of a card's image, or None if it has no image file.
+
+    Works for anything with get_image_filename() (CardSpec, DrawnCard).
+    """
+    try:
+        filename = card.get_image_filename()
+    except AttributeError:
+        return None
+    url = _card_urls.get(filename)
+    if url is None and filename not in _card_urls:
+        url = _card_urls[filename] = ASSET_MANIFEST.url(filename)
+    return url
+
+
+_card_html: dict[tuple[str, str, str, str], Optional[str]] = {}
+
+
+def card_image_html(card: Any, sizes: str, style: str = "") -> Optional[str]:
+    """<picture> markup for a card's image, or None if it has no image file.
+
+    Args:
+        card: Anything with get_image_filename() and a name
+        sizes: The img sizes attribute, i.e. the slot's CSS width ("144px")
+        style: Inline style for the <img>
+    """
+    url = card_image_url(card)
+    if url is None:
+        return None
+    alt = getattr(card, "name", "")
+    key = (url, sizes, style, alt)
+    markup = _card_html.get(key)
+    if markup is None:
+        srcsets = ASSET_MANIFEST.srcsets(card.get_image_filename())
+        sources = "".join(
+            f'<source type="{SIZED_TYPES[extension]}" srcset="{srcset}" sizes="{sizes}">'
+            for extension, srcset in srcsets.items()
+            if extension != "jpg"
+        )
+        # The scan stays the src for browsers without srcset support; the
+        # JPEG copies are the <img> srcset for those without AVIF/WebP
+        img_srcset = f' srcset="{srcsets["jpg"]}" sizes="{sizes}"' if "jpg" in srcsets else ""
+        markup = _card_html[key] = (
+            f'<picture style="display: contents;">{sources}'
+            f'<img src="{url}"{img_srcset} alt="{html.escape(alt)}" decoding="async" '
+            f'style="display: block; {style}"></picture>'
+        )
+    return markup
+
+
+def precompress(manifest: AssetManifest) -> dict[str, list[int]]:
+    """Write .gz/.br siblings for a manifest's compressible files.
+
+    Siblings that aren't smaller than the file are left out, and ones at
+    least as new as their file are kept.
+
+    Returns:
+        Suffix -> [files, bytes, gzip bytes, brotli bytes]; a file without
+        a smaller copy counts its own size for that encoding
+    """
+    compressors = {"gzip": lambda data: gzip.compress(data, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        compressors["br"] = lambda data: brotli.compress(data, quality=11)
+
+    report: dict[str, list[int]] = {}
+    for relative, entry in manifest.entries.items():
+        path = manifest.root / relative
+        suffix = path.suffix.lower()
+        if suffix not in COMPRESSIBLE:
+            continue
+        data = path.read_bytes()
+        totals = report.setdefault(suffix, [0, 0, 0, 0])
+        totals[0] += 1
+        totals[1] += len(data)
+        for column, encoding in ((2, "gzip"), (3, "br")):
+            sibling = Path(f"{path}{PRECOMPRESSED[encoding]}")
+            compress = compressors.get(encoding)
+            if compress is None:
+                totals[column] += len(data)
+                continue
+            if sibling.exists() and sibling.stat().st_mtime_ns >= entry.mtime_ns:
+                totals[column] += min(sibling.stat().st_size, len(data))
+                continue
+            compressed = compress(data)
+            if len(compressed) < len(data):
+                sibling.write_bytes(compressed)
+                totals[column] += len(compressed)
+            else:
+                sibling.unlink(missing_ok=True)
+                totals[column] += len(data)
+    return report
+
+
+if __name__ == "__main__":
+    if brotli is None:
+        print("brotli is not installed (pip install brotli): writing .gz siblings only")
+    for manifest in (ASSET_MANIFEST, THEME_MANIFEST):
+        report = precompress(manifest)
+        print(f"{manifest.url_prefix} ({manifest.root}):")
+        for suffix, (files, raw, gz, br) in sorted(report.items()):
+            line = f"  {suffix:<6} {files:4} files {raw / 1024:8.1f} KiB -> gzip {gz / 1024:7.1f} KiB ({gz / raw:4.0%})"
+            if brotli is not None:
+                line += f", br {br / 1024:7.1f} KiB ({br / raw:4.0%})"
+            print(line)
+    print("Restart the player to serve the new copies.")
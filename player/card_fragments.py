@@ -0,0 +1,117 @@
+"""
+CardFragmentCache - Rendered reading cards, shared by every session.
+
+_render_single_card used to decide between the SVG card, the card image
+and the placeholder, and rebuild that markup and its reversal style, for
+every card of a reading on every render: each choice that re-shows a
+reading, and every card style toggle (which rebuilds the UI). The result
+depends only on the card, its orientation, the slot width, the card
+style and the SVG ID instance, so the cache keeps a bounded LRU of those
+keys -> ready HTML for the whole process, and a repeat reading is a
+dictionary lookup per card.
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+from asset_manifest import card_image_html
+from card_renderer import render_svg_card_html
+
+PLACEHOLDER_HTML = (
+    '<div style="width: 100%; height: 128px; display: flex; '
+    'align-items: center; justify-content: center;">'
+    '<span style="font-size: 3em; color: var(--gold-dim);">&#10023;</span></div>'
+)
+
+
+@dataclass(frozen=True, slots=True)
+class CardFragment:
+    """A card face ready for ui.html()."""
+
+    html: str
+    svg: bool  # An Arcanum SVG card (drawn edge to edge, without padding)
+
+
+class CardFragmentCache:
+    """Bounded LRU of (code, reversed, width, style, instance) -> CardFragment."""
+
+    def __init__(self, maxsize: int = 2048):
+        self.maxsize = maxsize
+        self._fragments: OrderedDict[tuple, CardFragment] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(self, card: Any, width: int, style: str, instance: str = "") -> CardFragment:
+        """Return the face of a reading card.
+
+        Args:
+            card: A DrawnCard (or anything with code, reversed and the CardSpec fields)
+            width: Width of the card slot, in CSS px
+            style: Card style, 'arcanum' (SVG where one exists) or 'classic'
+            instance: SVG ID instance (see render_svg_card_html)
+        """
+        key = (card.code, bool(getattr(card, "reversed", False)), width, style, instance)
+        with self._lock:
+            fragment = self._fragments.get(key)
+            if fragment is not None:
+                self._fragments.move_to_end(key)
+                self.hits += 1
+                return fragment
+
+        fragment = _build_fragment(card, *key[1:])
+        with self._lock:
+            self.misses += 1
+            self._fragments[key] = fragment
+            if len(self._fragments) > self.maxsize:
+                self._fragments.popitem(last=False)
+                self.evictions += 1
+        return fragment
+
+    def stats(self) -> dict[str, int | float]:
+        """Counters for the debug page."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._fragments),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def clear(self) -> None:
+        """Drop every cached card and reset the counters."""
+        with self._lock:
+            self._fragments.clear()
+            self.hits = self.misses = self.evictions = 0
+
+
+def _build_fragment(card: Any, reversed_: bool, width: int, style: str, instance: str) -> CardFragment:
+    rotation_style = "transform: rotate(180deg);" if reversed_ else ""
+
+    # Try SVG card first (if arcanum style is active)
+    if style == "arcanum":
+        svg_html = render_svg_card_html(card, card.code, instance)
+        if svg_html is not None:
+            # Card height scales with width (tarot proportions ~1:1.73)
+            return CardFragment(
+                f'<div style="width: 100%; height: {int(width * 1.73)}px; {rotation_style}">'
+                f"{svg_html}</div>",
+                svg=True,
+            )
+
+    # Fall back to traditional image, inside the card's 8px padding
+    image_html = card_image_html(
+        card,
+        f"{width - 16}px",
+        f"width: 100%; height: auto; object-fit: contain; {rotation_style}",
+    )
+    return CardFragment(image_html or PLACEHOLDER_HTML, svg=False)
+
+
+# Shared by every client in this server process
+CARD_FRAGMENTS = CardFragmentCache()
@@ -3,108 +3,131 @@
 Loads card SVG illustrations from player/cards/svg/ and renders them
 inline with theme-reactive CSS variables. Falls back to traditional
 Rider-Waite images when an SVG card doesn't exist.
+
+Every illustration is read, minified and split at its IDs once, at
+import, so rendering a card is a join with its ID prefix and checking
+for one is a dict lookup. The frame around each illustration draws its
+corner ornaments from one shared <symbol> (see inject_card_symbols)
+instead of repeating their paths in every card.
 """
 
 import re
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Optional
+
+from nicegui import ui
 
 CARDS_DIR = Path(__file__).parent / "cards" / "svg"
 
-# Cache loaded SVG content to avoid re-reading files
-_svg_cache: dict[str, str] = {}
+_ILLUSTRATION = re.compile(r'<div class="illustration">\s*(<svg.*?</svg>)\s*</div>', re.DOTALL)
+_COMMENT = re.compile(r"<!--.*?-->", re.DOTALL)
+_BETWEEN_TAGS = re.compile(r">\s+<")
+_WHITESPACE = re.compile(r"\s+")
+_ID = re.compile(r'\bid="([^"]+)"')
 
+# Marks where the ID prefix goes in a compiled illustration
+_PREFIX_SLOT = "\0"
 
-def _load_card_svg(card_code: str) -> str | None:
-    """Load and return the SVG illustration for a card, or None if not found.
 
-    Args:
-        card_code: The card filename code (e.g., 'm00', 'm17', 'c01')
+@dataclass(frozen=True, slots=True)
+class CardSvg:
+    """A card illustration, minified and split at every ID it declares or references."""
 
-    Returns:
-        The inner SVG markup with prefixed gradient IDs, or None.
-    """
-    if card_code in _svg_cache:
-        return _svg_cache[card_code]
+    parts: tuple[str, ...]
 
-    html_path = CARDS_DIR / f"{card_code}.html"
-    if not html_path.exists():
-        _svg_cache[card_code] = None
-        return None
+    def render(self, prefix: str) -> str:
+        """The illustration with every gradient/filter ID prefixed."""
+        return prefix.join(self.parts)
 
-    raw = html_path.read_text()
 
-    # Extract the SVG inside <div class="illustration">...</div>
-    match = re.search(
-        r'<div class="illustration">\s*(<svg.*?</svg>)\s*</div>',
-        raw,
-        re.DOTALL,
-    )
+def _compile_card_svg(raw: str) -> Optional[CardSvg]:
+    """Extract, minify and split the illustration from a card's HTML file."""
+    match = _ILLUSTRATION.search(raw)
     if not match:
-        _svg_cache[card_code] = None
         return None
 
-    svg = match.group(1)
+    svg = _COMMENT.sub("", match.group(1))
+    svg = _WHITESPACE.sub(" ", _BETWEEN_TAGS.sub("><", svg)).strip()
+
+    # One pass over the SVG for all its IDs: declarations and the url(#...)
+    # and href="#..." references to them
+    ids = set(_ID.findall(svg))
+    if not ids:
+        return CardSvg((svg,))
+    alternatives = "|".join(re.escape(gid) for gid in sorted(ids, key=len, reverse=True))
+    references = re.compile(rf'(\bid="|url\(#|href="#)(?=(?:{alternatives})[")])')
+    return CardSvg(tuple(references.sub(rf"\1{_PREFIX_SLOT}", svg).split(_PREFIX_SLOT)))
+
 
-    # Prefix gradient/filter IDs to avoid collisions when multiple cards
-    # are on screen simultaneously. E.g., "sunglow" -> "m00-sunglow"
-    # Find all id="..." declarations
-    ids_found = re.findall(r'id="([^"]+)"', svg)
-    for gid in ids_found:
-        prefixed = f"{card_code}-{gid}"
-        # Replace the id declaration
-        svg = svg.replace(f'id="{gid}"', f'id="{prefixed}"')
-        # Replace all url(#...) references
-        svg = svg.replace(f"url(#{gid})", f"url(#{prefixed})")
+def _load_card_svgs() -> dict[str, CardSvg]:
+    """Compile every card illustration in CARDS_DIR."""
+    cards = {}
+    for html_path in sorted(CARDS_DIR.glob("*.html")):
+        compiled = _compile_card_svg(html_path.read_text())
+        if compiled is None:
+            print(f"Warning: No illustration found in {html_path.name}")
+        else:
+            cards[html_path.stem] = compiled
+    return cards
 
-    _svg_cache[card_code] = svg
-    return svg
+
+# Compiled once at import, shared by every client
+SVG_CARDS = _load_card_svgs()
 
 
 def has_svg_card(card_code: str) -> bool:
     """Check if an SVG card exists for the given code."""
-    return (CARDS_DIR / f"{card_code}.html").exists()
+    return card_code in SVG_CARDS
 
 
 def get_available_svg_cards() -> list[str]:
     """Return list of card codes that have SVG versions."""
-    return [p.stem for p in CARDS_DIR.glob("*.html")]
+    return list(SVG_CARDS)
+
 
+# Corner ornament paths, drawn in the top-left corner; the .corner-*
+# classes mirror them into the other three
+CORNER_PATHS = (
+    '<path d="M0 40 L0 12 Q0 0 12 0 L40 0" stroke="var(--card-border)" stroke-width="1" fill="none" opacity="0.5"/>'
+    '<circle cx="10" cy="10" r="2.5" stroke="var(--card-border)" stroke-width="0.5" fill="none" opacity="0.4"/>'
+    '<circle cx="10" cy="10" r="1" fill="var(--card-border)" opacity="0.3"/>'
+)
+
+# Defined once per page by inject_card_symbols(); every card's corners
+# <use> them, and the var(--card-*) colours resolve at each card
+CARD_SYMBOLS = (
+    '<svg aria-hidden="true" style="position: absolute; width: 0; height: 0; overflow: hidden;">'
+    f'<symbol id="arc-card-corner" viewBox="0 0 40 40">{CORNER_PATHS}</symbol>'
+    "</svg>"
+)
 
 # The shared card frame HTML — wraps any card's SVG illustration.
 # Uses the same CSS classes as the standalone HTML files.
-CARD_FRAME_TOP = """\
-<div class="card-frame size-game" style="width:100%; height:100%;">
-  <div class="border-outer"></div>
-  <div class="border-inner"></div>
-  <svg class="corner corner-tl" viewBox="0 0 40 40" fill="none">
-    <path d="M0 40 L0 12 Q0 0 12 0 L40 0" stroke="var(--card-border)" stroke-width="1" fill="none" opacity="0.5"/>
-    <circle cx="10" cy="10" r="2.5" stroke="var(--card-border)" stroke-width="0.5" fill="none" opacity="0.4"/>
-    <circle cx="10" cy="10" r="1" fill="var(--card-border)" opacity="0.3"/>
-  </svg>
-  <svg class="corner corner-tr" viewBox="0 0 40 40" fill="none">
-    <path d="M0 40 L0 12 Q0 0 12 0 L40 0" stroke="var(--card-border)" stroke-width="1" fill="none" opacity="0.5"/>
-    <circle cx="10" cy="10" r="2.5" stroke="var(--card-border)" stroke-width="0.5" fill="none" opacity="0.4"/>
-    <circle cx="10" cy="10" r="1" fill="var(--card-border)" opacity="0.3"/>
-  </svg>
-  <svg class="corner corner-bl" viewBox="0 0 40 40" fill="none">
-    <path d="M0 40 L0 12 Q0 0 12 0 L40 0" stroke="var(--card-border)" stroke-width="1" fill="none" opacity="0.5"/>
-    <circle cx="10" cy="10" r="2.5" stroke="var(--card-border)" stroke-width="0.5" fill="none" opacity="0.4"/>
-    <circle cx="10" cy="10" r="1" fill="var(--card-border)" opacity="0.3"/>
-  </svg>
-  <svg class="corner corner-br" viewBox="0 0 40 40" fill="none">
-    <path d="M0 40 L0 12 Q0 0 12 0 L40 0" stroke="var(--card-border)" stroke-width="1" fill="none" opacity="0.5"/>
-    <circle cx="10" cy="10" r="2.5" stroke="var(--card-border)" stroke-width="0.5" fill="none" opacity="0.4"/>
-    <circle cx="10" cy="10" r="1" fill="var(--card-border)" opacity="0.3"/>
-  </svg>
-  <div class="card-number">{number}</div>
-  <div class="card-name">{name}</div>
-  <div class="illustration">
-"""
+CARD_FRAME_TOP = (
+    '<div class="card-frame size-game" style="width:100%; height:100%;">'
+    '<div class="border-outer"></div>'
+    '<div class="border-inner"></div>'
+    + "".join(
+        f'<svg class="corner corner-{corner}" viewBox="0 0 40 40" fill="none">'
+        '<use href="#arc-card-corner"/></svg>'
+        for corner in ("tl", "tr", "bl", "br")
+    )
+    + '<div class="card-number">{number}</div>'
+    '<div class="card-name">{name}</div>'
+    '<div class="illustration">'
+)
+
+CARD_FRAME_BOTTOM = "</div></div>"
+
+
+def inject_card_symbols():
+    """Add the SVG symbols card frames reference to every page.
+
+    Call once at startup, with inject_theme().
+    """
+    ui.add_body_html(CARD_SYMBOLS, shared=True)
 
-CARD_FRAME_BOTTOM = """\
-  </div>
-</div>
-"""
 
 # Roman numerals for Major Arcana
 _ROMAN = [
@@ -113,19 +136,25 @@ _ROMAN = [
 ]
 
 
-def render_svg_card_html(card, card_code: str) -> str | None:
+def render_svg_card_html(card, card_code: str, instance: str = "") -> str | None:
     """Build the full card HTML (frame + illustration) for inline rendering.
 
+    Gradient/filter IDs are prefixed with the card code ("m00-sunglow"),
+    so different cards can share a page. A card shown more than once on a
+    page needs a distinct instance for each ("m00-p1-sunglow").
+
     Args:
-        card: A Card object with .name, .number, .suit, .reversed
+        card: A DrawnCard or CardSpec with .name, .number and .suit
         card_code: The card filename code (e.g., 'm00')
+        instance: Extra ID prefix, unique among copies of this card on a page
 
     Returns:
         Complete HTML string ready for ui.html(), or None if no SVG exists.
     """
-    svg = _load_card_svg(card_code)
-    if svg is None:
+    compiled = SVG_CARDS.get(card_code)
+    if compiled is None:
         return None
+    svg = compiled.render(f"{card_code}-{instance}-" if instance else f"{card_code}-")
 
     # Card number display
     if card.suit == "major":
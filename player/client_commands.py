@@ -0,0 +1,49 @@
+"""
+ClientCommands - One browser message per UI update for DOM side effects.
+
+Rendering a passage used to schedule a ui.timer per side effect (theme
+attribute, font size, paragraph reveal), each firing its own
+ui.run_javascript a few hundred milliseconds later. Every timer is a
+server-side element and task per click, and every call a separate
+websocket message.
+
+A GameSession queues those effects here while it builds the UI, and
+flushes them once the update is built: attribute changes are merged
+(last value wins) and everything goes out as a single arcApply() call.
+Messages queue in the client's outbox behind the element updates of the
+same handler, and arcApply (see inject_stagger_script) waits in the
+browser for reveal containers to be mounted, so no timer is needed on
+either side. Before the websocket connects, the outbox holds the message
+until it does.
+"""
+
+import json
+from typing import Optional
+
+from nicegui import Client
+
+
+class ClientCommands:
+    """Batches <html> attribute changes and paragraph reveals for one client."""
+
+    def __init__(self, client: Client):
+        self._client = client
+        self._attributes: dict[str, Optional[str]] = {}
+        self._reveals: dict[str, int] = {}
+
+    def set_attribute(self, name: str, value: Optional[str]) -> None:
+        """Set an attribute on <html> (None removes it)."""
+        self._attributes[name] = value
+
+    def reveal(self, container_id: str, delay_ms: int = 180) -> None:
+        """Reveal a container's .arc-stagger-p paragraphs one by one."""
+        self._reveals[container_id] = delay_ms
+
+    def flush(self) -> None:
+        """Send everything queued since the last flush as one message."""
+        if not self._attributes and not self._reveals:
+            return
+        batch = {"attrs": self._attributes, "reveal": list(self._reveals.items())}
+        self._attributes = {}
+        self._reveals = {}
+        self._client.run_javascript(f"arcApply({json.dumps(batch)});")
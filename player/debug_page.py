@@ -1,9 +1,9 @@
 """Debug mode for Arcanum — preview spreads, themes, and jump to game states."""
 
-import json
 import sys
 import types
 from pathlib import Path
+from urllib.parse import quote
 
 from nicegui import ui
 
@@ -19,9 +19,13 @@ from arcanum_theme import (
     inject_theme,
     motif,
 )
+from asset_manifest import card_image_html
+from card_fragments import CARD_FRAGMENTS
 from card_renderer import render_svg_card_html, has_svg_card
+from markdown_cache import PASSAGE_MARKDOWN
+from story_cache import STORY_CACHE, story_file
 from game_logic.artifacts import ARTIFACTS
-from game_logic.tarot import Deck, Spread
+from game_logic.tarot import CARD_REGISTRY, SPREAD_DEFS, SPREAD_ERRORS, Deck, Spread
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 STORY_ID = "arcanum"
@@ -59,13 +63,6 @@ def _apply_theme(theme_name: str):
     ui.run_javascript(js)
 
 
-def _load_all_spreads() -> list[dict]:
-    """Load spread IDs and metadata from spreads-config.json."""
-    with open(PROJECT_ROOT / "game_logic" / "spreads-config.json") as f:
-        data = json.load(f)
-    return data["spreads"]
-
-
 def _render_spread_preview(spread_id: str, card_size_override: str | None = None):
     """Render a single spread with sample cards for preview."""
     try:
@@ -120,15 +117,14 @@ def _render_spread_preview(spread_id: str, card_size_override: str | None = None
                     with ui.element("div").classes("arc-card").style(
                         "padding: 6px; width: 100%;"
                     ):
-                        image_path = card.get_image_filename()
-                        abs_path = PROJECT_ROOT / image_path
-                        if abs_path.exists():
-                            rot_style = (
-                                "transform: rotate(180deg);" if card.reversed else ""
-                            )
-                            ui.image(str(abs_path)).style(
-                                f"width: 100%; height: auto; object-fit: contain; {rot_style}"
-                            )
+                        rot_style = "transform: rotate(180deg);" if card.reversed else ""
+                        image_html = card_image_html(
+                            card,
+                            f"{card_width - 12}px",
+                            f"width: 100%; height: auto; object-fit: contain; {rot_style}",
+                        )
+                        if image_html:
+                            ui.html(image_html).style("width: 100%;")
                         else:
                             ui.html(
                                 '<span style="font-size: 2em; color: var(--gold-dim);">&#10023;</span>'
@@ -148,22 +144,26 @@ def _render_spread_preview(spread_id: str, card_size_override: str | None = None
 
 def _build_spread_gallery():
     """Render a gallery of all spreads."""
-    spreads_meta = _load_all_spreads()
+    # Spread config problems found when tarot.py loaded (duplicates still render)
+    for sid, message in SPREAD_ERRORS.items():
+        ui.label(f"{sid}: {message}").style(
+            "color: var(--accent); font-size: 13px; margin-bottom: 8px;"
+        )
 
     # Deduplicate by layout (show one spread per unique layout)
     seen_layouts = set()
     unique_spreads = []
-    for s in spreads_meta:
-        if s["layout"] not in seen_layouts:
-            seen_layouts.add(s["layout"])
+    for s in SPREAD_DEFS.values():
+        if s.layout_name not in seen_layouts:
+            seen_layouts.add(s.layout_name)
             unique_spreads.append(s)
 
-    for spread_data in unique_spreads:
-        sid = spread_data["id"]
-        name = spread_data["name"]
-        layout = spread_data["layout"]
-        n_positions = len(spread_data["positions"])
-        card_size = spread_data["cardSize"]
+    for spread_def in unique_spreads:
+        sid = spread_def.id
+        name = spread_def.name
+        layout = spread_def.layout_name
+        n_positions = len(spread_def.positions)
+        card_size = spread_def.card_size
 
         with ui.card().style(
             "background: var(--bg); border: 1px solid var(--gold-dim); "
@@ -239,18 +239,86 @@ def _build_quick_jump():
                     "font-size: 12px; text-transform: none;"
                 )
 
+    # Every passage in the compiled story. With a story pack the ids come
+    # from its index, without decoding any passage.
+    ui.label("All passages").style(
+        "font-family: var(--heading-font); font-size: 16px; "
+        "color: var(--gold); letter-spacing: 1px; margin-top: 12px;"
+    )
+    try:
+        passage_ids = STORY_CACHE.passage_ids(
+            story_file(PROJECT_ROOT / "compiled_stories", STORY_ID)
+        )
+    except (OSError, ValueError) as e:
+        ui.label(f"Could not read the compiled story: {e}").style(
+            "font-size: 13px; color: var(--accent);"
+        )
+        return
+
+    with ui.row().classes("gap-2 items-center"):
+        passage_select = ui.select(
+            passage_ids, with_input=True, label=f"{len(passage_ids)} passages"
+        ).style("min-width: 360px;")
+        ui.button(
+            "Open",
+            on_click=lambda: passage_select.value
+            and ui.navigate.to(
+                f"/debug/play?goto={quote(passage_select.value)}", new_tab=True
+            ),
+        ).props("flat outline").style(
+            "color: var(--gold-dim); border-color: var(--gold-dim); "
+            "font-size: 12px; text-transform: none;"
+        )
+
+
+def _build_cache_stats():
+    """Hit/miss counters for the process-wide caches shared by all players."""
+    ui.label(
+        "Counters since the server started, across every player."
+    ).style("font-size: 13px; color: var(--gold-dim); margin-bottom: 16px;")
+
+    stats_container = ui.column().classes("w-full").style("gap: 4px;")
+
+    def row(label: str, value: str):
+        with ui.row().classes("gap-4"):
+            ui.label(label).style(
+                "font-size: 12px; color: var(--gold-dim); width: 220px; "
+                "text-transform: uppercase; letter-spacing: 1px;"
+            )
+            ui.label(value).style("font-size: 13px; color: var(--fg);")
+
+    def refresh():
+        stats_container.clear()
+        md = PASSAGE_MARKDOWN.stats()
+        cards = CARD_FRAGMENTS.stats()
+        with stats_container:
+            row("Markdown paragraphs", f"{md['entries']:,} / {md['maxsize']:,} cached")
+            row("Markdown hits / misses", f"{md['hits']:,} / {md['misses']:,} ({md['hit_rate']:.1%} hits)")
+            row("Markdown evictions", f"{md['evictions']:,}")
+            row("Card faces", f"{cards['entries']:,} / {cards['maxsize']:,} cached")
+            row(
+                "Card face hits / misses",
+                f"{cards['hits']:,} / {cards['misses']:,} ({cards['hit_rate']:.1%} hits), "
+                f"{cards['evictions']:,} evictions",
+            )
+            row("Story loads (hits / parses)", f"{STORY_CACHE.hits:,} / {STORY_CACHE.misses:,}")
+
+    refresh()
+    ui.button("Refresh", on_click=refresh).props("flat outline").style(
+        "color: var(--gold-dim); border-color: var(--gold-dim); "
+        "font-size: 12px; margin-top: 12px;"
+    )
+
 
 def _build_deck_gallery():
     """Render the full 78-card deck with a toggle between Arcanum SVG and Classic."""
-    deck = Deck()
-
     # Group by suit
     groups = [
-        ("Major Arcana", [c for c in deck.cards if c.suit == "major"]),
-        ("Cups", [c for c in deck.cards if c.suit == "cups"]),
-        ("Swords", [c for c in deck.cards if c.suit == "swords"]),
-        ("Wands", [c for c in deck.cards if c.suit == "wands"]),
-        ("Pentacles", [c for c in deck.cards if c.suit == "pentacles"]),
+        ("Major Arcana", CARD_REGISTRY.suit("major")),
+        ("Cups", CARD_REGISTRY.suit("cups")),
+        ("Swords", CARD_REGISTRY.suit("swords")),
+        ("Wands", CARD_REGISTRY.suit("wands")),
+        ("Pentacles", CARD_REGISTRY.suit("pentacles")),
     ]
 
     # Style toggle — reactive
@@ -272,7 +340,7 @@ def _build_deck_gallery():
                     "margin-bottom: 24px;"
                 ):
                     for card in cards:
-                        card_code = card._get_code()
+                        card_code = card.code
                         has_svg = has_svg_card(card_code)
                         use_svg = style_state["current"] == "arcanum" and has_svg
 
@@ -285,7 +353,7 @@ def _build_deck_gallery():
                                 if use_svg:
                                     svg_html = render_svg_card_html(card, card_code)
                                     if svg_html:
-                                        ui.html(svg_html).style(
+                                        ui.html(svg_html, sanitize=False).style(
                                             "width: 100%; height: 100%;"
                                         )
                                     else:
@@ -310,12 +378,11 @@ def _build_deck_gallery():
 
     def _render_fallback_image(card):
         """Render the Rider-Waite image for a card."""
-        image_path = card.get_image_filename()
-        abs_path = PROJECT_ROOT / image_path
-        if abs_path.exists():
-            ui.image(str(abs_path)).style(
-                "width: 100%; height: 100%; object-fit: cover;"
-            )
+        image_html = card_image_html(
+            card, "120px", "width: 100%; height: 100%; object-fit: cover;"
+        )
+        if image_html:
+            ui.html(image_html).style("width: 100%; height: 100%;")
         else:
             ui.html(
                 '<span style="font-size: 2em; color: var(--gold-dim); '
@@ -458,6 +525,7 @@ def register_debug_routes():
                 themes_tab = ui.tab("Themes")
                 artifacts_tab = ui.tab("Artifacts")
                 jump_tab = ui.tab("Quick Play")
+                caches_tab = ui.tab("Caches")
 
             with ui.tab_panels(tabs, value=spreads_tab).classes("w-full").style(
                 "background: transparent;"
@@ -477,6 +545,9 @@ def register_debug_routes():
                 with ui.tab_panel(jump_tab):
                     _build_quick_jump()
 
+                with ui.tab_panel(caches_tab):
+                    _build_cache_stats()
+
     @ui.page("/debug/play")
     def debug_play(goto: str = "ReaderTable"):
         """Start a game session pre-jumped to a specific passage."""
@@ -492,7 +563,8 @@ def register_debug_routes():
         # Run until InitVars completes (it jumps to Start)
         # Then goto the requested passage
         try:
-            session.engine.goto(goto)
+            with session.rng_scope():
+                session.engine.goto(goto)
         except Exception as e:
             ui.notify(f"Failed to jump to '{goto}': {e}", type="negative")
             return
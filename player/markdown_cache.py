@@ -0,0 +1,151 @@
+"""
+MarkdownCache - Rendered passage paragraphs, shared by every session.
+
+show_player renders each passage paragraph from Markdown to HTML. Most
+paragraphs are authored prose that every player sees unchanged, and the
+same passage is re-rendered whenever the UI rebuilds (card style toggles,
+returning from the menu). The cache keeps a bounded LRU of paragraph
+text -> HTML for the whole process, and converts misses with one reused
+markdown.Markdown instead of building a new one per paragraph.
+
+Paragraphs that contain no story expressions are known as soon as a
+JSON story loads, so prerender_story() warms the cache with them in the
+background. Story packs are left lazy: their paragraphs are cached as
+players reach them.
+"""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+
+import markdown
+
+
+class MarkdownCache:
+    """Bounded LRU of Markdown paragraph -> HTML."""
+
+    def __init__(self, maxsize: int = 16384, extensions: tuple[str, ...] = ("nl2br",)):
+        self.maxsize = maxsize
+        self._md = markdown.Markdown(extensions=list(extensions))
+        self._html: OrderedDict[str, str] = OrderedDict()
+        # Guards the LRU and the shared Markdown instance (not thread-safe)
+        self._lock = threading.Lock()
+        self._prerendered: set[int] = set()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(self, text: str) -> str:
+        """Return the HTML for one Markdown paragraph."""
+        with self._lock:
+            html = self._html.get(text)
+            if html is not None:
+                self._html.move_to_end(text)
+                self.hits += 1
+                return html
+
+            self.misses += 1
+            html = self._md.reset().convert(text)
+            self._html[text] = html
+            if len(self._html) > self.maxsize:
+                self._html.popitem(last=False)
+                self.evictions += 1
+            return html
+
+    def prerender(self, paragraphs: Iterable[str]) -> int:
+        """Render paragraphs ahead of time, without evicting anything.
+
+        Returns:
+            Number of paragraphs added
+        """
+        added = 0
+        for text in paragraphs:
+            with self._lock:
+                if len(self._html) >= self.maxsize:
+                    break
+                if text in self._html:
+                    continue
+                # Oldest end of the LRU: prerendered text nobody has read
+                # yet goes before anything a player has actually seen
+                self._html[text] = self._md.reset().convert(text)
+                self._html.move_to_end(text, last=False)
+                added += 1
+        return added
+
+    def prerender_story(self, story_data: dict) -> None:
+        """Prerender a JSON story's static paragraphs on a background thread (once per story)."""
+        passages = story_data["passages"]
+        if not isinstance(passages, dict):
+            # A story pack decodes passages as they are visited; scanning
+            # them all here would undo that, so its paragraphs are cached
+            # as players reach them instead
+            return
+        with self._lock:
+            if id(passages) in self._prerendered:
+                return
+            self._prerendered.add(id(passages))
+
+        threading.Thread(
+            target=lambda: self.prerender(static_paragraphs(passages.values())),
+            name="markdown-prerender",
+            daemon=True,
+        ).start()
+
+    def stats(self) -> dict[str, int | float]:
+        """Counters for the debug page."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._html),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def clear(self) -> None:
+        """Drop every cached paragraph and reset the counters."""
+        with self._lock:
+            self._html.clear()
+            self._prerendered.clear()
+            self.hits = self.misses = self.evictions = 0
+
+
+def static_paragraphs(passages: Iterable[dict]) -> list[str]:
+    """Paragraphs made only of authored text, as show_player will split them.
+
+    Passage content is a token list; any expression, conditional or other
+    non-text token can change the text around it, so only paragraphs
+    bounded by blank lines (or the passage edges) within a run of plain
+    text tokens are static.
+    """
+    found: dict[str, None] = {}
+
+    def flush(run: list[str], at_start: bool, at_end: bool) -> None:
+        parts = "".join(run).split("\n\n")
+        first = 0 if at_start else 1
+        last = len(parts) if at_end else len(parts) - 1
+        for part in parts[first:last]:
+            part = part.strip()
+            if part:
+                found[part] = None
+
+    for passage in passages:
+        tokens = passage.get("content", [])
+        run: list[str] = []
+        run_start = 0
+        for i, token in enumerate(tokens):
+            if isinstance(token, dict) and token.get("type") == "text":
+                if not run:
+                    run_start = i
+                run.append(token.get("value", ""))
+            elif run:
+                flush(run, run_start == 0, False)
+                run = []
+        if run:
+            flush(run, run_start == 0, True)
+    return list(found)
+
+
+# Shared by every client in this server process
+PASSAGE_MARKDOWN = MarkdownCache()
@@ -1,9 +1,8 @@
-import json
 import sys
 import uuid
 from pathlib import Path
+from typing import Any, Mapping
 
-import markdown
 from arcanum_theme import (
     # Choice categorization (shared utility)
     categorize_choices,
@@ -22,7 +21,7 @@ from arcanum_theme import (
     show_readers_desk,
     stat_row,
 )
-from card_renderer import render_svg_card_html, has_svg_card
+from card_renderer import inject_card_symbols
 
 # Import from installed bardic package
 from bardic.runtime.engine import BardEngine
@@ -31,9 +30,17 @@ from nicegui import app, ui
 # Import local save manager (from same directory)
 sys.path.insert(0, str(Path(__file__).parent))
 from save_manager import BrowserSaveManager
+from asset_manifest import ASSET_MANIFEST, card_image_html
+from card_fragments import CARD_FRAGMENTS
+from client_commands import ClientCommands
+from markdown_cache import PASSAGE_MARKDOWN
+from story_cache import STORY_CACHE, story_file
+from story_meta import StoryMeta
 
 # Make sure to include game_logic directory
 sys.path.insert(0, str(Path(__file__).parent.parent))
+from game_logic.rng import STATE_KEY, RandomProxy, SessionRNG, use_rng, use_session_rng
+from game_logic.tarot import CardSpec, DrawnCard, Spread
 
 # ============================================================================
 # MODULE-LEVEL SETUP (runs once at import, shared across all clients)
@@ -42,12 +49,14 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 STORY_ID = "arcanum"
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 
-# Static files: accessible via URLs for all clients
-app.add_static_files("/assets", str(PROJECT_ROOT / "assets"))
+# Static files: accessible via URLs for all clients, with content-hashed
+# URLs from card_image_html() cached as immutable
+ASSET_MANIFEST.serve(app)
 
-# Theme CSS and stagger JS: injected into <head> for all pages
+# Theme CSS and stagger JS in <head>, card frame symbols in <body>, for all pages
 inject_theme()
 inject_stagger_script()
+inject_card_symbols()
 
 
 # ============================================================================
@@ -64,13 +73,21 @@ class GameSession:
 
     def __init__(self):
         self.engine: BardEngine | None = None
+        self.story_meta: StoryMeta | None = None
         self.current_screen: str = "landing"
         self.active_theme: str = "default"  # sticky — persists until a tag overrides it
         self.card_style: str = "arcanum"  # "arcanum" (SVG) or "classic" (Rider-Waite)
         self.font_size: str = "medium"  # "small", "medium", "large"
         self.main_container = None
+        # Player screen, kept mounted between passages (see show_player)
+        self.player_layout = None
+        self.sidebar_header = None
+        self.sidebar_theme: str | None = None
+        self.stat_labels: dict[str, ui.label] = {}
+        self.content_area = None
         self.card_drawer = None
         self.card_drawer_content = None
+        self.commands: ClientCommands | None = None
         self.save_manager = BrowserSaveManager()
 
     # ================================================================
@@ -79,6 +96,7 @@ class GameSession:
 
     def build(self):
         """Create the root UI elements and render the initial screen."""
+        self.commands = ClientCommands(ui.context.client)
         self.card_drawer, self.card_drawer_content = self._create_card_drawer()
         self.main_container = ui.column().classes(
             "w-full min-h-screen m-0 p-0 items-stretch"
@@ -104,27 +122,60 @@ class GameSession:
     # STORY LOADING
     # ================================================================
 
-    def load_story(self, story_path: str | Path | None = None):
-        """Load a compiled story JSON and create BardEngine instance."""
+    def load_story(self, story_path: str | Path | None = None, seed: int | None = None):
+        """Load a compiled story JSON and create BardEngine instance.
+
+        Args:
+            story_path: Compiled story JSON or story pack (default: the Arcanum
+                story, see story_file)
+            seed: Seed for this session's card draws and rolls (random if None)
+        """
         import types
 
         if story_path is None:
-            story_path = PROJECT_ROOT / "compiled_stories" / f"{STORY_ID}.json"
+            story_path = story_file(PROJECT_ROOT / "compiled_stories", STORY_ID)
 
-        with open(story_path) as f:
-            story_data = json.load(f)
+        # Parsed once per process and shared by every session; the engine
+        # keeps all per-player state in engine.state / engine.context
+        story_data = STORY_CACHE.get(story_path)
+        self.story_meta = STORY_CACHE.meta(story_path)
+        PASSAGE_MARKDOWN.prerender_story(story_data)
 
-        self.engine = BardEngine(story_data, context={})
+        # The engine runs the initial passage while it is constructed, before
+        # its state exists, so seed that first passage from the same generator
+        rng = SessionRNG(seed)
+        with use_rng(rng):
+            self.engine = BardEngine(story_data, context={})
+        self.engine.state[STATE_KEY] = rng
 
         # The engine's _execute_imports puts everything into state, including
         # modules (e.g. `import random`) and functions (e.g. `get_artifact`).
         # These can't be deepcopied, which breaks engine.snapshot().
         # Move them to context (available in eval but not snapshotted).
+        # Classes go too: saves store them as None, which would shadow the
+        # real class after loading.
         for key in list(self.engine.state):
             val = self.engine.state[key]
-            if isinstance(val, (types.ModuleType, types.FunctionType)):
+            if isinstance(val, (types.ModuleType, types.FunctionType, type)):
                 self.engine.context[key] = self.engine.state.pop(key)
 
+        # Drawn cards and spreads live in state even when the story never
+        # imports their classes by name; register them so saves restore them.
+        for cls in (CardSpec, DrawnCard, Spread, SessionRNG):
+            self.engine.context.setdefault(cls.__name__, cls)
+
+        # Story-level `random.choice(...)` calls draw from the session too
+        if isinstance(self.engine.context.get("random"), types.ModuleType):
+            self.engine.context["random"] = RandomProxy()
+
+    def rng_scope(self):
+        """Context manager routing card draws and rolls to this session's RNG.
+
+        Wrap every engine call that can run passage code (goto, choose,
+        submit_inputs, load_state) in it.
+        """
+        return use_session_rng(self.engine.state)
+
     # ================================================================
     # NAVIGATION
     # ================================================================
@@ -135,14 +186,20 @@ class GameSession:
         self.update_ui()
 
     def update_ui(self):
-        """Rebuild the UI based on current screen."""
-        self.main_container.clear()
-
-        with self.main_container:
-            if self.current_screen == "landing":
-                self.show_landing()
-            elif self.current_screen == "player":
-                self.show_player()
+        """Render the current screen.
+
+        The player screen updates its mounted layout in place (see
+        show_player); other screens are rebuilt from scratch. DOM side
+        effects queued while rendering go to the browser in one message.
+        """
+        if self.current_screen == "player":
+            self.show_player()
+        else:
+            self._clear_screen()
+            with self.main_container:
+                if self.current_screen == "landing":
+                    self.show_landing()
+        self.commands.flush()
 
     # ================================================================
     # LANDING PAGE
@@ -299,14 +356,26 @@ class GameSession:
             save_data = await self.save_manager.load_game(save_id)
 
             story_id = save_data.get("story_id", STORY_ID)
-            story_path = PROJECT_ROOT / "compiled_stories" / f"{story_id}.json"
+            story_path = story_file(PROJECT_ROOT / "compiled_stories", story_id)
 
             if not story_path.exists():
                 ui.notify(f"Story file not found: {story_id}", type="negative")
                 return
 
             self.load_story(story_path)
-            self.engine.load_state(save_data)
+
+            # Older saves recorded imported classes as None in state; drop
+            # anything the context provides so they don't shadow it
+            saved_state = save_data.get("state", {})
+            save_data = {
+                **save_data,
+                "state": {
+                    k: v for k, v in saved_state.items() if k not in self.engine.context
+                },
+            }
+
+            with self.rng_scope():
+                self.engine.load_state(save_data)
 
             ui.notify(f"Loaded: {save_data['save_name']}", type="positive")
             dialog.close()
@@ -321,71 +390,74 @@ class GameSession:
 
     def start_new_game(self):
         """Start a new game — load story and navigate to player."""
-        story_path = PROJECT_ROOT / "compiled_stories" / f"{STORY_ID}.json"
-        self.load_story(story_path)
+        self.load_story()
         self.navigate_to("player")
 
     def show_player(self):
-        """Player screen with sidebar layout."""
+        """Player screen with sidebar layout.
+
+        The layout is built once and stays mounted while the player moves
+        between passages: each call updates the sidebar pieces that changed
+        (theme header, stats) and replaces only the content region.
+        """
         output = self.engine.current()
 
         passage = self.engine.passages.get(output.passage_id, {})
-        passage_tags = passage.get("tags", [])
+        meta = self.story_meta.passage(output.passage_id)
 
         # Update sticky theme from passage tags (only if a tag is present)
-        if "DREAM:CYBERPUNK" in passage_tags or "DREAM:NYX" in passage_tags:
-            self.active_theme = "cyberpunk"
-        elif "DREAM:GOTHIC" in passage_tags or "DREAM:MANOR" in passage_tags:
-            self.active_theme = "gothic"
-        elif "DREAM:KIND" in passage_tags or "DREAM:BOOKSHOP" in passage_tags:
-            self.active_theme = "kind"
-        elif "DREAM:WEIRDWEST" in passage_tags:
-            self.active_theme = "weird_west"
-        elif "THEME:DEFAULT" in passage_tags or "UI:DASHBOARD" in passage_tags:
-            self.active_theme = "default"
+        if meta.theme is not None:
+            self.active_theme = meta.theme
         # Otherwise: keep self.active_theme as-is (sticky)
 
-        if "UI:DASHBOARD" in passage_tags:
-            # Apply default theme for dashboard
-            js = "document.documentElement.removeAttribute('data-theme');"
-            ui.timer(0.01, lambda: ui.run_javascript(js), once=True)
-            show_readers_desk(
-                self.engine,
-                output,
-                self.get_reader_stats,
-                self.make_choice,
-                self.show_save_dialog,
-                self.navigate_to,
-            )
+        if meta.dashboard:
+            self._clear_screen()
+            with self.main_container:
+                # Apply default theme for dashboard
+                self.commands.set_attribute("data-theme", None)
+                show_readers_desk(
+                    self.engine,
+                    output,
+                    self.get_reader_stats,
+                    self.make_choice,
+                    self.show_save_dialog,
+                    self.navigate_to,
+                    self.story_meta,
+                )
             return
 
-        theme = self.active_theme
-        t = get_theme(theme)
-        is_dream = theme != "default"
+        if self.player_layout is None:
+            self._clear_screen()
+            with self.main_container:
+                self._build_player_layout()
 
-        # Apply CSS theme and font size to the DOM
-        if theme == "default":
-            js = "document.documentElement.removeAttribute('data-theme');"
-        else:
-            js = f"document.documentElement.setAttribute('data-theme', '{theme}');"
-        js += f" document.documentElement.setAttribute('data-font-size', '{self.font_size}');"
-        ui.timer(0.01, lambda: ui.run_javascript(js), once=True)
+        self._update_sidebar()
+
+        self.content_area.clear()
+        with self.content_area:
+            self._render_passage(output, passage)
+
+    def _clear_screen(self):
+        """Remove the current screen, including a mounted player layout."""
+        self.main_container.clear()
+        self.player_layout = None
 
+    def _build_player_layout(self):
+        """Build the sidebar and an empty content region.
+
+        Passage-dependent parts are left empty for _update_sidebar and
+        _render_passage to fill.
+        """
         # --- Sidebar + Content Layout ---
         with ui.element("div").style(
             "display: flex; width: 100%; min-height: 100vh; margin: 0; padding: 0;"
-        ):
+        ) as self.player_layout:
             # === SIDEBAR ===
             with ui.element("div").classes("arc-sidebar"):
-                with ui.element("div").style("margin-bottom: 8px; opacity: 0.85;"):
-                    motif(theme=theme, size=56)
-
-                ui.label("ARCANUM").classes("arc-sidebar-title")
-
-                dream_badge = t.get("dream_badge", "")
-                if dream_badge:
-                    ui.label(dream_badge).classes("arc-dream-badge")
-                # ui.label("by katehlouie").classes("arc-sidebar-byline")
+                # Motif, title and dream badge; rebuilt when the theme changes.
+                # display: contents keeps them laid out as sidebar children.
+                self.sidebar_header = ui.element("div").style("display: contents;")
+                self.sidebar_theme = None
 
                 divider(width="80%")
 
@@ -412,12 +484,12 @@ class GameSession:
 
                 divider(width="80%")
 
-                # Stats from engine
-                stats = self.get_reader_stats()
+                # Stats from engine (values kept current by _update_sidebar)
                 with ui.element("div").style("width: 100%; padding: 0 8px;"):
-                    stat_row("Reputation", str(stats.get("reader_level", "Newcomer")))
-                    stat_row("Clients", str(stats.get("sessions_completed", 0)))
-                    stat_row("Savings", f"${stats.get('coins_earned', 0)}")
+                    self.stat_labels = {
+                        name: stat_row(name, value)
+                        for name, value in self._sidebar_stats().items()
+                    }
 
                 divider(width="80%")
 
@@ -464,60 +536,97 @@ class GameSession:
                     ).on("click", lambda: self.navigate_to("landing"))
 
             # === CONTENT AREA ===
-            with ui.element("div").classes("arc-content"):
-                with ui.element("div").classes("arc-content-inner arc-fade-in"):
-                    if is_dream:
-                        section_label("◆ Dream Session", dream=True)
-                    else:
-                        section_label("Story")
-
-                    passage_title = passage.get("title", "")
-                    if passage_title:
-                        heading(passage_title)
-
-                    # Staggered paragraph reveal
-                    container_id = f"passage-{uuid.uuid4().hex[:8]}"
-                    paragraphs = [
-                        p.strip() for p in output.content.split("\n\n") if p.strip()
-                    ]
-
-                    with ui.element("div").props(f'id="{container_id}"'):
-                        for para in paragraphs:
-                            para_html = markdown.markdown(para, extensions=["nl2br"])
-                            ui.html(para_html, sanitize=False).classes(
-                                "arc-body arc-stagger-p"
-                            ).style("margin-bottom: 18px;")
-
-                    # Render directives (card spreads, etc.)
-                    if (
-                        hasattr(output, "render_directives")
-                        and output.render_directives
-                    ):
-                        with ui.column().classes("w-full my-8"):
-                            for directive in output.render_directives:
-                                self.render_directive(directive)
-
-                    # Input directives
-                    if hasattr(output, "input_directives") and output.input_directives:
-                        self.render_input_form(output.input_directives)
-
-                    # Choices
-                    if output.choices:
-                        divider()
-                        self.render_choices(output.choices)
-                    else:
-                        ui.label("✧ THE END ✧").classes("arc-heading").style(
-                            "font-size: 28px; margin-top: 32px; text-align: center;"
-                        )
+            self.content_area = ui.element("div").classes("arc-content")
 
-                    # Trigger staggered reveal after DOM renders
-                    ui.timer(
-                        0.05,
-                        lambda cid=container_id: ui.run_javascript(
-                            f"revealStaggered('{cid}', 180);"
-                        ),
-                        once=True,
-                    )
+    def _sidebar_stats(self) -> dict[str, str]:
+        """Sidebar stat row label -> displayed value."""
+        stats = self.get_reader_stats()
+        return {
+            "Reputation": str(stats.get("reader_level", "Newcomer")),
+            "Clients": str(stats.get("sessions_completed", 0)),
+            "Savings": f"${stats.get('coins_earned', 0)}",
+        }
+
+    def _update_sidebar(self):
+        """Bring the mounted sidebar in line with the theme and reader stats.
+
+        Only what changed is sent to the browser: the header is rebuilt on a
+        theme change, and a stat label assigned its current text is a no-op.
+        The reader is read from engine.state on every call because undo and
+        loading a save replace the Reader object.
+        """
+        theme = self.active_theme
+        if theme != self.sidebar_theme:
+            self.sidebar_theme = theme
+            self.sidebar_header.clear()
+            with self.sidebar_header:
+                with ui.element("div").style("margin-bottom: 8px; opacity: 0.85;"):
+                    motif(theme=theme, size=56)
+
+                ui.label("ARCANUM").classes("arc-sidebar-title")
+
+                dream_badge = get_theme(theme).get("dream_badge", "")
+                if dream_badge:
+                    ui.label(dream_badge).classes("arc-dream-badge")
+                # ui.label("by katehlouie").classes("arc-sidebar-byline")
+
+            # Apply CSS theme and font size to the DOM
+            self.commands.set_attribute("data-theme", None if theme == "default" else theme)
+            self.commands.set_attribute("data-font-size", self.font_size)
+
+        for name, value in self._sidebar_stats().items():
+            self.stat_labels[name].text = value
+
+    def _render_passage(self, output, passage: dict):
+        """Render the current passage into the content region."""
+        is_dream = self.active_theme != "default"
+
+        with ui.element("div").classes("arc-content-inner arc-fade-in"):
+            if is_dream:
+                section_label("◆ Dream Session", dream=True)
+            else:
+                section_label("Story")
+
+            passage_title = passage.get("title", "")
+            if passage_title:
+                heading(passage_title)
+
+            # Staggered paragraph reveal
+            container_id = f"passage-{uuid.uuid4().hex[:8]}"
+            paragraphs = [
+                p.strip() for p in output.content.split("\n\n") if p.strip()
+            ]
+
+            # One element for the whole body, however long the passage;
+            # revealStaggered animates the paragraph blocks inside it
+            body_html = "".join(
+                '<div class="arc-body arc-stagger-p" style="margin-bottom: 18px;">'
+                f"{PASSAGE_MARKDOWN.render(para)}</div>"
+                for para in paragraphs
+            )
+            ui.html(body_html, sanitize=False).props(f'id="{container_id}"')
+
+            # Render directives (card spreads, etc.)
+            if hasattr(output, "render_directives") and output.render_directives:
+                with ui.column().classes("w-full my-8"):
+                    for directive in output.render_directives:
+                        self.render_directive(directive)
+
+            # Input directives
+            if hasattr(output, "input_directives") and output.input_directives:
+                self.render_input_form(output.input_directives)
+
+            # Choices
+            if output.choices:
+                divider()
+                self.render_choices(output.choices)
+            else:
+                ui.label("✧ THE END ✧").classes("arc-heading").style(
+                    "font-size: 28px; margin-top: 32px; text-align: center;"
+                )
+
+            # Staggered reveal, once the browser has mounted the paragraphs
+            self.commands.reveal(container_id, 180)
 
     # ================================================================
     # DEBUG HELPERS (remove before shipping)
@@ -527,7 +636,8 @@ class GameSession:
         """Jump directly to a passage by ID. For debugging only."""
         if self.engine is None:
             self.load_story()
-        self.engine.goto(passage_id)
+        with self.rng_scope():
+            self.engine.goto(passage_id)
         self.current_screen = "player"
         self.update_ui()
 
@@ -543,18 +653,18 @@ class GameSession:
     def _set_font_size(self, size: str):
         """Switch content text size (small/medium/large)."""
         self.font_size = size
-        ui.run_javascript(
-            f"document.documentElement.setAttribute('data-font-size', '{size}');"
-        )
+        self.commands.set_attribute("data-font-size", size)
+        self.commands.flush()
 
     def make_choice(self, choice_index: int):
         """Handle player choice and update the story."""
-        self.engine.choose(choice_index)
+        with self.rng_scope():
+            self.engine.choose(choice_index)
         self.update_ui()
 
     def render_choices(self, choices: list):
         """Render all choices with theme styling, categorized by tags."""
-        buckets = categorize_choices(choices)
+        buckets = categorize_choices(choices, self.story_meta)
         client_choices = buckets["client"]
         special_choices = buckets["special"]
         meta_choices = buckets["meta"]
@@ -600,14 +710,11 @@ class GameSession:
         client_name = choice["text"]
 
         flavor_text = ""
-        tags = choice.get("tags", [])
-        for tag in tags:
-            if tag.startswith("var:"):
-                var_name = tag.split(":", 1)[1]
-                client_obj = self.engine.state.get(var_name)
-                if client_obj and hasattr(client_obj, "flavor_text"):
-                    flavor_text = client_obj.flavor_text
-                break
+        var_name = self.story_meta.choice(choice).client_var
+        if var_name:
+            client_obj = self.engine.state.get(var_name)
+            if client_obj and hasattr(client_obj, "flavor_text"):
+                flavor_text = client_obj.flavor_text
 
         border_style = (
             f"border: 1px solid {'#0088a0' if is_special else '#8a7235'}40;"
@@ -670,10 +777,11 @@ class GameSession:
             name: widget.value or "" for name, widget in input_widgets.items()
         }
 
-        self.engine.submit_inputs(input_data)
+        with self.rng_scope():
+            self.engine.submit_inputs(input_data)
 
-        current_passage_id = self.engine.current_passage_id
-        self.engine.goto(current_passage_id)
+            current_passage_id = self.engine.current_passage_id
+            self.engine.goto(current_passage_id)
         self.update_ui()
 
     # ================================================================
@@ -703,22 +811,19 @@ class GameSession:
 
         with ui.row().classes("gap-6 w-full justify-center"):
             for card in cards:
-                abs_image_path = None
                 if isinstance(card, dict):
                     card_name = card.get("name", "Unknown Card")
                     is_reversed = card.get("reversed", False)
-                    image_path = None
+                    image_html = None
                 else:
                     card_name = getattr(card, "name", "Unknown Card")
                     is_reversed = getattr(card, "reversed", False)
-                    try:
-                        image_path = card.get_image_filename()
-                        abs_image_path = PROJECT_ROOT / image_path
-                        if not abs_image_path.exists():
-                            image_path = None
-                            abs_image_path = None
-                    except AttributeError:
-                        image_path = None
+                    rotation_style = "transform: rotate(180deg);" if is_reversed else ""
+                    image_html = card_image_html(
+                        card,
+                        "144px",
+                        f"width: 144px; height: auto; object-fit: contain; {rotation_style}",
+                    )
 
                 with (
                     ui.element("div")
@@ -726,13 +831,8 @@ class GameSession:
                     .style("width: 160px; padding: 8px;")
                 ):
                     with ui.column().classes("items-center justify-center gap-2"):
-                        if image_path and abs_image_path and abs_image_path.exists():
-                            rotation_style = (
-                                "transform: rotate(180deg);" if is_reversed else ""
-                            )
-                            ui.image(str(abs_image_path)).style(
-                                f"width: 144px; height: auto; object-fit: contain; {rotation_style}"
-                            )
+                        if image_html:
+                            ui.html(image_html)
                         else:
                             with ui.element("div").style(
                                 "width: 100%; height: 128px; display: flex; "
@@ -775,7 +875,7 @@ class GameSession:
             .classes("relative w-full mx-auto")
             .style(f"height: {container_height}px; max-width: 900px; margin-top: 16px; overflow: hidden;")
         ):
-            for card_data in positioned_cards:
+            for index, card_data in enumerate(positioned_cards):
                 x = card_data["x"]
                 y = card_data["y"]
                 rotation = card_data.get("rotation", 0)
@@ -790,73 +890,37 @@ class GameSession:
                     f"transform: {transform}; "
                     f"z-index: {z_index};"
                 ):
-                    self._render_single_card(card_data, card_width)
+                    self._render_single_card(card_data, card_width, f"p{index}")
 
-    def _render_single_card(self, card_data: dict, width: int):
-        """Render a single card with image, position label, and click handler."""
-        card = card_data["card"]
+    def _render_single_card(self, card_data: Mapping[str, Any], width: int, instance: str = ""):
+        """Render a single card with image, position label, and click handler.
+
+        instance keeps the SVG's gradient IDs apart from other copies of
+        the same card on the page.
+        """
         position_name = card_data["name"]
         rotation = card_data.get("rotation", 0)
-
-        # Try SVG card first (if arcanum style is active)
-        svg_html = None
-        if self.card_style == "arcanum":
-            try:
-                card_code = card._get_code()
-                svg_html = render_svg_card_html(card, card_code)
-            except (AttributeError, Exception):
-                pass
-
-        # Fall back to traditional image
-        abs_image_path = None
-        if svg_html is None:
-            try:
-                image_path = card.get_image_filename()
-                abs_image_path = PROJECT_ROOT / image_path
-                if not abs_image_path.exists():
-                    abs_image_path = None
-            except AttributeError:
-                pass
-
-        # Card height scales with width (tarot proportions ~1:1.73)
-        card_height = int(width * 1.73)
+        # SVG card, image or placeholder, shared across renders and players
+        face = CARD_FRAGMENTS.render(card_data["card"], width, self.card_style, instance)
 
         with ui.column().classes("items-center").style(f"width: {width}px; gap: 8px;"):
             with (
                 ui.element("div")
                 .classes("arc-card")
-                .style(f"width: 100%; {'padding: 0;' if svg_html else 'padding: 8px;'}")
+                .style(f"width: 100%; {'padding: 0;' if face.svg else 'padding: 8px;'}")
                 .on("click", lambda cd=card_data: self._show_card_modal(cd))
             ):
-                if svg_html:
-                    # Render SVG card inline — the frame and illustration
-                    reversal_style = (
-                        "transform: rotate(180deg);" if card.reversed else ""
-                    )
-                    ui.html(svg_html).style(
-                        f"width: 100%; height: {card_height}px; {reversal_style}"
-                    )
-                elif abs_image_path:
-                    rotation_style = (
-                        "transform: rotate(180deg);" if card.reversed else ""
-                    )
-                    ui.image(str(abs_image_path)).style(
-                        f"width: 100%; height: auto; object-fit: contain; {rotation_style}"
-                    )
-                else:
-                    with ui.element("div").style(
-                        "width: 100%; height: 128px; display: flex; "
-                        "align-items: center; justify-content: center;"
-                    ):
-                        ui.html(
-                            '<span style="font-size: 3em; color: var(--gold-dim);">&#10023;</span>'
-                        )
+                ui.html(face.html, sanitize=False).style("width: 100%;")
 
             label_text = f"⟲ {position_name}" if rotation != 0 else position_name
             ui.label(label_text).classes("arc-card-label")
 
-    def _show_card_modal(self, card_data: dict):
-        """Update drawer content and show it with card details."""
+    def _show_card_modal(self, card_data: Mapping[str, Any]):
+        """Update drawer content and show it with card details.
+
+        card_data is an entry from Reading.get_positioned_cards, so its
+        meanings are already resolved and cached on the reading.
+        """
         if self.card_drawer is None:
             return
 
@@ -880,16 +944,12 @@ class GameSession:
 
             # Content
             with ui.column().style("gap: 24px; width: 100%; padding: 24px;"):
-                try:
-                    image_path = card.get_image_filename()
-                    abs_path = PROJECT_ROOT / image_path
-                    if abs_path.exists():
-                        with ui.row().style(
-                            "width: 100%; justify-content: center; margin-bottom: 16px;"
-                        ):
-                            ui.image(str(abs_path)).style("width: 280px; height: auto;")
-                except AttributeError:
-                    pass
+                image_html = card_image_html(card, "280px", "width: 280px; height: auto;")
+                if image_html:
+                    with ui.row().style(
+                        "width: 100%; justify-content: center; margin-bottom: 16px;"
+                    ):
+                        ui.html(image_html)
 
                 ui.label(f"Position: {position_name}").classes("arc-label").style(
                     "font-size: 14px; letter-spacing: 1px;"
@@ -0,0 +1,136 @@
+"""
+StoryCache - Process-wide cache of parsed compiled stories.
+
+Every GameSession used to json.load the full compiled story on "Begin
+Reading" and on every save load, so each player held their own copy of
+every passage. The cache parses each story file once and hands the same
+dict to every BardEngine. Engines only read passages and imports; all
+per-player mutable data lives in engine.state and engine.context.
+
+A cached story is reused while the file's mtime and size are unchanged.
+When they change, the file is re-read and hashed, and it is only
+re-parsed if the content actually differs, so recompiling the story is
+picked up by the next session without restarting the server.
+
+Story packs (see story_pack.py) are detected by their magic bytes and
+memory-mapped instead of parsed; their passages decode on first visit.
+
+Loading a story also classifies its passages for presentation (see
+story_meta.py).
+"""
+
+import hashlib
+import json
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+from story_meta import StoryMeta
+from story_pack import STORY_PACK_SUFFIX, StoryPack, is_story_pack
+
+
+@dataclass
+class CachedStory:
+    """A parsed story and the file fingerprint it was parsed from."""
+
+    data: dict[str, Any]  # Shared by every session: treat as read-only
+    mtime_ns: int
+    size: int
+    sha256: str  # Of the story JSON (for a pack, the JSON it was built from)
+    meta: StoryMeta
+    pack: Optional[StoryPack] = None
+
+    def passage_ids(self) -> list[str]:
+        """Sorted passage ids (from the index alone for a pack)."""
+        if self.pack is not None:
+            return self.pack.passage_ids()
+        return sorted(self.data["passages"])
+
+
+class StoryCache:
+    """Parsed compiled stories, keyed by resolved file path."""
+
+    def __init__(self):
+        self._stories: dict[Path, CachedStory] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, story_path: str | Path) -> dict[str, Any]:
+        """Return the parsed story at story_path, parsing it only if it changed.
+
+        Accepts a compiled story JSON or a story pack. The returned dict is
+        shared between sessions and must not be modified.
+
+        Raises:
+            OSError: If the file can't be read
+            ValueError: If the file isn't valid JSON or a readable story pack
+        """
+        return self._entry(story_path).data
+
+    def passage_ids(self, story_path: str | Path) -> list[str]:
+        """Sorted passage ids of a story, loading it if needed."""
+        return self._entry(story_path).passage_ids()
+
+    def meta(self, story_path: str | Path) -> StoryMeta:
+        """Presentation metadata of a story, loading it if needed."""
+        return self._entry(story_path).meta
+
+    def _entry(self, story_path: str | Path) -> CachedStory:
+        path = Path(story_path).resolve()
+        stat = path.stat()
+
+        with self._lock:
+            cached = self._stories.get(path)
+            if cached and (cached.mtime_ns, cached.size) == (stat.st_mtime_ns, stat.st_size):
+                self.hits += 1
+                return cached
+
+            if is_story_pack(path):
+                pack = StoryPack(path)
+                digest = pack.source_sha256
+            else:
+                pack = None
+                raw = path.read_bytes()
+                digest = hashlib.sha256(raw).hexdigest()
+
+            if cached and cached.sha256 == digest:
+                # Touched but not changed (e.g. recompiled to identical output)
+                cached.mtime_ns, cached.size = stat.st_mtime_ns, stat.st_size
+                self.hits += 1
+                return cached
+
+            data = pack.story_data() if pack else json.loads(raw)
+            meta = StoryMeta(data["passages"])
+            entry = CachedStory(data, stat.st_mtime_ns, stat.st_size, digest, meta, pack)
+            self._stories[path] = entry
+            self.misses += 1
+            if cached:
+                print(f"Story changed on disk, reloaded: {path.name}")
+            return entry
+
+    def clear(self) -> None:
+        """Drop every cached story (the next get() re-parses)."""
+        with self._lock:
+            self._stories.clear()
+
+
+def story_file(story_dir: str | Path, story_id: str) -> Path:
+    """The compiled story file to load for a story id.
+
+    Prefers the story pack when it is at least as new as the JSON (a pack
+    left over from an older compile is ignored), otherwise the JSON.
+    """
+    story_dir = Path(story_dir)
+    json_path = story_dir / f"{story_id}.json"
+    pack_path = story_dir / f"{story_id}{STORY_PACK_SUFFIX}"
+    if pack_path.exists() and (
+        not json_path.exists() or pack_path.stat().st_mtime >= json_path.stat().st_mtime
+    ):
+        return pack_path
+    return json_path
+
+
+# Shared by every client in this server process
+STORY_CACHE = StoryCache()
@@ -0,0 +1,133 @@
+"""
+StoryMeta - Per-passage presentation metadata, shared by every session.
+
+show_player used to work out how to present a passage from its tags on
+every render (a chain of membership tests for DREAM:*, THEME:* and
+UI:DASHBOARD), and categorize_choices re-scanned every choice's tags for
+CLIENT/SPECIAL/META and var: client bindings. None of that depends on the
+player, so StoryCache classifies each story once and keeps the table next
+to the parsed story; render code only does lookups.
+
+A JSON story is classified in full when it loads. A story pack decodes
+passages only as they are visited, so its passages are classified on
+first lookup (just after the engine decoded them) and kept from then on.
+"""
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from typing import Optional
+
+# Passage tag -> theme it switches to; the first tag present, in this
+# order, wins. Passages with none of these keep the current theme.
+THEME_TAGS = (
+    ("DREAM:CYBERPUNK", "cyberpunk"),
+    ("DREAM:NYX", "cyberpunk"),
+    ("DREAM:GOTHIC", "gothic"),
+    ("DREAM:MANOR", "gothic"),
+    ("DREAM:KIND", "kind"),
+    ("DREAM:BOOKSHOP", "kind"),
+    ("DREAM:WEIRDWEST", "weird_west"),
+    ("THEME:DEFAULT", "default"),
+    ("UI:DASHBOARD", "default"),
+)
+DASHBOARD_TAG = "UI:DASHBOARD"
+
+
+@dataclass(frozen=True, slots=True)
+class PassageMeta:
+    """How to present one passage."""
+
+    theme: Optional[str] = None  # Theme the passage switches to (None: keep current)
+    dashboard: bool = False  # Shown as the Reader's Desk instead of the player
+
+
+@dataclass(frozen=True, slots=True)
+class ChoiceMeta:
+    """How to present one choice, from its tags."""
+
+    category: str  # categorize_choices bucket: client, special, meta or regular
+    client_var: Optional[str] = None  # State variable named by the first var: tag
+
+
+# Shared instances: most passages have no presentation tags, and the rest
+# use a handful of combinations, so table entries are just references
+_PASSAGE_METAS: dict[tuple[Optional[str], bool], PassageMeta] = {}
+PLAIN_PASSAGE = _PASSAGE_METAS.setdefault((None, False), PassageMeta())
+REGULAR_CHOICE = ChoiceMeta("regular")
+
+
+def passage_meta(tags: Iterable[str]) -> PassageMeta:
+    """Classify a passage by its tags."""
+    tags = set(tags)
+    theme = next((theme for tag, theme in THEME_TAGS if tag in tags), None)
+    key = (theme, DASHBOARD_TAG in tags)
+    meta = _PASSAGE_METAS.get(key)
+    if meta is None:
+        meta = _PASSAGE_METAS.setdefault(key, PassageMeta(*key))
+    return meta
+
+
+def choice_meta(tags: Iterable[str]) -> ChoiceMeta:
+    """Classify a choice by its tags."""
+    tags = list(tags)
+    has_client = any(tag.startswith("CLIENT") for tag in tags)
+    is_special = any("SPECIAL" in tag for tag in tags)
+    is_meta = any(tag.startswith("META") for tag in tags)
+    client_var = next((tag.split(":", 1)[1] for tag in tags if tag.startswith("var:")), None)
+
+    if has_client and is_special:
+        category = "special"
+    elif has_client:
+        category = "client"
+    elif is_meta:
+        category = "meta"
+    else:
+        category = "regular"
+    if category == "regular" and client_var is None:
+        return REGULAR_CHOICE
+    return ChoiceMeta(category, client_var)
+
+
+class StoryMeta:
+    """Presentation metadata for one story's passages and choices."""
+
+    def __init__(self, passages: Mapping[str, dict]):
+        """Classify a story's passages (all at once for a parsed JSON story).
+
+        Args:
+            passages: The shared story's passages; kept for lazy lookups
+        """
+        self._source = passages
+        self._passages: dict[str, PassageMeta] = {}
+        # Keyed by tag tuple: the engine hands out copies of choice dicts,
+        # and a story only uses a few distinct tag combinations
+        self._choices: dict[tuple[str, ...], ChoiceMeta] = {(): REGULAR_CHOICE}
+
+        if isinstance(passages, dict):
+            for passage_id, passage in passages.items():
+                self._classify(passage_id, passage)
+
+    def _classify(self, passage_id: str, passage: dict) -> PassageMeta:
+        meta = self._passages[passage_id] = passage_meta(passage.get("tags", ()))
+        for choice in passage.get("choices", ()):
+            self.choice(choice)
+        return meta
+
+    def passage(self, passage_id: str) -> PassageMeta:
+        """Presentation metadata for a passage (PLAIN_PASSAGE if unknown)."""
+        meta = self._passages.get(passage_id)
+        if meta is None:
+            passage = self._source.get(passage_id)
+            if passage is None:
+                return PLAIN_PASSAGE
+            meta = self._classify(passage_id, passage)
+        return meta
+
+    def choice(self, choice: Mapping) -> ChoiceMeta:
+        """Presentation metadata for a choice dict (passage or rendered)."""
+        tags = tuple(choice.get("tags", ()))
+        meta = self._choices.get(tags)
+        if meta is None:
+            # Choices from @if/@for blocks are first seen when rendered
+            meta = self._choices[tags] = choice_meta(tags)
+        return meta
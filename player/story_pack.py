@@ -0,0 +1,194 @@
+"""
+Story packs - Binary compiled stories with lazily decoded passages.
+
+A compiled story JSON has to be parsed in full (about a quarter of a
+second for Arcanum) before the first page can render. A story pack holds
+the same data with a passage index up front, so the player can
+memory-map it, list passage ids straight from the index, and decode each
+passage only when it is first visited.
+
+Build one next to the compiled JSON with:
+    python player/story_pack.py compiled_stories/arcanum.json
+
+GameSession.load_story (via StoryCache) accepts either format; see
+story_file() for which one the player picks.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+from collections.abc import Iterator, Mapping
+from pathlib import Path
+from typing import Any
+
+STORY_PACK_SUFFIX = ".story"
+
+# Pack layout (little-endian):
+#   header   magic, version, SHA-256 of the source JSON, head length,
+#            passage count
+#   head     the story's JSON minus its passages (version, initial_passage,
+#            metadata, imports)
+#   index    one record per passage, sorted by id:
+#            id (offset, length), body (offset, length)
+#   ids      UTF-8 passage ids; offsets are relative to its start
+#   bodies   one compact JSON object per passage; offsets are relative to
+#            its start
+STORY_PACK_MAGIC = b"ARCSTORY"
+STORY_PACK_VERSION = 1
+STORY_PACK_HEADER = struct.Struct("<8sI32sII")
+STORY_PACK_ENTRY = struct.Struct("<IIII")
+
+
+def is_story_pack(path: str | Path) -> bool:
+    """Whether a file starts with the story pack magic."""
+    with open(path, "rb") as f:
+        return f.read(len(STORY_PACK_MAGIC)) == STORY_PACK_MAGIC
+
+
+def build_story_pack(source: str | Path, dest: str | Path | None = None) -> Path:
+    """Compile a story JSON (from `bardic compile`) into a story pack.
+
+    Args:
+        source: Compiled story JSON
+        dest: Where to write the pack (default: source with a .story suffix)
+
+    Returns:
+        Path of the written pack
+    """
+    source = Path(source)
+    dest = Path(dest) if dest else source.with_suffix(STORY_PACK_SUFFIX)
+
+    raw = source.read_bytes()
+    story = json.loads(raw)
+    passages = story.pop("passages")
+    head = json.dumps(story, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    ids = bytearray()
+    bodies = bytearray()
+    entries = []
+    for passage_id in sorted(passages):
+        id_bytes = passage_id.encode("utf-8")
+        body = json.dumps(
+            passages[passage_id], ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8")
+        entries.append((len(ids), len(id_bytes), len(bodies), len(body)))
+        ids.extend(id_bytes)
+        bodies.extend(body)
+
+    # Write next to the destination and swap in, so a running server that
+    # has the old pack mapped never sees a half-written file
+    tmp = dest.with_name(f"{dest.name}.{os.getpid()}.tmp")
+    with open(tmp, "wb") as f:
+        f.write(
+            STORY_PACK_HEADER.pack(
+                STORY_PACK_MAGIC,
+                STORY_PACK_VERSION,
+                hashlib.sha256(raw).digest(),
+                len(head),
+                len(entries),
+            )
+        )
+        f.write(head)
+        for entry in entries:
+            f.write(STORY_PACK_ENTRY.pack(*entry))
+        f.write(ids)
+        f.write(bodies)
+    os.replace(tmp, dest)
+    return dest
+
+
+class LazyPassages(Mapping):
+    """Passage id -> passage dict, decoded from the pack on first access.
+
+    Stands in for the compiled story's "passages" dict. Membership, len()
+    and iteration only use the index. Decoded passages are kept, and like
+    the JSON story they are shared by every engine and must not be modified.
+    """
+
+    def __init__(self, mm: mmap.mmap, index: dict[str, tuple[int, int]]) -> None:
+        self._mm = mm
+        self._index = index
+        self._decoded: dict[str, dict] = {}
+
+    def __getitem__(self, passage_id: str) -> dict:
+        passage = self._decoded.get(passage_id)
+        if passage is None:
+            start, length = self._index[passage_id]
+            passage = self._decoded[passage_id] = json.loads(self._mm[start : start + length])
+        return passage
+
+    def __contains__(self, passage_id: object) -> bool:
+        return passage_id in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    @property
+    def decoded_count(self) -> int:
+        """How many passages have been decoded so far."""
+        return len(self._decoded)
+
+
+class StoryPack:
+    """A memory-mapped story pack."""
+
+    def __init__(self, path: str | Path) -> None:
+        """Map the pack and read its header, head and passage index.
+
+        Raises:
+            ValueError: If the file is not a story pack of this version
+        """
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, source_hash, head_len, count = STORY_PACK_HEADER.unpack_from(self._mm, 0)
+        if magic != STORY_PACK_MAGIC or version != STORY_PACK_VERSION:
+            self._mm.close()
+            raise ValueError(f"Not a version {STORY_PACK_VERSION} story pack: {self.path}")
+
+        # Hash of the JSON it was built from: identifies the content without
+        # reading the whole pack
+        self.source_sha256 = source_hash.hex()
+
+        head_start = STORY_PACK_HEADER.size
+        self.head: dict[str, Any] = json.loads(self._mm[head_start : head_start + head_len])
+
+        index_start = head_start + head_len
+        ids_start = index_start + count * STORY_PACK_ENTRY.size
+        entries = [
+            STORY_PACK_ENTRY.unpack_from(self._mm, index_start + i * STORY_PACK_ENTRY.size)
+            for i in range(count)
+        ]
+        bodies_start = ids_start + sum(id_len for _, id_len, _, _ in entries)
+
+        index: dict[str, tuple[int, int]] = {}
+        for id_offset, id_len, body_offset, body_len in entries:
+            start = ids_start + id_offset
+            passage_id = self._mm[start : start + id_len].decode("utf-8")
+            index[passage_id] = (bodies_start + body_offset, body_len)
+
+        self.passages = LazyPassages(self._mm, index)
+
+    def passage_ids(self) -> list[str]:
+        """Every passage id, sorted, without decoding any passage."""
+        return list(self.passages)
+
+    def story_data(self) -> dict[str, Any]:
+        """The story in the shape BardEngine expects, with lazy passages."""
+        return {**self.head, "passages": self.passages}
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python player/story_pack.py <compiled story .json> [output .story]")
+        sys.exit(1)
+    dest = build_story_pack(sys.argv[1], sys.argv[2] if len(sys.argv) > 2 else None)
+    pack = StoryPack(dest)
+    print(f"Wrote {len(pack.passages)} passages to {dest} ({dest.stat().st_size:,} bytes)")